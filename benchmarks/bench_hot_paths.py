@@ -0,0 +1,237 @@
+# Times the bot's hot paths offline against the fakes in benchmarks/fakes.py.
+#
+#   python benchmarks/bench_hot_paths.py [--scales 1000,10000,100000] [--tolerance 1.0] [--update-baseline]
+#
+# Each case is run at every scale (statuses on the board and stored suggestions; the voted-on
+# suggestion always has VOTERS voters) and reports:
+#   us/call    mean latency per call, best of REPEATS runs
+#   peak KiB   largest tracemalloc peak of a single call
+#   rest/op    REST calls made inside the call plus coalesced refreshes it leaves pending
+# Results are compared with benchmarks/baseline.json and the run exits non-zero when a case is
+# slower or allocates more than `tolerance` allows, or makes more REST calls at all.
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import main  # noqa: E402
+import fakes  # noqa: E402
+
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+VOTERS = 10_000
+REPEATS = 5
+TARGET_SECONDS = 0.2  # Rough time budget per repeat
+MAX_ITERATIONS = 2000
+ALLOC_SAMPLES = 5
+STAFF_ROLE = fakes.FakeRole(main.STAFF_ROLE_IDS[0])
+TOPIC_WORDS = "music bot channel emote game night event role voice server art contest movie karaoke poll giveaway meme stream trivia quiz".split()
+
+class World:
+    # Fresh bot state at one scale, wired to fake channels and members
+    def __init__(self, scale):
+        main.state_store = main.StateStore()
+        main.user_statuses.clear()
+        main.suggestions.clear()
+        main.suggestion_indexes.clear()
+        main.suggestion_counter = 0
+        main.status_embed_message_ids.clear()
+        main.status_embed_messages.clear()
+        main.status_embed_rendered.clear()
+        main.display_names = main.DisplayNameCache()
+        main.suggestion_renders = main.RenderCache()
+        main.suggestion_search.clear()
+        main.top_suggestions.clear()
+        main.trending_suggestions = main.TrendingRanking()
+        # Deletes queued by the previous scale would otherwise fire in the middle of this one
+        if main.deletion_service._task is not None:
+            main.deletion_service._task.cancel()
+        main.deletion_service = main.DeletionService(main.rest_scheduler)
+
+        self.scale = scale
+        self.guild = fakes.FakeGuild()
+        self.channels = {
+            channel_id: fakes.FakeChannel(channel_id, self.guild)
+            for channel_id in (main.STATUS_CHANNEL_ID, main.SUGGESTION_CHANNEL_ID, main.SUGGESTION_LOG_CHANNEL_ID)
+        }
+        self.command_channel = fakes.FakeChannel(1, self.guild)
+        main.bot.get_channel = self.channels.get
+        main.bot.get_user = self.guild.members.get
+
+        now = int(time.time())
+        self.members = [fakes.FakeMember(100_000 + i, self.guild) for i in range(scale)]
+        for i, member in enumerate(self.members):
+            main.user_statuses[member.id] = main.StatusRecord(member.id, main.STATUS_KINDS[i % 6], now - i)
+        self.staff = fakes.FakeMember(99, self.guild, roles=(STAFF_ROLE,))
+        self.voters = [fakes.FakeMember(10_000_000 + i, self.guild) for i in range(1000)]
+
+    async def add_suggestions(self):
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for i in range(self.scale):
+            author = self.members[i % len(self.members)]
+            await main.save_suggestion_in_memory({
+                'author': author,
+                'author_id': author.id,
+                'author_name': author.display_name,
+                'suggestion_text': suggestion_text(i),
+                'timestamp': timestamp,
+                'status': 'Pending',
+                'message_id': 900_000_000 + i,
+                'votes': main.VoteLedger(),
+            })
+        self.voted_index = 1
+        main.suggestions[self.voted_index]['votes'] = main.VoteLedger(upvoters=range(20_000_000, 20_000_000 + VOTERS))
+
+def suggestion_text(i):
+    words = len(TOPIC_WORDS)
+    return f"Add a {TOPIC_WORDS[i % words]} {TOPIC_WORDS[i // words % words]} {TOPIC_WORDS[i // words ** 2 % words]} channel, suggestion {i}"
+
+def pending_refreshes():
+    return len(main.status_board_refresher.pending) + len(main.suggestion_message_refresher.pending)
+
+def clear_pending_refreshes():
+    main.status_board_refresher.pending.clear()
+    main.suggestion_message_refresher.pending.clear()
+
+async def measure(op, capacity):
+    # `op(i)` runs the i-th call; `capacity` caps the total calls for cases that use up state
+    calls = 0
+
+    async def run(count):
+        nonlocal calls
+        started = time.perf_counter()
+        for _ in range(count):
+            await op(calls)
+            calls += 1
+        return time.perf_counter() - started
+
+    clear_pending_refreshes()
+    rest_before = sum(fakes.rest_calls.values())
+    iterations = max(1, min(MAX_ITERATIONS, int(TARGET_SECONDS / max(await run(1), 1e-6))))
+    iterations = max(1, min(iterations, (capacity - 1 - ALLOC_SAMPLES) // REPEATS))
+    best = min([await run(iterations) for _ in range(REPEATS)])
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(ALLOC_SAMPLES):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await op(calls)
+        calls += 1
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    rest = sum(fakes.rest_calls.values()) - rest_before + pending_refreshes()
+    clear_pending_refreshes()
+    return {
+        'us_per_call': best / iterations * 1e6,
+        'peak_alloc_bytes': peak,
+        'rest_per_op': rest / calls,
+    }
+
+async def run_scale(scale):
+    world = World(scale)
+    await world.add_suggestions()
+    results = {}
+
+    # A board refresh after one member's status changed, the way the refresher runs it: every page
+    # is rendered and compared, and only the page holding that member is edited
+    await main.update_status_embed()
+    async def status_board(i):
+        member = world.members[i % scale]
+        main.user_statuses[member.id] = main.StatusRecord(member.id, main.STATUS_KINDS[i % 6], int(time.time()))
+        main.data_versions['statuses'] += 1
+        await main.update_status_embed()
+    results['update_status_embed'] = await measure(status_board, float('inf'))
+
+    voted = {**main.suggestions[world.voted_index], 'index': world.voted_index}
+    async def suggestion_embed(i):
+        main.create_suggestion_embed(voted)
+    results['create_suggestion_embed'] = await measure(suggestion_embed, float('inf'))
+
+    async def search(i):
+        main.suggestion_search.search(f"{TOPIC_WORDS[i % len(TOPIC_WORDS)]} karaoke night")
+    results['suggestion_search'] = await measure(search, float('inf'))
+
+    async def near_duplicates(i):
+        main.suggestion_search.near_duplicates(suggestion_text(i % scale))
+    results['near_duplicates'] = await measure(near_duplicates, float('inf'))
+
+    async def vote(i):
+        voter = world.voters[i % len(world.voters)]
+        await main.handle_vote(fakes.FakeInteraction(voter, world.guild), world.voted_index, 'upvote')
+    results['handle_vote'] = await measure(vote, float('inf'))
+
+    async def top(i):
+        main.top_suggestions.top(10)
+    results['top_suggestions'] = await measure(top, float('inf'))
+
+    async def trending(i):
+        main.trending_suggestions.top(10)
+    results['trending'] = await measure(trending, float('inf'))
+
+    async def status_command(i):
+        ctx = fakes.FakeContext(world.members[i % scale], world.command_channel)
+        await main.process_status_command(ctx, main.STATUS_KINDS[i % 6], "Benchmark status.")
+    results['process_status_command'] = await measure(status_command, float('inf'))
+
+    # Every call approves a different pending suggestion, so the case is capped at `scale` calls
+    async def suggestion_action(i):
+        ctx = fakes.FakeContext(world.staff, world.command_channel)
+        await main.handle_suggestion_action_by_message_id(ctx, 900_000_000 + i, 'Approved')
+    results['handle_suggestion_action_by_message_id'] = await measure(suggestion_action, scale)
+
+    return {f"{case}@{scale}": result for case, result in results.items()}
+
+def compare(results, baseline, tolerance):
+    failures = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        if result['us_per_call'] > expected['us_per_call'] * (1 + tolerance):
+            failures.append(f"{key}: {result['us_per_call']:.1f} us/call vs baseline {expected['us_per_call']:.1f}")
+        if result['peak_alloc_bytes'] > expected['peak_alloc_bytes'] * (1 + tolerance) + 1024:
+            failures.append(f"{key}: {result['peak_alloc_bytes']} peak bytes vs baseline {expected['peak_alloc_bytes']}")
+        if result['rest_per_op'] > expected['rest_per_op'] + 0.01:
+            failures.append(f"{key}: {result['rest_per_op']:.2f} REST calls/op vs baseline {expected['rest_per_op']:.2f}")
+    return failures
+
+async def run(args):
+    results = {}
+    for scale in args.scales:
+        results.update(await run_scale(scale))
+
+    print(f"{'case':<50} {'us/call':>10} {'peak KiB':>10} {'rest/op':>8}")
+    for key, result in results.items():
+        print(f"{key:<50} {result['us_per_call']:>10.1f} {result['peak_alloc_bytes'] / 1024:>10.1f} {result['rest_per_op']:>8.2f}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({key: {field: round(value, 3) for field, value in result.items()} for key, result in results.items()}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+    with open(args.baseline) as f:
+        failures = compare(results, json.load(f), args.tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the bot's hot paths.")
+    parser.add_argument('--scales', default='1000,10000,100000', type=lambda value: [int(scale) for scale in value.split(',')])
+    parser.add_argument('--tolerance', default=1.0, type=float, help="allowed slowdown and allocation growth, as a fraction")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true')
+    sys.exit(asyncio.run(run(parser.parse_args())))
@@ -0,0 +1,63 @@
+# Measures SQLiteStore write-behind throughput and cold-start load time.
+#
+#   python benchmarks/bench_sqlite_store.py [suggestion_count]
+#
+# Writes are queued the same way the bot queues them (one save per suggestion plus votes),
+# flushed in batches on the worker thread, then the database is reopened and loaded in bulk.
+import asyncio
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+VOTES_PER_SUGGESTION = 5
+
+async def run(count):
+    path = os.path.join(tempfile.mkdtemp(), 'bench_state.db')
+    store = main.SQLiteStore(path)
+    store.start()
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+    started = time.perf_counter()
+    for idx in range(1, count + 1):
+        store.save_suggestion(idx, {
+            'author_id': 100000 + idx % 5000,
+            'author_name': f"user{idx % 5000}",
+            'suggestion_text': f"Suggestion number {idx} for the server",
+            'timestamp': now,
+            'status': 'Pending',
+            'message_id': 900000000 + idx,
+        })
+        for voter in random.sample(range(10000), VOTES_PER_SUGGESTION):
+            store.save_vote(idx, voter, 'upvote' if voter % 3 else 'downvote')
+        if idx % 1000 == 0:
+            # Yield like the event loop would between commands so the flusher can run
+            await asyncio.sleep(0)
+    store.set_meta('suggestion_counter', count)
+    queued_seconds = time.perf_counter() - started
+    await store.close()
+    total_seconds = time.perf_counter() - started
+    writes = store.writes_queued
+
+    print(f"suggestions:            {count}")
+    print(f"writes queued:          {writes}")
+    print(f"enqueue rate:           {writes / queued_seconds:,.0f} writes/s (time on the event loop)")
+    print(f"durable rate:           {writes / total_seconds:,.0f} writes/s (including final flush)")
+    print(f"flushes:                {store.flushes} ({store.flush_seconds:.2f}s on the worker thread)")
+    print(f"database size:          {os.path.getsize(path) / 1e6:.1f} MB")
+
+    main.state_store = main.SQLiteStore(path)
+    started = time.perf_counter()
+    await main.load_state_from_store()
+    load_seconds = time.perf_counter() - started
+    await main.state_store.close()
+    print(f"cold start load:        {load_seconds:.2f}s for {len(main.suggestions)} suggestions")
+
+if __name__ == '__main__':
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
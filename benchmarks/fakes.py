@@ -0,0 +1,108 @@
+# Lightweight stand-ins for the discord.py objects the bot's hot paths touch. Nothing here
+# talks to Discord; every method that would be a REST call bumps `rest_calls` instead.
+import asyncio
+import itertools
+from collections import Counter
+
+rest_calls = Counter()  # {kind: count}
+_message_ids = itertools.count(10**18)
+
+async def _rest(kind):
+    rest_calls[kind] += 1
+    await asyncio.sleep(0)
+
+class FakeRole:
+    def __init__(self, role_id):
+        self.id = role_id
+
+class FakePermissions:
+    def __init__(self, administrator=False):
+        self.administrator = administrator
+
+class FakeGuild:
+    def __init__(self, guild_id=1):
+        self.id = guild_id
+        self.members = {}
+        self.roles = {}
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+    def get_role(self, role_id):
+        return self.roles.get(role_id)
+
+class FakeMember:
+    # Slotted so 100k of them stay cheap
+    __slots__ = ('id', 'name', 'display_name', 'mention', 'bot', 'guild', 'roles', 'guild_permissions')
+
+    def __init__(self, user_id, guild, roles=(), administrator=False):
+        self.id = user_id
+        self.name = f"member{user_id}"
+        self.display_name = f"Member {user_id}"
+        self.mention = f"<@{user_id}>"
+        self.bot = False
+        self.guild = guild
+        self.roles = roles
+        self.guild_permissions = FakePermissions(administrator)
+        guild.members[user_id] = self
+
+    async def send(self, *args, **kwargs):
+        await _rest('dm')
+        return FakeMessage(self, next(_message_ids))
+
+class FakeMessage:
+    def __init__(self, channel, message_id, author=None):
+        self.channel = channel
+        self.id = message_id
+        self.author = author
+        self.guild = getattr(channel, 'guild', None)
+
+    async def edit(self, **kwargs):
+        await _rest('edit')
+        return self
+
+    async def delete(self, **kwargs):
+        await _rest('delete')
+
+class FakeChannel:
+    def __init__(self, channel_id, guild):
+        self.id = channel_id
+        self.guild = guild
+
+    async def send(self, *args, **kwargs):
+        await _rest('send')
+        return FakeMessage(self, next(_message_ids))
+
+    def get_partial_message(self, message_id):
+        return FakeMessage(self, message_id)
+
+    async def delete_messages(self, messages):
+        await _rest('bulk_delete')
+
+class FakeContext:
+    def __init__(self, author, channel):
+        self.author = author
+        self.guild = channel.guild
+        self.channel = channel
+        self.message = FakeMessage(channel, next(_message_ids), author)
+
+    async def send(self, *args, **kwargs):
+        return await self.channel.send(*args, **kwargs)
+
+class FakeInteractionResponse:
+    async def defer(self, **kwargs):
+        await _rest('defer')
+
+    async def send_message(self, *args, **kwargs):
+        await _rest('interaction_response')
+
+class FakeFollowup:
+    async def send(self, *args, **kwargs):
+        await _rest('followup')
+
+class FakeInteraction:
+    def __init__(self, user, guild):
+        self.user = user
+        self.guild = guild
+        self.response = FakeInteractionResponse()
+        self.followup = FakeFollowup()
@@ -0,0 +1,451 @@
+# End-to-end load generator: runs the real `bot` from main.py against an in-process stand-in
+# for the Discord REST API and gateway, then replays synthetic traffic through the gateway.
+#
+#   python benchmarks/loadgen.py [--scenario status-storm|vote-storm|mention-storm|all]
+#                                [--ops 100] [--rate 0] [--members 2000] [--rate-limit 5/5] [--quiet 10]
+#
+# Scenarios:
+#   status-storm   --ops status commands from distinct members, timed until each reply is posted
+#   vote-storm     --ops button clicks on one suggestion, timed until each ephemeral followup
+#   mention-storm  --ops messages mentioning members with statuses, timed until each reply
+#                  (mentions inside the cooldown get no reply and are reported as suppressed)
+#
+# --rate is events per second (0 fires them all at once). After the storm the harness keeps
+# counting until no REST call has been made for --quiet seconds (or --timeout passes), so
+# coalesced board/suggestion edits and timed deletes are included. The fake API enforces a
+# fixed-window limit per route bucket (--rate-limit requests/seconds, Discord's default for
+# channel messages is 5/5), sends the usual X-RateLimit headers and answers overflow with 429s,
+# which are reported per route.
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+import yarl
+from aiohttp import web, WSMsgType
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+os.environ['STORAGE_BACKEND'] = 'memory'
+
+import discord  # noqa: E402
+import main  # noqa: E402
+
+DISCORD_EPOCH_MS = 1420070400000
+GUILD_ID = 4242
+COMMAND_CHANNEL_ID = 5151
+BOT_USER_ID = 7777
+EXEMPT_ROUTES = ('/interactions/', '/webhooks/')  # Discord doesn't bucket interaction responses
+
+_snowflake_sequence = itertools.count()
+
+def snowflake():
+    return ((int(time.time() * 1000) - DISCORD_EPOCH_MS) << 22) | (next(_snowflake_sequence) & 0x3FFFFF)
+
+def iso_now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+def json_response(data, status=200, headers=None):
+    # discord.py only decodes bodies whose Content-Type is exactly application/json
+    return web.Response(body=json.dumps(data).encode(), status=status, headers={**(headers or {}), 'Content-Type': 'application/json'})
+
+def user_payload(user_id, bot=False):
+    return {'id': str(user_id), 'username': f"user{user_id}", 'global_name': f"User {user_id}", 'discriminator': '0', 'avatar': None, 'bot': bot}
+
+def member_payload(user_id, roles=()):
+    return {'user': user_payload(user_id), 'roles': [str(role) for role in roles], 'joined_at': iso_now(), 'deaf': False, 'mute': False, 'flags': 0}
+
+class FakeDiscord:
+    # The REST API and gateway in one aiohttp app. REST calls are recorded per route and every
+    # message the bot posts is kept, so scenarios can click the buttons on it.
+    def __init__(self, member_ids, rate_limit, window):
+        self.member_ids = member_ids
+        self.rate_limit = rate_limit
+        self.window = window
+        self.messages = {}  # {message_id: payload}
+        self.calls = Counter()
+        self.rate_limited = Counter()
+        self._buckets = {}  # {bucket: [window start, requests]}
+        self._sequence = itertools.count(1)
+        self._gateway = None
+        self.listeners = []  # Called with (route, match_info, payload) for calls scenarios correlate on
+
+        self.app = web.Application(middlewares=[self._rate_limit_middleware])
+        self.app.add_routes([
+            web.get('/gateway', self.gateway),
+            web.get('/api/v10/users/@me', self.get_me),
+            web.get('/api/v10/oauth2/applications/@me', self.get_application),
+            web.post('/api/v10/users/@me/channels', self.create_dm),
+            web.get('/api/v10/channels/{channel_id}/messages', self.get_history),
+            web.post('/api/v10/channels/{channel_id}/messages', self.create_message),
+            web.post('/api/v10/channels/{channel_id}/messages/bulk-delete', self.bulk_delete),
+            web.patch('/api/v10/channels/{channel_id}/messages/{message_id}', self.edit_message),
+            web.delete('/api/v10/channels/{channel_id}/messages/{message_id}', self.delete_message),
+            web.post('/api/v10/interactions/{interaction_id}/{token}/callback', self.interaction_callback),
+            web.post('/api/v10/webhooks/{application_id}/{token}', self.followup),
+        ])
+
+    # --- REST ---
+    @staticmethod
+    def route_of(request):
+        # Route label with the snowflakes folded away, e.g. "PATCH /channels/{channel_id}/messages/{message_id}"
+        resource = request.match_info.route.resource
+        path = resource.canonical if resource is not None else request.path
+        return f"{request.method} {path.removeprefix('/api/v10')}"
+
+    @web.middleware
+    async def _rate_limit_middleware(self, request, handler):
+        if request.path == '/gateway':
+            return await handler(request)
+        route = self.route_of(request)
+        self.calls[route] += 1
+        bucket = f"{route}:{request.match_info.get('channel_id', '')}"
+        now = time.monotonic()
+        state = self._buckets.get(bucket)
+        if state is None or now - state[0] >= self.window:
+            state = self._buckets[bucket] = [now, 0]
+        reset_after = self.window - (now - state[0])
+        headers = {
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}",
+            'X-RateLimit-Reset': f"{time.time() + reset_after:.3f}",
+            'X-RateLimit-Bucket': bucket,
+        }
+        if not any(part in request.path for part in EXEMPT_ROUTES):
+            if state[1] >= self.rate_limit:
+                self.rate_limited[route] += 1
+                headers['X-RateLimit-Remaining'] = '0'
+                headers['Retry-After'] = f"{reset_after:.3f}"
+                return json_response({'message': 'You are being rate limited.', 'retry_after': reset_after, 'global': False}, status=429, headers=headers)
+            state[1] += 1
+            headers['X-RateLimit-Remaining'] = str(self.rate_limit - state[1])
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def _payload(self, request):
+        if request.content_type == 'multipart/form-data':
+            form = await request.post()
+            return json.loads(form.get('payload_json') or '{}')
+        if request.can_read_body:
+            return await request.json()
+        return {}
+
+    def _notify(self, request, payload):
+        route = self.route_of(request)
+        for listener in self.listeners:
+            listener(route, request.match_info, payload)
+
+    def message_payload(self, channel_id, payload, message_id=None):
+        message = {
+            'id': str(message_id or snowflake()), 'channel_id': str(channel_id), 'author': user_payload(BOT_USER_ID, bot=True),
+            'content': payload.get('content') or '', 'timestamp': iso_now(), 'edited_timestamp': None, 'tts': False,
+            'mention_everyone': False, 'mentions': [], 'mention_roles': [], 'attachments': [], 'embeds': payload.get('embeds') or [],
+            'components': payload.get('components') or [], 'pinned': False, 'type': 0, 'flags': 0,
+        }
+        if payload.get('message_reference'):
+            message['message_reference'] = payload['message_reference']
+        return message
+
+    async def get_me(self, request):
+        return json_response(user_payload(BOT_USER_ID, bot=True))
+
+    async def get_application(self, request):
+        return json_response({
+            'id': str(BOT_USER_ID), 'name': 'loadgen', 'description': '', 'icon': None, 'bot_public': False,
+            'bot_require_code_grant': False, 'owner': user_payload(1), 'verify_key': '', 'flags': 0,
+        })
+
+    async def create_dm(self, request):
+        payload = await request.json()
+        return json_response({'id': str(snowflake()), 'type': 1, 'recipients': [user_payload(int(payload['recipient_id']))]})
+
+    async def get_history(self, request):
+        return json_response([])
+
+    async def create_message(self, request):
+        payload = await self._payload(request)
+        message = self.message_payload(request.match_info['channel_id'], payload)
+        self.messages[int(message['id'])] = message
+        self._notify(request, payload)
+        return json_response(message)
+
+    async def edit_message(self, request):
+        payload = await self._payload(request)
+        message_id = int(request.match_info['message_id'])
+        message = self.messages.get(message_id) or self.message_payload(request.match_info['channel_id'], {}, message_id)
+        message.update({key: value for key, value in payload.items() if key in ('content', 'embeds', 'components')})
+        message['edited_timestamp'] = iso_now()
+        self.messages[message_id] = message
+        return json_response(message)
+
+    async def delete_message(self, request):
+        self.messages.pop(int(request.match_info['message_id']), None)
+        return web.Response(status=204)
+
+    async def bulk_delete(self, request):
+        for message_id in (await request.json()).get('messages', []):
+            self.messages.pop(int(message_id), None)
+        return web.Response(status=204)
+
+    async def interaction_callback(self, request):
+        self._notify(request, await self._payload(request))
+        return web.Response(status=204)
+
+    async def followup(self, request):
+        payload = await self._payload(request)
+        self._notify(request, payload)
+        return json_response(self.message_payload(COMMAND_CHANNEL_ID, payload))
+
+    # --- Gateway ---
+    async def gateway(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._gateway = ws
+        await ws.send_json({'op': 10, 'd': {'heartbeat_interval': 41250}})
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            data = json.loads(msg.data)
+            if data['op'] == 1:
+                await ws.send_json({'op': 11})
+            elif data['op'] == 2:
+                await self.dispatch('READY', {
+                    'v': 10, 'user': user_payload(BOT_USER_ID, bot=True), 'guilds': [{'id': str(GUILD_ID), 'unavailable': True}],
+                    'session_id': 'loadgen', 'resume_gateway_url': str(request.url), 'application': {'id': str(BOT_USER_ID), 'flags': 0},
+                })
+                await self.dispatch('GUILD_CREATE', self.guild_payload())
+        self._gateway = None
+        return ws
+
+    async def dispatch(self, event, data):
+        await self._gateway.send_json({'op': 0, 't': event, 's': next(self._sequence), 'd': data})
+
+    def guild_payload(self):
+        channel_ids = (main.STATUS_CHANNEL_ID, main.SUGGESTION_CHANNEL_ID, main.SUGGESTION_LOG_CHANNEL_ID, main.GUIDE_CHANNEL_ID, COMMAND_CHANNEL_ID)
+        members = [member_payload(user_id) for user_id in self.member_ids]
+        members.append({**member_payload(BOT_USER_ID), 'user': user_payload(BOT_USER_ID, bot=True)})
+        return {
+            'id': str(GUILD_ID), 'name': 'loadgen', 'icon': None, 'owner_id': '1', 'afk_timeout': 300, 'verification_level': 0,
+            'default_message_notifications': 0, 'explicit_content_filter': 0, 'mfa_level': 0, 'premium_tier': 0, 'nsfw_level': 0,
+            'system_channel_flags': 0, 'preferred_locale': 'en-US', 'features': [], 'emojis': [], 'stickers': [],
+            'roles': [{'id': str(GUILD_ID), 'name': '@everyone', 'permissions': '0', 'position': 0, 'color': 0, 'hoist': False, 'managed': False, 'mentionable': False}],
+            'channels': [
+                {'id': str(channel_id), 'type': 0, 'name': f"channel-{channel_id}", 'position': position, 'permission_overwrites': [], 'guild_id': str(GUILD_ID)}
+                for position, channel_id in enumerate(channel_ids)
+            ],
+            'members': members, 'member_count': len(members), 'large': False, 'joined_at': iso_now(),
+            'presences': [], 'voice_states': [], 'threads': [], 'stage_instances': [], 'guild_scheduled_events': [],
+        }
+
+    def message_create(self, author_id, content, mention_ids=()):
+        message_id = snowflake()
+        return message_id, {
+            'id': str(message_id), 'channel_id': str(COMMAND_CHANNEL_ID), 'guild_id': str(GUILD_ID), 'author': user_payload(author_id),
+            'member': {key: value for key, value in member_payload(author_id).items() if key != 'user'},
+            'content': content, 'timestamp': iso_now(), 'edited_timestamp': None, 'tts': False, 'mention_everyone': False,
+            'mentions': [{**user_payload(user_id), 'member': {key: value for key, value in member_payload(user_id).items() if key != 'user'}} for user_id in mention_ids],
+            'mention_roles': [], 'attachments': [], 'embeds': [], 'pinned': False, 'type': 0, 'flags': 0, 'components': [],
+        }
+
+    def button_click(self, user_id, message, custom_id):
+        interaction_id = snowflake()
+        token = f"token-{interaction_id}"
+        return token, {
+            'id': str(interaction_id), 'application_id': str(BOT_USER_ID), 'type': 3, 'token': token, 'version': 1,
+            'guild_id': str(GUILD_ID), 'channel_id': message['channel_id'], 'member': {**member_payload(user_id), 'permissions': '0'},
+            'data': {'custom_id': custom_id, 'component_type': 2}, 'message': message, 'app_permissions': '0',
+            'locale': 'en-US', 'guild_locale': 'en-US', 'entitlements': [], 'authorizing_integration_owners': {},
+        }
+
+class Scenario:
+    # Times each logical operation from the gateway event to the REST call that completes it
+    def __init__(self, name, fake):
+        self.name = name
+        self.fake = fake
+        self.started = {}   # {correlation key: perf_counter at dispatch}
+        self.latencies = []
+        self.ops = 0
+        self.last_completed = None
+
+    def begin(self, key):
+        self.ops += 1
+        self.started[key] = time.perf_counter()
+
+    def complete(self, key):
+        started = self.started.pop(key, None)
+        if started is not None:
+            self.last_completed = time.perf_counter()
+            self.latencies.append(self.last_completed - started)
+
+def percentile(values, fraction):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def pace(events, rate):
+    for i, event in enumerate(events):
+        await event()
+        if rate:
+            await asyncio.sleep(1 / rate)
+        elif i % 50 == 49:
+            await asyncio.sleep(0)
+
+async def status_storm(fake, args):
+    scenario = Scenario('status-storm', fake)
+    mention = re.compile(r"<@(\d+)>")
+
+    def on_call(route, match_info, payload):
+        if route == 'POST /channels/{channel_id}/messages' and int(match_info['channel_id']) == COMMAND_CHANNEL_ID:
+            found = mention.search(payload.get('content') or '')
+            if found:
+                scenario.complete(int(found.group(1)))
+
+    fake.listeners.append(on_call)
+    commands = ('.f', '.s', '.dl', '.srn', '.o', '.b')
+    authors = random.sample(fake.member_ids, min(args.ops, len(fake.member_ids)))
+
+    def event(author_id, command):
+        async def send():
+            scenario.begin(author_id)
+            await fake.dispatch('MESSAGE_CREATE', fake.message_create(author_id, command)[1])
+        return send
+
+    await pace([event(author_id, random.choice(commands)) for author_id in authors], args.rate)
+    return scenario, on_call
+
+async def vote_storm(fake, args):
+    # Submit one suggestion through the real command, then click its vote buttons
+    author_id = fake.member_ids[0]
+    await fake.dispatch('MESSAGE_CREATE', fake.message_create(author_id, '!suggest Load test suggestion')[1])
+    for _ in range(200):
+        suggestion = next((message for message in fake.messages.values() if int(message['channel_id']) == main.SUGGESTION_CHANNEL_ID and message['components']), None)
+        if suggestion:
+            break
+        await asyncio.sleep(0.05)
+    else:
+        raise RuntimeError("The bot never posted the suggestion message")
+    suggestion_index = main.suggestion_indexes.by_message_id[int(suggestion['id'])]
+
+    scenario = Scenario('vote-storm', fake)
+
+    def on_call(route, match_info, payload):
+        if route == 'POST /webhooks/{application_id}/{token}':
+            scenario.complete(match_info['token'])
+
+    fake.listeners.append(on_call)
+    voters = random.sample(fake.member_ids[1:], min(args.ops, len(fake.member_ids) - 1))
+
+    def event(voter_id):
+        async def send():
+            token, payload = fake.button_click(voter_id, suggestion, f"{random.choice(('upvote', 'downvote'))}_{suggestion_index}")
+            scenario.begin(token)
+            await fake.dispatch('INTERACTION_CREATE', payload)
+        return send
+
+    await pace([event(voter_id) for voter_id in voters], args.rate)
+    return scenario, on_call
+
+async def mention_storm(fake, args):
+    # Members with statuses get mentioned a few at a time by random senders
+    targets = fake.member_ids[:50]
+    for user_id in targets:
+        await main.set_user_status_in_memory(user_id, random.choice(main.STATUS_KINDS[:6]))
+    scenario = Scenario('mention-storm', fake)
+
+    def on_call(route, match_info, payload):
+        reference = payload.get('message_reference')
+        if route == 'POST /channels/{channel_id}/messages' and reference:
+            scenario.complete(int(reference['message_id']))
+
+    fake.listeners.append(on_call)
+
+    def event():
+        async def send():
+            mentioned = random.sample(targets, 3)
+            message_id, payload = fake.message_create(random.choice(fake.member_ids[50:]), ' '.join(f"<@{user_id}>" for user_id in mentioned) + " are you around?", mentioned)
+            scenario.begin(message_id)
+            await fake.dispatch('MESSAGE_CREATE', payload)
+        return send
+
+    await pace([event() for _ in range(args.ops)], args.rate)
+    return scenario, on_call
+
+SCENARIOS = {'status-storm': status_storm, 'vote-storm': vote_storm, 'mention-storm': mention_storm}
+
+async def wait_for_quiet(fake, quiet, timeout):
+    deadline = time.monotonic() + timeout
+    last_total, last_change = None, time.monotonic()
+    while time.monotonic() < deadline:
+        total = sum(fake.calls.values())
+        if total != last_total:
+            last_total, last_change = total, time.monotonic()
+        elif time.monotonic() - last_change >= quiet:
+            return
+        await asyncio.sleep(0.25)
+
+def report(scenario, calls, rate_limited, started, sent):
+    latencies_ms = [latency * 1000 for latency in scenario.latencies]
+    total_calls = sum(calls.values())
+    finished = f", last reply after {scenario.last_completed - started:.2f}s" if scenario.last_completed else ""
+    print(f"\n== {scenario.name}: {scenario.ops} ops sent in {sent - started:.2f}s{finished} ==")
+    print(f"completed:       {len(latencies_ms)} ({len(scenario.started)} without a reply)")
+    print(f"latency ms:      p50 {percentile(latencies_ms, 0.5):.1f}  p90 {percentile(latencies_ms, 0.9):.1f}  "
+          f"p99 {percentile(latencies_ms, 0.99):.1f}  max {max(latencies_ms, default=float('nan')):.1f}")
+    print(f"REST calls:      {total_calls} ({total_calls / max(scenario.ops, 1):.2f} per op), {sum(rate_limited.values())} answered 429")
+    for route, count in calls.most_common():
+        print(f"  {route:<60} {count:>6}  429s: {rate_limited.get(route, 0)}")
+
+async def run(args):
+    rate_limit, window = (float(part) for part in args.rate_limit.split('/'))
+    member_ids = [1_000_000 + i for i in range(args.members)]
+    fake = FakeDiscord(member_ids, int(rate_limit), window)
+    runner = web.AppRunner(fake.app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    discord.http.Route.BASE = f"http://127.0.0.1:{port}/api/v10"
+    discord.gateway.DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(f"ws://127.0.0.1:{port}/gateway")
+    main.bot._connection.guild_ready_timeout = 0.1
+    bot_task = asyncio.create_task(main.bot.start('loadgen-token'))
+    await asyncio.wait_for(main.bot.wait_until_ready(), timeout=30)
+    await asyncio.sleep(1)  # Let on_ready post the first board
+
+    names = list(SCENARIOS) if args.scenario == 'all' else [args.scenario]
+    for name in names:
+        calls_before, limited_before = fake.calls.copy(), fake.rate_limited.copy()
+        started = time.perf_counter()
+        scenario, listener = await SCENARIOS[name](fake, args)
+        sent = time.perf_counter()
+        await wait_for_quiet(fake, args.quiet, args.timeout)
+        fake.listeners.remove(listener)
+        report(scenario, fake.calls - calls_before, fake.rate_limited - limited_before, started, sent)
+
+    await main.bot.close()
+    bot_task.cancel()
+    await runner.cleanup()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay synthetic traffic against the bot and a fake Discord.")
+    parser.add_argument('--scenario', default='all', choices=['all', *SCENARIOS])
+    parser.add_argument('--ops', default=100, type=int)
+    parser.add_argument('--rate', default=0, type=float, help="events per second; 0 sends them all at once")
+    parser.add_argument('--members', default=2000, type=int)
+    parser.add_argument('--rate-limit', default='5/5', help="requests/seconds allowed per route bucket")
+    parser.add_argument('--quiet', default=10.0, type=float, help="seconds without REST calls that end a scenario")
+    parser.add_argument('--timeout', default=300.0, type=float, help="longest a scenario may take to settle")
+    parser.add_argument('--seed', default=0, type=int)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(run(args))
@@ -3,22 +3,45 @@ import discord
 from discord.ext import commands
 import datetime
 import asyncio
-import threading
 import random
-from flask import Flask, jsonify
+import sys
+import time
+import bisect
+import json
+import math
+import re
+import hashlib
+import heapq
+import itertools
+import sqlite3
+import threading
+import contextvars
+import contextlib
+from array import array
+from typing import Optional
+from collections import OrderedDict, deque
+from aiohttp import web, TraceConfig
 from dotenv import load_dotenv
 
 # --- Load environment variables ---
 load_dotenv()
 
-# --- Flask Setup (for basic web server) ---
-app = Flask(__name__)
+# --- Web Server Setup ---
+# Served from the bot's own event loop, so handlers read the in-memory state directly
+web_routes = web.RouteTableDef()
+WEB_PORT = int(os.environ.get('WEB_PORT', 8080))
+API_PAGE_SIZE = 100  # Suggestions per /api/suggestions page unless ?limit= asks for fewer
 
 # --- Global Variables for In-Memory Storage ---
-user_statuses = {}   # Stores user statuses: {user_id_str: {'status': 'Free', 'timestamp': 'ISO_FORMAT_DATETIME'}}
+user_statuses = {}   # Stores user statuses: {user_id: StatusRecord}, in board order
 suggestions = {}     # Stores suggestions: {index: {data...}} using a simple counter as key
-status_embed_message_id = None  # Stores the message ID of the status board embed
+status_embed_message_ids = []  # Stores the message IDs of the status board pages, in page order
+status_embed_messages = {}  # Cached handles for the status board pages, avoids re-fetching on every edit
+status_embed_rendered = []  # Last rendered content of each status board page, used to skip unchanged pages
+status_embed_orphans = set()  # Pages this process posted before adopting another process's board
 suggestion_counter = 0  # Simple counter to track suggestions (instead of UUID)
+suggestion_history_checkpoint = None  # Newest suggestion channel message already rebuilt from history
+data_versions = {'statuses': 0, 'suggestions': 0}  # Bumped on every change; the JSON API caches by these
 
 # --- Bot Setup ---
 intents = discord.Intents.default()
@@ -30,7 +53,38 @@ intents.reactions = True
 STATUS_COMMAND_PREFIX = '.'
 SUGGESTION_COMMAND_PREFIX = '!'
 
-bot = commands.Bot(command_prefix=commands.when_mentioned_or(STATUS_COMMAND_PREFIX, SUGGESTION_COMMAND_PREFIX), intents=intents)
+# Every REST request discord.py sends, counted on its own aiohttp session so requests it retries
+# internally after a 429 are included. Numeric ids and interaction tokens in the path are folded
+# into {id} and {token}.
+rest_http_stats = {}  # {route: {'calls': n, 'errors': n, 'rate_limited': n}}
+REST_API_PATH = re.compile(r'^/api/v\d+')
+REST_SNOWFLAKE = re.compile(r'/\d+(?=/|$)')
+REST_TOKEN = re.compile(r'^(/(?:interactions|webhooks)/\{id\})/[^/]+')
+
+def count_rest_request(method, url, status):
+    path, api = REST_API_PATH.subn('', url.path)
+    if not api:
+        return  # Gateway and CDN traffic
+    path = REST_TOKEN.sub(r'\1/{token}', REST_SNOWFLAKE.sub('/{id}', path))
+    route = f"{method} {path}"
+    stats = rest_http_stats.setdefault(route, {'calls': 0, 'errors': 0, 'rate_limited': 0})
+    stats['calls'] += 1
+    if status is None or status >= 400:
+        stats['errors'] += 1
+    if status == 429:
+        stats['rate_limited'] += 1
+
+async def _on_rest_request_end(session, context, params):
+    count_rest_request(params.method, params.url, params.response.status)
+
+async def _on_rest_request_exception(session, context, params):
+    count_rest_request(params.method, params.url, None)
+
+rest_trace = TraceConfig()
+rest_trace.on_request_end.append(_on_rest_request_end)
+rest_trace.on_request_exception.append(_on_rest_request_exception)
+
+bot = commands.Bot(command_prefix=commands.when_mentioned_or(STATUS_COMMAND_PREFIX, SUGGESTION_COMMAND_PREFIX), intents=intents, http_trace=rest_trace)
 
 # --- Channel and Role IDs (REPLACE THESE WITH YOUR ACTUAL IDs) ---
 STATUS_CHANNEL_ID = 1375511813713821727           # Status Board Channel
@@ -50,39 +104,1757 @@ SERVER_DESIGNER_ROLE_ID = 123456789012345678  # Placeholder - Replace with your
 # Role IDs for users who can vote on suggestions. Set to [] if @everyone can vote
 VOTER_ROLE_IDS = []  # Example: [123456789012345678] for a 'Member' role
 
-# --- In-Memory Data Management Helpers ---
-async def get_all_user_statuses_in_memory():
-    return user_statuses
+# Minimum seconds between status board edits; changes inside the window are merged into one edit
+STATUS_BOARD_REFRESH_WINDOW = float(os.environ.get('STATUS_BOARD_REFRESH_WINDOW', 5))
+
+# Minimum seconds between edits of suggestion messages; votes inside the window are merged into one edit
+SUGGESTION_REFRESH_WINDOW = float(os.environ.get('SUGGESTION_REFRESH_WINDOW', 2))
+
+# Vote ledgers untouched for this many seconds are compacted into sorted arrays
+VOTE_LEDGER_COLD_AFTER = 300
+
+# Each (channel, mentioned user) pair gets at most one status auto-reply per cooldown window
+MENTION_REPLY_COOLDOWN = 300
+MENTION_REPLY_CACHE_SIZE = 10000
+
+# Outbound REST scheduling. One slot of REST_CONCURRENCY is kept free for interaction responses.
+REST_CONCURRENCY = 4
+REST_SHED_LIMITS = {3: 500}  # Max queued jobs per priority class before new ones are dropped (3 = logs, DMs, chatter)
+
+# Pending message deletes are bucketed into ticks of DELETION_TICK seconds on a wheel of DELETION_WHEEL_SLOTS
+DELETION_TICK = 1.0
+DELETION_WHEEL_SLOTS = 64
+
+# Durable storage for statuses and suggestions: 'sqlite' (write-behind to SQLITE_PATH),
+# 'redis' (shared between bot processes, uses REDIS_HOST / REDIS_PORT) or 'memory'
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'sqlite')
+SQLITE_PATH = os.environ.get('SQLITE_PATH', 'bot_state.db')
+REDIS_KEY_PREFIX = os.environ.get('REDIS_KEY_PREFIX', 'statusbot')
+STORE_FLUSH_INTERVAL = 1.0  # Seconds between write-behind flushes
+STORE_FLUSH_BATCH_SIZE = 1000  # Pending writes that trigger an early flush
+
+# Status board pagination. Discord caps an embed at 25 fields and 6000 characters.
+STATUS_BOARD_PAGE_SIZE = 20
+STATUS_BOARD_PAGE_CHAR_BUDGET = 5000
+
+# Status history: transitions kept in memory (18 bytes each) before the oldest are overwritten
+STATUS_HISTORY_CAPACITY = int(os.environ.get('STATUS_HISTORY_CAPACITY', 200000))
+STATUS_STATS_DEFAULT_DAYS = 7
+
+# Seconds after which a status is cleared automatically. Statuses not listed never expire.
+STATUS_TTLS = {
+    "Sleeping": 10 * 3600,
+    "On Break": 30 * 60,
+    "Outside": 3 * 3600,
+}
+
+# Metrics: how often event-loop lag and store sizes are sampled, and latency histogram buckets
+METRICS_SAMPLE_INTERVAL = 5.0
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Suggestion search. Near-duplicates are found with MinHash/LSH over each suggestion's words
+# (SUGGESTION_LSH_BANDS bands of SUGGESTION_LSH_ROWS hashes) and confirmed by word overlap.
+SUGGESTION_SEARCH_RESULTS = 10
+SUGGESTION_SEARCH_SCAN_LIMIT = 300  # Postings read per word; commoner words only rescore matches of rarer ones
+SUGGESTION_LSH_BANDS = 5
+SUGGESTION_LSH_ROWS = 3
+SUGGESTION_DUPLICATE_THRESHOLD = 0.6  # Jaccard similarity of the word sets
+SUGGESTION_LSH_BUCKET_LIMIT = 50  # Buckets fuller than this only hold words everyone uses and are ignored
+SUGGESTION_DUPLICATE_CONFIRM_WINDOW = 300  # Seconds in which re-submitting a flagged suggestion posts it anyway
+
+# Suggestion rankings. Trending is the net vote count with each vote's weight halving every
+# TRENDING_HALF_LIFE seconds; votes are folded into it every TRENDING_BATCH_INTERVAL seconds.
+SUGGESTION_RANKING_DEFAULT_COUNT = 10
+SUGGESTION_RANKING_MAX_COUNT = 15  # A full line is ~250 characters; embed descriptions stop at 4096
+EMBED_DESCRIPTION_LIMIT = 4096
+TRENDING_HALF_LIFE = 6 * 3600
+TRENDING_BATCH_INTERVAL = 30
+
+# Profiling: the slowest SLOW_CALL_LOG_SIZE calls of the last SLOW_CALL_WINDOW seconds are kept,
+# and calls over SLOW_CALL_THRESHOLD seconds are printed with their phase breakdown
+SLOW_CALL_LOG_SIZE = 20
+SLOW_CALL_WINDOW = 3600
+SLOW_CALL_THRESHOLD = float(os.environ.get('SLOW_CALL_THRESHOLD', 1.0))
+PROFILER_SAMPLE_INTERVAL = 0.005
+PROFILER_MAX_SECONDS = 60
+PROFILE_OUTPUT_DIR = os.environ.get('PROFILE_OUTPUT_DIR', 'profiles')
+
+# --- Status Records ---
+STATUS_KINDS = ["Do Later", "Sleeping", "Free", "Studying Right Now", "Outside", "On Break"]
+STATUS_KIND_CODES = {label: code for code, label in enumerate(STATUS_KINDS)}
+
+def status_kind(label):
+    # Interns a status label as a small code. Labels from older data get a code on first sight.
+    code = STATUS_KIND_CODES.get(label)
+    if code is None:
+        code = STATUS_KIND_CODES[label] = len(STATUS_KINDS)
+        STATUS_KINDS.append(sys.intern(label))
+    return code
+
+class StatusRecord:
+    # One member's status. The timestamp is parsed once, when the record is built; an unparseable
+    # one is kept as 0 and shown as N/A.
+    __slots__ = ('user_id', 'kind', 'updated_at')
+
+    def __init__(self, user_id, status, updated_at):
+        self.user_id = user_id
+        self.kind = status_kind(status)
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_iso(cls, user_id, status, timestamp):
+        try:
+            dt_object_utc = datetime.datetime.fromisoformat(timestamp)
+            if dt_object_utc.tzinfo is None:
+                dt_object_utc = dt_object_utc.replace(tzinfo=datetime.timezone.utc)
+            updated_at = int(dt_object_utc.timestamp())
+        except (ValueError, TypeError):
+            updated_at = 0
+        return cls(int(user_id), status, updated_at)
+
+    @property
+    def status(self):
+        return STATUS_KINDS[self.kind]
+
+    def isoformat(self):
+        return datetime.datetime.fromtimestamp(self.updated_at, datetime.timezone.utc).isoformat()
+
+    def display_time(self):
+        return f"<t:{self.updated_at}:R>" if self.updated_at else "N/A"
+
+# --- Status History ---
+STATUS_CLEARED = 0xFFFF  # Code logged when a member's status is cleared
+
+class StatusHistory:
+    # Append-only log of status transitions in a fixed-size ring of parallel arrays. Entry `seq`
+    # lives in slot seq % capacity, and once the ring is full each append overwrites the oldest.
+    # Epochs never decrease along the log, so each member's sequence list can be binary searched
+    # by time.
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.user_ids = array('Q', bytes(8 * capacity))
+        self.codes = array('H', bytes(2 * capacity))
+        self.epochs = array('q', bytes(8 * capacity))
+        self.next_seq = 0
+        self._by_user = {}  # {user_id: [array('Q') of seqs, offset of the first live one]}
+
+    def epoch_at(self, seq):
+        return self.epochs[seq % self.capacity]
+
+    def code_at(self, seq):
+        return self.codes[seq % self.capacity]
+
+    def record(self, user_id, code, epoch):
+        if self.next_seq:
+            epoch = max(epoch, self.epoch_at(self.next_seq - 1))
+        seq = self.next_seq
+        slot = seq % self.capacity
+        if seq >= self.capacity:
+            self._evict(self.user_ids[slot])
+        self.user_ids[slot] = user_id
+        self.codes[slot] = code
+        self.epochs[slot] = epoch
+        self.next_seq += 1
+        entry = self._by_user.get(user_id)
+        if entry is None:
+            entry = self._by_user[user_id] = [array('Q'), 0]
+        entry[0].append(seq)
+
+    def _evict(self, user_id):
+        # The overwritten entry is always the oldest one of its member
+        entry = self._by_user[user_id]
+        entry[1] += 1
+        seqs, start = entry
+        if start == len(seqs):
+            del self._by_user[user_id]
+        elif start >= 32 and start * 2 >= len(seqs):
+            entry[0], entry[1] = seqs[start:], 0
+
+    def user_ids_logged(self):
+        return self._by_user.keys()
+
+    def recent(self, user_id, limit):
+        # Newest first: [(code, epoch), ...]
+        entry = self._by_user.get(user_id)
+        if entry is None:
+            return []
+        seqs, start = entry
+        return [(self.code_at(seqs[i]), self.epoch_at(seqs[i])) for i in range(len(seqs) - 1, max(start, len(seqs) - limit) - 1, -1)]
+
+    def time_per_status(self, user_id, since, now, totals=None):
+        # Seconds spent in each status code between `since` and `now`. The search starts one
+        # entry before the window so the status already active when it opened is counted.
+        totals = {} if totals is None else totals
+        entry = self._by_user.get(user_id)
+        if entry is None:
+            return totals
+        seqs, start = entry
+        i = bisect.bisect_right(seqs, since, lo=start, key=self.epoch_at)
+        if i > start:
+            i -= 1
+        for j in range(i, len(seqs)):
+            code = self.code_at(seqs[j])
+            begin = max(self.epoch_at(seqs[j]), since)
+            end = self.epoch_at(seqs[j + 1]) if j + 1 < len(seqs) else now
+            if code != STATUS_CLEARED and end > begin:
+                totals[code] = totals.get(code, 0) + end - begin
+        return totals
+
+    def stats(self):
+        return {'entries': min(self.next_seq, self.capacity), 'capacity': self.capacity, 'appended': self.next_seq, 'users': len(self._by_user)}
+
+status_history = StatusHistory(STATUS_HISTORY_CAPACITY)
+
+def format_duration(seconds):
+    days, seconds = divmod(int(seconds), 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes = seconds // 60
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m" if minutes else "<1m"
+
+# --- Vote Ledger ---
+class VoteLedger:
+    # Voter IDs per suggestion as ints with running counters. Hot ledgers use sets; cold ones are
+    # compacted into sorted 8-byte arrays and thawed back into sets on the next change.
+    # `carried` votes are counted but have no known voter (e.g. tallies read back from an embed).
+    __slots__ = ('_up', '_down', 'up_count', 'down_count', 'carried_up', 'carried_down', 'last_change')
+
+    def __init__(self, upvoters=(), downvoters=(), carried=(0, 0)):
+        self._up = set(upvoters)
+        self._down = set(downvoters) - self._up
+        self.carried_up, self.carried_down = carried
+        self.up_count = len(self._up) + self.carried_up
+        self.down_count = len(self._down) + self.carried_down
+        self.last_change = time.monotonic()
+
+    @classmethod
+    def cold(cls, upvoters=(), downvoters=(), carried=(0, 0)):
+        # Builds an already-compacted ledger, e.g. when loading suggestions from storage
+        ledger = cls.__new__(cls)
+        ledger._up = array('Q', sorted(upvoters))
+        ledger._down = array('Q', sorted(downvoters))
+        ledger.carried_up, ledger.carried_down = carried
+        ledger.up_count = len(ledger._up) + ledger.carried_up
+        ledger.down_count = len(ledger._down) + ledger.carried_down
+        ledger.last_change = time.monotonic()
+        return ledger
+
+    @staticmethod
+    def _contains(voters, user_id):
+        if isinstance(voters, set):
+            return user_id in voters
+        i = bisect.bisect_left(voters, user_id)
+        return i < len(voters) and voters[i] == user_id
+
+    @property
+    def compacted(self):
+        return not isinstance(self._up, set)
+
+    def compact(self):
+        if not self.compacted:
+            self._up = array('Q', sorted(self._up))
+            self._down = array('Q', sorted(self._down))
+
+    def _thaw(self):
+        if self.compacted:
+            self._up = set(self._up)
+            self._down = set(self._down)
+
+    def vote_of(self, user_id: int):
+        if self._contains(self._up, user_id):
+            return 'upvote'
+        if self._contains(self._down, user_id):
+            return 'downvote'
+        return None
+
+    def toggle(self, user_id: int, vote_type: str):
+        # Adds the vote (flipping an opposite one) or removes it; returns 'added' or 'removed'
+        self._thaw()
+        self.last_change = time.monotonic()
+        if vote_type == 'upvote':
+            if user_id in self._up:
+                self._up.discard(user_id)
+                self.up_count -= 1
+                return 'removed'
+            self._up.add(user_id)
+            self.up_count += 1
+            if user_id in self._down:
+                self._down.discard(user_id)
+                self.down_count -= 1
+        else:
+            if user_id in self._down:
+                self._down.discard(user_id)
+                self.down_count -= 1
+                return 'removed'
+            self._down.add(user_id)
+            self.down_count += 1
+            if user_id in self._up:
+                self._up.discard(user_id)
+                self.up_count -= 1
+        return 'added'
+
+    def set_vote(self, user_id: int, vote):
+        # Makes `vote` ('upvote', 'downvote' or None) the user's current vote
+        current = self.vote_of(user_id)
+        if current != vote:
+            if current:
+                self.toggle(user_id, current)
+            if vote:
+                self.toggle(user_id, vote)
+
+    def upvoters(self):
+        return iter(self._up)
+
+    def downvoters(self):
+        return iter(self._down)
+
+    def __len__(self):
+        return self.up_count + self.down_count
+
+# --- Persistent State Store ---
+class StateStore:
+    # Durable copy of the in-memory state. The dicts stay the hot cache; stores only see writes.
+    # This base class persists nothing and is used when STORAGE_BACKEND is 'memory'.
+    def start(self):
+        pass
 
-async def set_all_user_statuses_in_memory(statuses_data):
-    global user_statuses
-    user_statuses = statuses_data
+    async def close(self):
+        pass
 
-async def get_status_embed_message_id_in_memory():
-    return status_embed_message_id
+    async def load(self):
+        return None
 
-async def set_status_embed_message_id_in_memory(message_id):
-    global status_embed_message_id
-    status_embed_message_id = message_id
+    def save_status(self, record):
+        pass
 
-async def save_suggestion_in_memory(suggestion_data):
+    def delete_status(self, user_id):
+        pass
+
+    def save_suggestion(self, suggestion_index, suggestion_data):
+        pass
+
+    def save_vote(self, suggestion_index, user_id, vote):
+        pass
+
+    def set_meta(self, key, value):
+        pass
+
+    # Shared stores override these so several bot processes agree on indexes, votes and status
+    # changes. None means "not shared, use the local state".
+    on_change = None  # Coroutine function called with each change another process announces
+
+    async def next_suggestion_index(self, floor=0):
+        return None
+
+    async def raise_suggestion_counter(self, floor):
+        pass
+
+    async def transition_suggestion(self, suggestion_index, old_status, new_status):
+        # False if another process already moved the suggestion off `old_status`
+        return True
+
+    async def toggle_vote(self, suggestion_index, user_id, vote_type):
+        return None
+
+    async def fetch_suggestion(self, suggestion_index):
+        return None
+
+    async def fetch_statuses(self, user_ids):
+        # [(user_id, (status, timestamp) or None)] for `user_ids`
+        return []
+
+    async def fetch_meta(self, keys):
+        return {}
+
+    def stats(self):
+        return {}
+
+SUGGESTION_COLUMNS = ('author_id', 'author_name', 'suggestion_text', 'timestamp', 'status', 'rejection_reason', 'message_id', 'discussion_channel_id', 'carried_upvotes', 'carried_downvotes')
+
+class WriteBehindStore(StateStore):
+    # Writes are coalesced per row in memory and handed to `_write_batch` in one go, every
+    # `flush_interval` seconds or as soon as `batch_size` rows are pending.
+    def __init__(self, name, flush_interval=STORE_FLUSH_INTERVAL, batch_size=STORE_FLUSH_BATCH_SIZE):
+        self.name = name
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._statuses = {}     # {user_id: (status, timestamp) or None to delete}
+        self._suggestions = {}  # {idx: row}
+        self._votes = {}        # {(idx, user_id): 1, -1 or 0 to delete}
+        self._meta = {}
+        self._wakeup = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = None
+        self.writes_queued = 0
+        self.rows_written = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.flush_seconds = 0.0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"{self.name}-write-behind")
+
+    async def close(self):
+        if self._task is not None:
+            task, self._task = self._task, None
+            # Wait out a flush that's already writing; cancelling it would leave its thread
+            # writing while the final flush and close run on the same connection
+            async with self._flush_lock:
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def _pending(self):
+        return len(self._statuses) + len(self._suggestions) + len(self._votes) + len(self._meta)
+
+    def _queued(self):
+        self.writes_queued += 1
+        self._wakeup.set()
+        if self._pending() >= self.batch_size:
+            self._batch_full.set()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            # asyncio.timeout rather than wait_for: on 3.11 wait_for can swallow a cancel that lands
+            # as the batch fills, and close() would then wait for this task forever
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.flush_interval):
+                    await self._batch_full.wait()
+            self._wakeup.clear()
+            self._batch_full.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # The batch is back in the pending rows; try again next interval
+                self.flush_errors += 1
+                print(f"Error flushing state to {self.name}: {e}")
+                self._wakeup.set()
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending():
+                return
+            batch = (self._statuses, self._suggestions, self._votes, self._meta)
+            self._statuses, self._suggestions, self._votes, self._meta = {}, {}, {}, {}
+            started = time.perf_counter()
+            try:
+                await self._write_batch(*batch)
+            except BaseException:
+                self._restore(batch)
+                raise
+            self.flush_seconds += time.perf_counter() - started
+            self.flushes += 1
+            self.rows_written += sum(len(rows) for rows in batch)
+
+    def _restore(self, batch):
+        # Puts a failed batch back under whatever was queued while it was being written; rows
+        # queued since are newer and win
+        statuses, suggestions_rows, votes, meta = batch
+        self._statuses = {**statuses, **self._statuses}
+        self._suggestions = {**suggestions_rows, **self._suggestions}
+        self._votes = {**votes, **self._votes}
+        self._meta = {**meta, **self._meta}
+
+    async def _write_batch(self, statuses, suggestions_rows, votes, meta):
+        raise NotImplementedError
+
+    # Statuses are persisted as (label, ISO timestamp) so stored rows stay readable
+    def save_status(self, record):
+        self._statuses[record.user_id] = (record.status, record.isoformat())
+        self._queued()
+
+    def delete_status(self, user_id):
+        self._statuses[user_id] = None
+        self._queued()
+
+    def save_suggestion(self, suggestion_index, suggestion_data):
+        self._suggestions[suggestion_index] = tuple(suggestion_data.get(column) for column in SUGGESTION_COLUMNS)
+        self._queued()
+
+    def save_vote(self, suggestion_index, user_id, vote):
+        self._votes[(suggestion_index, user_id)] = 1 if vote == 'upvote' else -1 if vote == 'downvote' else 0
+        self._queued()
+
+    def set_meta(self, key, value):
+        self._meta[key] = json.dumps(value)
+        self._queued()
+
+    def stats(self):
+        return {
+            'writes_queued': self.writes_queued,
+            'rows_written': self.rows_written,
+            'pending': self._pending(),
+            'flushes': self.flushes,
+            'flush_errors': self.flush_errors,
+            'flush_seconds': round(self.flush_seconds, 3),
+        }
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statuses (
+    user_id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    position INTEGER
+);
+CREATE TABLE IF NOT EXISTS suggestions (
+    idx INTEGER PRIMARY KEY,
+    author_id INTEGER,
+    author_name TEXT,
+    suggestion_text TEXT NOT NULL,
+    timestamp TEXT,
+    status TEXT NOT NULL,
+    rejection_reason TEXT,
+    message_id INTEGER,
+    discussion_channel_id INTEGER,
+    carried_upvotes INTEGER,
+    carried_downvotes INTEGER
+);
+CREATE TABLE IF NOT EXISTS votes (
+    suggestion_idx INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    vote INTEGER NOT NULL,
+    PRIMARY KEY (suggestion_idx, user_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class SQLiteStore(WriteBehindStore):
+    # Flushes each batch in one transaction on a worker thread, so the event loop never waits
+    # on disk. The database runs in WAL mode.
+    def __init__(self, path, **kwargs):
+        super().__init__(path, **kwargs)
+        self.path = path
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SQLITE_SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(suggestions)")}
+            for column in SUGGESTION_COLUMNS:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE suggestions ADD COLUMN {column}")
+            # rowid is the user ID here, so the board order (first appearance) needs its own column
+            if 'position' not in {row[1] for row in conn.execute("PRAGMA table_info(statuses)")}:
+                with conn:
+                    conn.execute("ALTER TABLE statuses ADD COLUMN position INTEGER")
+                    conn.execute("UPDATE statuses SET position = rowid")
+            conn.execute("CREATE INDEX IF NOT EXISTS statuses_position ON statuses (position)")
+            self._conn = conn
+        return self._conn
+
+    async def close(self):
+        await super().close()
+        if self._conn is not None:
+            await asyncio.to_thread(self._conn.close)
+            self._conn = None
+
+    async def _write_batch(self, *batch):
+        await asyncio.to_thread(self._write, *batch)
+
+    def _write(self, statuses, suggestions_rows, votes, meta):
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                # A new member goes to the end of the board; an update keeps its position
+                "INSERT INTO statuses (user_id, status, timestamp, position) "
+                "VALUES (?, ?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM statuses)) "
+                "ON CONFLICT(user_id) DO UPDATE SET status = excluded.status, timestamp = excluded.timestamp",
+                [(user_id, *row) for user_id, row in statuses.items() if row is not None]
+            )
+            conn.executemany("DELETE FROM statuses WHERE user_id = ?", [(user_id,) for user_id, row in statuses.items() if row is None])
+            conn.executemany(
+                f"INSERT OR REPLACE INTO suggestions (idx, {', '.join(SUGGESTION_COLUMNS)}) VALUES ({', '.join('?' * (len(SUGGESTION_COLUMNS) + 1))})",
+                [(idx, *row) for idx, row in suggestions_rows.items()]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO votes (suggestion_idx, user_id, vote) VALUES (?, ?, ?)",
+                [(idx, user_id, vote) for (idx, user_id), vote in votes.items() if vote]
+            )
+            conn.executemany(
+                "DELETE FROM votes WHERE suggestion_idx = ? AND user_id = ?",
+                [key for key, vote in votes.items() if not vote]
+            )
+            conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", list(meta.items()))
+
+    async def load(self):
+        return await asyncio.to_thread(self._read)
+
+    def _read(self):
+        conn = self._connection()
+        statuses_rows = conn.execute("SELECT user_id, status, timestamp FROM statuses ORDER BY position").fetchall()
+        suggestion_rows = conn.execute(f"SELECT idx, {', '.join(SUGGESTION_COLUMNS)} FROM suggestions ORDER BY idx").fetchall()
+        vote_rows = conn.execute("SELECT suggestion_idx, user_id, vote FROM votes").fetchall()
+        meta = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM meta")}
+        return {'statuses': statuses_rows, 'suggestions': suggestion_rows, 'votes': vote_rows, 'meta': meta}
+
+# Toggles a vote atomically: KEYS = upvote set, downvote set; ARGV = user ID, 'upvote' or 'downvote'.
+# Returns the outcome and both tallies so every process sees the same counts.
+REDIS_TOGGLE_VOTE_SCRIPT = """
+local vote_key, other_key = KEYS[1], KEYS[2]
+if ARGV[2] == 'downvote' then
+    vote_key, other_key = KEYS[2], KEYS[1]
+end
+local result = 'added'
+if redis.call('SREM', vote_key, ARGV[1]) == 1 then
+    result = 'removed'
+else
+    redis.call('SADD', vote_key, ARGV[1])
+    redis.call('SREM', other_key, ARGV[1])
+end
+return {result, redis.call('SCARD', KEYS[1]), redis.call('SCARD', KEYS[2])}
+"""
+
+# Raises the counter to at least ARGV[1] (the highest index the caller knows of) and, if ARGV[2]
+# is '1', hands out the next index; a bare INCR would reuse indexes restored from elsewhere
+REDIS_SUGGESTION_COUNTER_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local floor = tonumber(ARGV[1])
+if current < floor then
+    current = floor
+end
+if ARGV[2] == '1' then
+    current = current + 1
+end
+redis.call('SET', KEYS[1], current)
+return current
+"""
+
+# Moves a suggestion from status ARGV[1] to ARGV[2] only if no other process moved it first. The
+# status lives in its own field so a row flushed later by write-behind can't undo a transition.
+REDIS_TRANSITION_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'status')
+if not current then
+    local row = redis.call('HGET', KEYS[1], 'row')
+    if row then
+        current = cjson.decode(row)[tonumber(ARGV[3])]
+    end
+end
+if current and current ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[2])
+return 1
+"""
+
+class RedisStore(WriteBehindStore):
+    # Shared store so several bot processes can serve the same guild. Row writes are flushed
+    # through one non-transactional pipeline per batch; index allocation, vote toggles and status
+    # transitions run server-side in Lua, so concurrent processes never lose updates. Every flush
+    # announces the statuses and suggestions it wrote on a pub/sub channel, and the other
+    # processes re-read those rows through `on_change`.
+    LOAD_CHUNK_SIZE = 1000
+    STATUS_COLUMN = SUGGESTION_COLUMNS.index('status')
+
+    def __init__(self, client, prefix, **kwargs):
+        super().__init__(f"redis:{prefix}", **kwargs)
+        self.redis = client
+        self.prefix = prefix
+        self.instance_id = f"{os.getpid()}-{os.urandom(4).hex()}"
+        self._toggle_vote_script = client.register_script(REDIS_TOGGLE_VOTE_SCRIPT)
+        self._counter_script = client.register_script(REDIS_SUGGESTION_COUNTER_SCRIPT)
+        self._transition_script = client.register_script(REDIS_TRANSITION_SCRIPT)
+        self._listener = None
+
+    def start(self):
+        super().start()
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name=f"{self.name}-changes")
+
+    async def _listen(self):
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._key('changes'))
+                async for message in pubsub.listen():
+                    change = json.loads(message['data'])
+                    if change.get('from') == self.instance_id or self.on_change is None:
+                        continue
+                    try:
+                        await self.on_change(change)
+                    except Exception as e:
+                        print(f"Error applying change from {change.get('from')}: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Lost {self.name} change feed, resubscribing: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _publish(self, pipe, statuses=(), suggestion_indexes=(), meta=()):
+        pipe.publish(self._key('changes'), json.dumps({
+            'from': self.instance_id,
+            'statuses': list(statuses),
+            'suggestions': list(suggestion_indexes),
+            'meta': list(meta),
+        }))
+
+    def _key(self, *parts):
+        return ':'.join((self.prefix, *map(str, parts)))
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await super().close()
+        await self.redis.aclose()
+
+    async def _write_batch(self, statuses, suggestions_rows, votes, meta):
+        pipe = self.redis.pipeline(transaction=False)
+        for user_id, row in statuses.items():
+            if row is None:
+                pipe.hdel(self._key('statuses'), user_id)
+                pipe.zrem(self._key('status_order'), user_id)
+            else:
+                pipe.hset(self._key('statuses'), user_id, json.dumps(row))
+                # NX keeps the time a member first appeared, which is the board order
+                pipe.zadd(self._key('status_order'), {user_id: time.time()}, nx=True)
+        for idx, row in suggestions_rows.items():
+            pipe.hset(self._key('suggestion', idx), 'row', json.dumps(row))
+            pipe.zadd(self._key('suggestions'), {idx: idx})
+        for (idx, user_id), vote in votes.items():
+            up_key, down_key = self._key('suggestion', idx, 'up'), self._key('suggestion', idx, 'down')
+            if vote > 0:
+                pipe.sadd(up_key, user_id)
+                pipe.srem(down_key, user_id)
+            elif vote < 0:
+                pipe.sadd(down_key, user_id)
+                pipe.srem(up_key, user_id)
+            else:
+                pipe.srem(up_key, user_id)
+                pipe.srem(down_key, user_id)
+        if meta:
+            pipe.hset(self._key('meta'), mapping=meta)
+        if statuses or suggestions_rows or meta:
+            self._publish(pipe, statuses, suggestions_rows, meta)
+        await pipe.execute()
+
+    async def load(self):
+        statuses_rows = []
+        order = await self.redis.zrange(self._key('status_order'), 0, -1)
+        rows = await self.redis.hgetall(self._key('statuses'))
+        for user_id in order:
+            row = rows.get(user_id)
+            if row is not None:
+                statuses_rows.append((int(user_id), *json.loads(row)))
+
+        suggestion_rows = []
+        vote_rows = []
+        indexes = [int(idx) for idx in await self.redis.zrange(self._key('suggestions'), 0, -1)]
+        for start in range(0, len(indexes), self.LOAD_CHUNK_SIZE):
+            chunk = indexes[start:start + self.LOAD_CHUNK_SIZE]
+            pipe = self.redis.pipeline(transaction=False)
+            for idx in chunk:
+                pipe.hmget(self._key('suggestion', idx), 'row', 'status')
+                pipe.smembers(self._key('suggestion', idx, 'up'))
+                pipe.smembers(self._key('suggestion', idx, 'down'))
+            results = await pipe.execute()
+            for offset, idx in enumerate(chunk):
+                fields, up, down = results[offset * 3:offset * 3 + 3]
+                row = self._suggestion_row(*fields)
+                if row is None:
+                    continue
+                suggestion_rows.append((idx, *row))
+                vote_rows.extend((idx, int(user_id), 1) for user_id in up)
+                vote_rows.extend((idx, int(user_id), -1) for user_id in down)
+
+        meta = {key: json.loads(value) for key, value in (await self.redis.hgetall(self._key('meta'))).items()}
+        return {'statuses': statuses_rows, 'suggestions': suggestion_rows, 'votes': vote_rows, 'meta': meta}
+
+    def _suggestion_row(self, row, status):
+        if row is None:
+            return None
+        row = json.loads(row)
+        if status is not None:
+            row[self.STATUS_COLUMN] = status
+        return row
+
+    async def next_suggestion_index(self, floor=0):
+        return int(await self._counter_script(keys=[self._key('suggestion_counter')], args=[floor, 1]))
+
+    async def raise_suggestion_counter(self, floor):
+        await self._counter_script(keys=[self._key('suggestion_counter')], args=[floor, 0])
+
+    async def transition_suggestion(self, suggestion_index, old_status, new_status):
+        key = self._key('suggestion', suggestion_index)
+        if not await self._transition_script(keys=[key], args=[old_status, new_status, self.STATUS_COLUMN + 1]):
+            return False
+        pipe = self.redis.pipeline(transaction=False)
+        self._publish(pipe, suggestion_indexes=[suggestion_index])
+        await pipe.execute()
+        return True
+
+    async def toggle_vote(self, suggestion_index, user_id, vote_type):
+        keys = [self._key('suggestion', suggestion_index, 'up'), self._key('suggestion', suggestion_index, 'down')]
+        result, up_count, down_count = await self._toggle_vote_script(keys=keys, args=[user_id, vote_type])
+        return result, int(up_count), int(down_count)
+
+    async def fetch_suggestion(self, suggestion_index):
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(self._key('suggestion', suggestion_index), 'row', 'status')
+        pipe.smembers(self._key('suggestion', suggestion_index, 'up'))
+        pipe.smembers(self._key('suggestion', suggestion_index, 'down'))
+        fields, up, down = await pipe.execute()
+        row = self._suggestion_row(*fields)
+        if row is None:
+            return None
+        return row, [int(user_id) for user_id in up], [int(user_id) for user_id in down]
+
+    async def fetch_meta(self, keys):
+        keys = [key for key in keys if key not in self._meta]
+        if not keys:
+            return {}
+        values = await self.redis.hmget(self._key('meta'), keys)
+        return {key: json.loads(value) for key, value in zip(keys, values) if value is not None}
+
+    async def fetch_statuses(self, user_ids):
+        # Rows this process still has queued are left out; they're newer and its own flush announces them
+        user_ids = [int(user_id) for user_id in user_ids if int(user_id) not in self._statuses]
+        if not user_ids:
+            return []
+        rows = await self.redis.hmget(self._key('statuses'), user_ids)
+        return [(user_id, json.loads(row) if row is not None else None) for user_id, row in zip(user_ids, rows)]
+
+def create_state_store():
+    if STORAGE_BACKEND == 'sqlite':
+        return SQLiteStore(SQLITE_PATH)
+    if STORAGE_BACKEND == 'redis':
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            print("STORAGE_BACKEND is 'redis' but the redis package is not installed, keeping state in memory only.")
+            return StateStore()
+        try:
+            port = int(os.environ.get('REDIS_PORT', 6379))
+        except ValueError:
+            print(f"Invalid REDIS_PORT '{os.environ.get('REDIS_PORT')}', using 6379.")
+            port = 6379
+        client = aioredis.Redis(host=os.environ.get('REDIS_HOST', 'localhost'), port=port, decode_responses=True)
+        return RedisStore(client, REDIS_KEY_PREFIX)
+    if STORAGE_BACKEND != 'memory':
+        print(f"Unknown STORAGE_BACKEND '{STORAGE_BACKEND}', keeping state in memory only.")
+    return StateStore()
+
+state_store = create_state_store()
+
+# --- Suggestion Rankings ---
+SUGGESTION_STATUSES = ('Pending', 'Approved', 'Rejected', 'Implemented')
+
+class SuggestionRanking:
+    # A binary max-heap of suggestion indexes per status, with every suggestion's position
+    # tracked so a score change is sifted into place in O(log n) instead of re-sorting. top(k)
+    # walks the heaps from their roots with a small frontier heap and reads O(k log k) entries.
+    # Equal scores rank the older (lower index) suggestion first.
+    def __init__(self):
+        self.scores = {}     # {index: score}
+        self.statuses = {}   # {index: status}
+        self.heaps = {}      # {status: [index, ...] in heap order}
+        self.positions = {}  # {index: position in its status's heap}
+
+    def clear(self):
+        self.scores.clear()
+        self.statuses.clear()
+        self.heaps.clear()
+        self.positions.clear()
+
+    def _above(self, a, b):
+        score_a, score_b = self.scores[a], self.scores[b]
+        return score_a > score_b or (score_a == score_b and a < b)
+
+    def _sift_up(self, heap, pos):
+        item = heap[pos]
+        while pos:
+            parent = (pos - 1) >> 1
+            if not self._above(item, heap[parent]):
+                break
+            heap[pos] = heap[parent]
+            self.positions[heap[pos]] = pos
+            pos = parent
+        heap[pos] = item
+        self.positions[item] = pos
+
+    def _sift_down(self, heap, pos):
+        item = heap[pos]
+        size = len(heap)
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._above(heap[child + 1], heap[child]):
+                child += 1
+            if not self._above(heap[child], item):
+                break
+            heap[pos] = heap[child]
+            self.positions[heap[pos]] = pos
+            pos = child
+        heap[pos] = item
+        self.positions[item] = pos
+
+    def _remove(self, suggestion_index):
+        heap = self.heaps[self.statuses[suggestion_index]]
+        pos = self.positions.pop(suggestion_index)
+        last = heap.pop()
+        if pos < len(heap):
+            heap[pos] = last
+            self.positions[last] = pos
+            self._sift_up(heap, pos)
+            self._sift_down(heap, self.positions[last])
+
+    def set(self, suggestion_index, score, status):
+        old_status = self.statuses.get(suggestion_index)
+        if old_status == status:
+            old_score = self.scores[suggestion_index]
+            if score == old_score:
+                return
+            self.scores[suggestion_index] = score
+            heap = self.heaps[status]
+            if score > old_score:
+                self._sift_up(heap, self.positions[suggestion_index])
+            else:
+                self._sift_down(heap, self.positions[suggestion_index])
+            return
+        if old_status is not None:
+            self._remove(suggestion_index)
+        self.scores[suggestion_index] = score
+        self.statuses[suggestion_index] = status
+        heap = self.heaps.setdefault(status, [])
+        heap.append(suggestion_index)
+        self._sift_up(heap, len(heap) - 1)
+
+    def rebuild(self):
+        # A list sorted best-first is a valid heap
+        self.heaps = {}
+        for suggestion_index in sorted(self.scores, key=lambda idx: (-self.scores[idx], idx)):
+            self.heaps.setdefault(self.statuses[suggestion_index], []).append(suggestion_index)
+        self.positions = {idx: pos for heap in self.heaps.values() for pos, idx in enumerate(heap)}
+
+    def top(self, count, status=None):
+        # [(index, score)], highest first
+        scores = self.scores
+        frontier = []
+        for heap_status in ((status,) if status else tuple(self.heaps)):
+            heap = self.heaps.get(heap_status)
+            if heap:
+                frontier.append((-scores[heap[0]], heap[0], heap, 0))
+        heapq.heapify(frontier)
+        ranked = []
+        while frontier and len(ranked) < count:
+            neg_score, suggestion_index, heap, pos = heapq.heappop(frontier)
+            ranked.append((suggestion_index, -neg_score))
+            for child in (2 * pos + 1, 2 * pos + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (-scores[heap[child]], heap[child], heap, child))
+        return ranked
+
+    def stats(self):
+        return {'ranked': len(self.scores), 'by_status': {status: len(heap) for status, heap in self.heaps.items()}}
+
+class TrendingRanking:
+    # Time-decayed net votes. Scores are kept relative to `epoch` (a vote at time t weighs
+    # exp(rate * (t - epoch))), so they never need re-decaying: every score shrinks by the same
+    # factor over time and the order only changes when votes arrive. Votes are buffered and
+    # folded into the ranking in batches; the epoch is moved forward before the weights overflow.
+    REBASE_EXPONENT = 600
+
+    def __init__(self, half_life=TRENDING_HALF_LIFE, interval=TRENDING_BATCH_INTERVAL):
+        self.rate = math.log(2) / half_life
+        self.interval = interval
+        self.epoch = time.time()
+        self.ranking = SuggestionRanking()
+        self.pending = {}  # {index: weighted net votes not yet folded in}
+        self.events = 0
+        self.batches = 0
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="trending-ranking")
+
+    def record(self, suggestion_index, net_change):
+        self.events += 1
+        self.pending[suggestion_index] = self.pending.get(suggestion_index, 0.0) + net_change * math.exp(self.rate * (time.time() - self.epoch))
+
+    def move(self, suggestion_index, status):
+        score = self.ranking.scores.get(suggestion_index)
+        if score is not None:
+            self.ranking.set(suggestion_index, score, status)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+    def flush(self):
+        if self.rate * (time.time() - self.epoch) > self.REBASE_EXPONENT:
+            self.rebase()
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, {}
+        self.batches += 1
+        scores = self.ranking.scores
+        for suggestion_index, weight in batch.items():
+            data = suggestions.get(suggestion_index)
+            if data is not None:
+                self.ranking.set(suggestion_index, scores.get(suggestion_index, 0.0) + weight, data.get('status', 'Pending'))
+
+    def rebase(self):
+        now = time.time()
+        factor = math.exp(-self.rate * (now - self.epoch))
+        self.epoch = now
+        self.pending = {idx: weight * factor for idx, weight in self.pending.items()}
+        # Anything that has decayed to nothing is forgotten
+        ranking = self.ranking
+        ranking.scores = {idx: score * factor for idx, score in ranking.scores.items() if abs(score * factor) > 1e-6}
+        ranking.statuses = {idx: ranking.statuses[idx] for idx in ranking.scores}
+        ranking.rebuild()
+
+    def top(self, count, status=None):
+        # [(index, net votes per hour at the current rate)]
+        self.flush()
+        to_now = math.exp(-self.rate * (time.time() - self.epoch))
+        return [(idx, score * to_now * self.rate * 3600) for idx, score in self.ranking.top(count, status)]
+
+    def stats(self):
+        return {**self.ranking.stats(), 'vote_events': self.events, 'batches': self.batches, 'pending': len(self.pending)}
+
+top_suggestions = SuggestionRanking()
+trending_suggestions = TrendingRanking()
+
+def rank_suggestion(suggestion_index, data):
+    votes = data['votes']
+    top_suggestions.set(suggestion_index, votes.up_count - votes.down_count, data.get('status', 'Pending'))
+
+# --- In-Memory Data Management Helpers ---
+async def set_user_status_in_memory(user_id, status_text):
+    # Replacing an existing record keeps its dict slot, so the member keeps their board position
+    record = StatusRecord(user_id, status_text, int(time.time()))
+    user_statuses[user_id] = record
+    data_versions['statuses'] += 1
+    state_store.save_status(record)
+    status_history.record(user_id, record.kind, record.updated_at)
+    status_expiry.schedule(record)
+    return record
+
+async def clear_user_status_in_memory(user_id):
+    if user_statuses.pop(user_id, None) is None:
+        return False
+    data_versions['statuses'] += 1
+    state_store.delete_status(user_id)
+    status_history.record(user_id, STATUS_CLEARED, int(time.time()))
+    return True
+
+async def get_status_embed_message_ids_in_memory():
+    return status_embed_message_ids
+
+async def set_status_embed_message_ids_in_memory(message_ids):
+    global status_embed_message_ids
+    if message_ids != status_embed_message_ids:
+        state_store.set_meta('status_embed_message_ids', message_ids)
+    status_embed_message_ids = message_ids
+
+# Secondary indexes over `suggestions`, kept in step with every write so lookups don't scan the dict
+class SuggestionIndex:
+    def __init__(self):
+        self.by_message_id = {}  # {message_id: index}
+        self.by_status = {}      # {status: {index, ...}}
+        self.by_author = {}      # {author_id: {index, ...}}
+
+    def clear(self):
+        self.by_message_id.clear()
+        self.by_status.clear()
+        self.by_author.clear()
+
+    def add(self, suggestion_index, data):
+        message_id = data.get('message_id')
+        if message_id:
+            self.by_message_id[message_id] = suggestion_index
+        self.by_status.setdefault(data.get('status', 'Pending'), set()).add(suggestion_index)
+        author_id = data.get('author_id')
+        if author_id is not None:
+            self.by_author.setdefault(author_id, set()).add(suggestion_index)
+
+    def update(self, suggestion_index, data, updates):
+        # Must be called before `updates` is applied to `data`
+        if 'message_id' in updates and updates['message_id'] != data.get('message_id'):
+            if data.get('message_id'):
+                self.by_message_id.pop(data['message_id'], None)
+            if updates['message_id']:
+                self.by_message_id[updates['message_id']] = suggestion_index
+        if 'status' in updates and updates['status'] != data.get('status', 'Pending'):
+            old_status = data.get('status', 'Pending')
+            old_bucket = self.by_status.get(old_status)
+            if old_bucket is not None:
+                old_bucket.discard(suggestion_index)
+                if not old_bucket:
+                    del self.by_status[old_status]
+            self.by_status.setdefault(updates['status'], set()).add(suggestion_index)
+        if 'author_id' in updates and updates['author_id'] != data.get('author_id'):
+            if data.get('author_id') is not None:
+                old_bucket = self.by_author.get(data['author_id'])
+                if old_bucket is not None:
+                    old_bucket.discard(suggestion_index)
+                    if not old_bucket:
+                        del self.by_author[data['author_id']]
+            if updates['author_id'] is not None:
+                self.by_author.setdefault(updates['author_id'], set()).add(suggestion_index)
+
+suggestion_indexes = SuggestionIndex()
+
+SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be but by can could do for from get have i if in into is it its just like "
+    "make more of on or our please should so some that the their there this to us we what when "
+    "which will with would you your".split()
+)
+SEARCH_WORD = re.compile(r"[a-z0-9]+")
+
+def search_terms(text):
+    # Lowercased words without stopwords, with a plural 's' trimmed so "emotes" finds "emote"
+    terms = []
+    for word in SEARCH_WORD.findall(text.lower()):
+        if len(word) < 2 or word in SEARCH_STOPWORDS:
+            continue
+        if len(word) > 3 and word[-1] == 's' and word[-2] != 's':
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+# Full-text and near-duplicate index over suggestion_text. Suggestion text never changes after
+# submission, so entries are only ever added.
+class SuggestionSearchIndex:
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    def __init__(self, bands=SUGGESTION_LSH_BANDS, rows=SUGGESTION_LSH_ROWS):
+        self.bands = bands
+        self.rows = rows
+        self.postings = {}  # {term: sorted array('I') of the indexes of suggestions using it}
+        self.repeats = {}   # {term: {index: count}} for the few suggestions using a term more than once
+        self.lengths = {}   # {index: number of terms}
+        self.total_length = 0
+        self.buckets = {}   # {hash of (band, minhashes): index or [index, ...]}
+
+    def clear(self):
+        self.__init__(self.bands, self.rows)
+
+    def minhash(self, terms):
+        # One blake2b digest per distinct term yields all bands * rows 32-bit hashes at once
+        digest_size = 4 * self.bands * self.rows
+        columns = zip(*(memoryview(hashlib.blake2b(term.encode(), digest_size=digest_size).digest()).cast('I') for term in terms))
+        return [min(column) for column in columns]
+
+    def band_keys(self, terms):
+        signature = self.minhash(terms)
+        rows = self.rows
+        return [hash((band, *signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def add(self, suggestion_index, text):
+        if suggestion_index in self.lengths:
+            return
+        terms = search_terms(text)
+        self.lengths[suggestion_index] = len(terms)
+        self.total_length += len(terms)
+        counts = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, count in counts.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = array('I')
+            if postings and postings[-1] > suggestion_index:
+                # Read-through of an older suggestion from a shared store
+                postings.insert(bisect.bisect_left(postings, suggestion_index), suggestion_index)
+            else:
+                postings.append(suggestion_index)
+            if count > 1:
+                self.repeats.setdefault(term, {})[suggestion_index] = count
+        if counts:
+            for key in self.band_keys(counts):
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    self.buckets[key] = suggestion_index
+                elif isinstance(bucket, list):
+                    bucket.append(suggestion_index)
+                else:
+                    self.buckets[key] = [bucket, suggestion_index]
+
+    def search(self, query, limit=SUGGESTION_SEARCH_RESULTS, scan_limit=SUGGESTION_SEARCH_SCAN_LIMIT):
+        # BM25-ranked [(index, score)], best first. Words are taken rarest first. A word with more
+        # than `scan_limit` suggestions only adds to the matches found so far (checked by bisect),
+        # or, if it's the rarest word of the query, contributes its newest `scan_limit` suggestions.
+        doc_count = len(self.lengths)
+        if not doc_count:
+            return []
+        average_length = self.total_length / doc_count or 1.0
+        k1, b = self.BM25_K1, self.BM25_B
+        lengths = self.lengths
+        scores = {}
+        matched = [(self.postings[term], term) for term in set(search_terms(query)) if term in self.postings]
+        for postings, term in sorted(matched, key=lambda match: len(match[0])):
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            if len(postings) <= scan_limit or not scores:
+                candidates = postings[-scan_limit:]
+            else:
+                size = len(postings)
+                candidates = [index for index in scores if (at := bisect.bisect_left(postings, index)) < size and postings[at] == index]
+            term_repeats = self.repeats.get(term)
+            for index in candidates:
+                tf = term_repeats.get(index, 1) if term_repeats else 1
+                norm = k1 * (1 - b + b * lengths[index] / average_length)
+                scores[index] = scores.get(index, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def near_duplicates(self, text, threshold=SUGGESTION_DUPLICATE_THRESHOLD):
+        # [(index, similarity)] of stored suggestions sharing an LSH band with `text` whose word
+        # sets overlap by at least `threshold`, most similar first
+        terms = set(search_terms(text))
+        if not terms:
+            return []
+        candidates = set()
+        for key in self.band_keys(terms):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, list):
+                # A band made only of very common words lands every suggestion using them in one
+                # bucket; real near-duplicates also share a band with rarer words
+                if len(bucket) <= SUGGESTION_LSH_BUCKET_LIMIT:
+                    candidates.update(bucket)
+            else:
+                candidates.add(bucket)
+        matches = []
+        for index in candidates:
+            data = suggestions.get(index)
+            if data is None:
+                continue
+            other = set(search_terms(data['suggestion_text']))
+            similarity = len(terms & other) / len(terms | other)
+            if similarity >= threshold:
+                matches.append((index, similarity))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def stats(self):
+        return {'indexed': len(self.lengths), 'terms': len(self.postings), 'lsh_buckets': len(self.buckets)}
+
+suggestion_search = SuggestionSearchIndex()
+
+async def allocate_suggestion_index():
     global suggestion_counter
-    suggestion_counter += 1
-    suggestions[suggestion_counter] = suggestion_data
-    return suggestion_counter
+    # A shared store hands out indexes so two bot processes never reuse one
+    shared_index = await state_store.next_suggestion_index(suggestion_counter)
+    suggestion_counter = max(suggestion_counter + 1, shared_index or 0)
+    return shared_index or suggestion_counter
+
+async def save_suggestion_in_memory(suggestion_data):
+    new_index = await allocate_suggestion_index()
+    suggestions[new_index] = suggestion_data
+    suggestion_indexes.add(new_index, suggestion_data)
+    suggestion_search.add(new_index, suggestion_data['suggestion_text'])
+    rank_suggestion(new_index, suggestion_data)
+    data_versions['suggestions'] += 1
+    state_store.save_suggestion(new_index, suggestion_data)
+    state_store.set_meta('suggestion_counter', suggestion_counter)
+    return new_index
+
+def cache_stored_suggestion(suggestion_index, row, upvoters=(), downvoters=()):
+    data = dict(zip(SUGGESTION_COLUMNS, row))
+    data['author'] = None
+    data['votes'] = VoteLedger.cold(upvoters, downvoters, (data.get('carried_upvotes') or 0, data.get('carried_downvotes') or 0))
+    suggestions[suggestion_index] = data
+    suggestion_indexes.add(suggestion_index, data)
+    suggestion_search.add(suggestion_index, data.get('suggestion_text') or '')
+    rank_suggestion(suggestion_index, data)
+    data_versions['suggestions'] += 1
+    return data
 
 async def get_suggestion_from_memory(suggestion_index: int):
     data = suggestions.get(suggestion_index)
+    if data is None:
+        # Another bot process may have created it; read through to a shared store
+        stored = await state_store.fetch_suggestion(suggestion_index)
+        if stored:
+            data = cache_stored_suggestion(suggestion_index, *stored)
     if data:
         return {**data, 'index': suggestion_index}
     return None
 
+async def refresh_suggestion_from_store(suggestion_index):
+    # Re-reads a suggestion another bot process changed; nothing is written back
+    stored = await state_store.fetch_suggestion(suggestion_index)
+    if not stored:
+        return suggestions.get(suggestion_index)
+    row, upvoters, downvoters = stored
+    data = suggestions.get(suggestion_index)
+    if data is None:
+        return cache_stored_suggestion(suggestion_index, row, upvoters, downvoters)
+    updates = dict(zip(SUGGESTION_COLUMNS, row))
+    suggestion_indexes.update(suggestion_index, data, updates)
+    data.update(updates)
+    data['votes'] = VoteLedger(upvoters, downvoters, (data.get('carried_upvotes') or 0, data.get('carried_downvotes') or 0))
+    rank_suggestion(suggestion_index, data)
+    trending_suggestions.move(suggestion_index, data.get('status', 'Pending'))
+    data_versions['suggestions'] += 1
+    return data
+
 async def update_suggestion_in_memory(suggestion_index: int, updates: dict):
+    data = suggestions.get(suggestion_index)
+    if data is not None and 'status' in updates and updates['status'] != data.get('status', 'Pending'):
+        # With a shared store only one process may move a suggestion on from a given status
+        if not await state_store.transition_suggestion(suggestion_index, data.get('status', 'Pending'), updates['status']):
+            await refresh_suggestion_from_store(suggestion_index)
+            return False
     if suggestion_index in suggestions:
+        suggestion_indexes.update(suggestion_index, suggestions[suggestion_index], updates)
         suggestions[suggestion_index].update(updates)
+        if 'status' in updates:
+            rank_suggestion(suggestion_index, suggestions[suggestion_index])
+            trending_suggestions.move(suggestion_index, updates['status'])
+        data_versions['suggestions'] += 1
+        state_store.save_suggestion(suggestion_index, suggestions[suggestion_index])
         return True
     return False
 
+async def apply_vote_in_memory(suggestion_index: int, user_id: int, vote_type: str):
+    # Toggles a vote in place and returns 'added' or 'removed' (None if the suggestion is gone)
+    data = suggestions.get(suggestion_index)
+    if data is None:
+        return None
+    ledger = data['votes']
+    net_before = ledger.up_count - ledger.down_count
+    shared = await state_store.toggle_vote(suggestion_index, user_id, vote_type)
+    data_versions['suggestions'] += 1
+    if shared is None:
+        result = ledger.toggle(user_id, vote_type)
+        state_store.save_vote(suggestion_index, user_id, ledger.vote_of(user_id))
+    else:
+        result, up_count, down_count = shared
+        ledger.set_vote(user_id, vote_type if result == 'added' else None)
+        if (ledger.up_count - ledger.carried_up, ledger.down_count - ledger.carried_down) != (up_count, down_count):
+            # Other processes voted since we last looked; resync the voter sets
+            stored = await state_store.fetch_suggestion(suggestion_index)
+            if stored:
+                data['votes'] = VoteLedger(stored[1], stored[2], (ledger.carried_up, ledger.carried_down))
+                data_versions['suggestions'] += 1
+
+    rank_suggestion(suggestion_index, data)
+    votes = data['votes']
+    trending_suggestions.record(suggestion_index, votes.up_count - votes.down_count - net_before)
+    return result
+
+async def load_state_from_store():
+    # One bulk read at startup; the store is only written to afterwards
+    global user_statuses, suggestion_counter, status_embed_message_ids, suggestion_history_checkpoint
+    state = await state_store.load()
+    if not state:
+        return False
+
+    user_statuses = {int(user_id): StatusRecord.from_iso(user_id, status, timestamp) for user_id, status, timestamp in state['statuses']}
+    data_versions['statuses'] += 1
+    # History isn't persisted; seed it with each member's current status from when it was set
+    for record in sorted(user_statuses.values(), key=lambda record: record.updated_at):
+        status_history.record(record.user_id, record.kind, record.updated_at)
+        status_expiry.schedule(record)
+
+    voters = {}
+    for idx, user_id, vote in state['votes']:
+        up, down = voters.setdefault(idx, ([], []))
+        (up if vote > 0 else down).append(user_id)
+
+    suggestions.clear()
+    suggestion_indexes.clear()
+    suggestion_search.clear()
+    top_suggestions.clear()
+    for row in state['suggestions']:
+        idx = row[0]
+        cache_stored_suggestion(idx, row[1:], *voters.get(idx, ((), ())))
+
+    meta = state['meta']
+    suggestion_counter = max(meta.get('suggestion_counter', 0), max(suggestions, default=0))
+    await state_store.raise_suggestion_counter(suggestion_counter)
+    status_embed_message_ids = list(meta.get('status_embed_message_ids', []))
+    suggestion_history_checkpoint = meta.get('suggestion_history_checkpoint')
+    print(f"Loaded {len(user_statuses)} statuses and {len(suggestions)} suggestions from {STORAGE_BACKEND} storage.")
+    return True
+
+async def apply_shared_change(change):
+    # Another bot process flushed these rows; re-read them so both processes serve the same state.
+    # Nothing is written back to the store.
+    global status_embed_message_ids
+    if 'status_embed_message_ids' in change.get('meta', ()):
+        stored = (await state_store.fetch_meta(['status_embed_message_ids'])).get('status_embed_message_ids')
+        if stored is not None and stored != status_embed_message_ids:
+            # The other process posted board pages too; the stored list is the last one written,
+            # so every process edits those and deletes the pages it posted itself
+            status_embed_orphans.update(set(status_embed_message_ids) - set(stored))
+            status_embed_message_ids = list(stored)
+            status_embed_rendered.clear()
+            status_board_refresher.mark_dirty()
+
+    if change.get('statuses'):
+        for user_id, row in await state_store.fetch_statuses(change['statuses']):
+            if row is None:
+                if user_statuses.pop(user_id, None) is not None:
+                    status_history.record(user_id, STATUS_CLEARED, int(time.time()))
+                continue
+            record = StatusRecord.from_iso(user_id, *row)
+            old = user_statuses.get(user_id)
+            if old is not None and (old.kind, old.updated_at) == (record.kind, record.updated_at):
+                continue
+            user_statuses[user_id] = record
+            status_history.record(user_id, record.kind, record.updated_at)
+            status_expiry.schedule(record)
+        data_versions['statuses'] += 1
+        status_board_refresher.mark_dirty()
+
+    for suggestion_index in change.get('suggestions', ()):
+        await refresh_suggestion_from_store(int(suggestion_index))
+
+state_store.on_change = apply_shared_change
+
+def resolve_suggestion_author(suggestion_data, guild=None):
+    # Suggestions loaded from storage only carry author_id; look the member up when it's needed
+    author = suggestion_data.get('author')
+    author_id = suggestion_data.get('author_id')
+    if author is None and author_id:
+        if guild:
+            author = guild.get_member(author_id)
+        if author is None:
+            author = bot.get_user(author_id)
+    return author
+
+async def compact_cold_vote_ledgers(idle_seconds: float):
+    cutoff = time.monotonic() - idle_seconds
+    compacted = 0
+    for data in suggestions.values():
+        ledger = data['votes']
+        if not ledger.compacted and ledger.last_change < cutoff:
+            ledger.compact()
+            compacted += 1
+    return compacted
+
+async def get_suggestion_index_by_message_id_in_memory(message_id: int):
+    return suggestion_indexes.by_message_id.get(message_id)
+
+# --- Outbound REST Scheduler ---
+# Every send, edit and delete goes through one scheduler so bursts of low-value traffic can't
+# delay interaction responses. Jobs run by priority class; jobs on the same route run one at a
+# time (like Discord's per-route buckets); pending jobs that share a merge key collapse into one.
+PRIORITY_INTERACTION = 0     # Interaction responses and direct replies to commands
+PRIORITY_SUGGESTION_EDIT = 1
+PRIORITY_BOARD_EDIT = 2
+PRIORITY_NOTICE = 3          # Logs, DMs and mention auto-replies
+PRIORITY_DELETE = 4
+PRIORITY_NAMES = ('interaction', 'suggestion_edit', 'board_edit', 'notice', 'delete')
+
+class RestJob:
+    __slots__ = ('priority', 'seq', 'route', 'factory', 'merge_key', 'futures', 'submitted')
+
+    def __init__(self, priority, seq, route, factory, merge_key, future):
+        self.priority = priority
+        self.seq = seq
+        self.route = route
+        self.factory = factory
+        self.merge_key = merge_key
+        self.futures = [future]
+        self.submitted = time.monotonic()
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+class RestScheduler:
+    def __init__(self, concurrency=REST_CONCURRENCY, shed_limits=REST_SHED_LIMITS):
+        self.concurrency = concurrency
+        self.shed_limits = shed_limits
+        self._heap = []
+        self._seq = itertools.count()
+        self._pending_by_key = {}
+        self._busy_routes = set()
+        self._parked = {}  # {route: deque of jobs waiting for the route to free up}
+        self._active = 0
+        self._active_background = 0
+        self._wakeup = asyncio.Event()
+        self._dispatcher = None
+        self.depth = [0] * len(PRIORITY_NAMES)
+        self.class_stats = [
+            {'submitted': 0, 'executed': 0, 'merged': 0, 'shed': 0, 'errors': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+            for _ in PRIORITY_NAMES
+        ]
+
+    def submit(self, priority, route, factory, merge_key=None):
+        # Queues `factory` (a zero-argument coroutine function) and returns a future for its result
+        future = asyncio.get_running_loop().create_future()
+        stats = self.class_stats[priority]
+        stats['submitted'] += 1
+        if merge_key is not None:
+            job = self._pending_by_key.get(merge_key)
+            if job is not None:
+                # The newest request supersedes the queued one, e.g. a fresher render of the same embed
+                job.factory = factory
+                job.futures.append(future)
+                stats['merged'] += 1
+                return future
+        limit = self.shed_limits.get(priority)
+        if limit is not None and self.depth[priority] >= limit:
+            stats['shed'] += 1
+            future.set_result(None)
+            return future
+
+        job = RestJob(priority, next(self._seq), route, factory, merge_key, future)
+        heapq.heappush(self._heap, job)
+        self.depth[priority] += 1
+        if merge_key is not None:
+            self._pending_by_key[merge_key] = job
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch(), name="rest-scheduler")
+        self._wakeup.set()
+        return future
+
+    async def call(self, priority, route, factory, merge_key=None):
+        # Queueing and the request itself both count as the caller's REST time
+        with profile_phase('rest'):
+            return await self.submit(priority, route, factory, merge_key)
+
+    def fire(self, priority, route, factory, merge_key=None):
+        # Fire-and-forget variant; failures are logged instead of raised
+        self.submit(priority, route, factory, merge_key).add_done_callback(self._report_failure)
+
+    @staticmethod
+    def _report_failure(future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None and not isinstance(error, discord.NotFound):
+            print(f"Background REST call failed: {error}")
+
+    async def _dispatch(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._heap and self._active < self.concurrency:
+                job = self._heap[0]
+                if job.priority != PRIORITY_INTERACTION and self._active_background >= self.concurrency - 1:
+                    break
+                heapq.heappop(self._heap)
+                if job.merge_key is not None and self._pending_by_key.get(job.merge_key) is job:
+                    del self._pending_by_key[job.merge_key]
+                if job.route is not None and job.route in self._busy_routes:
+                    self._parked.setdefault(job.route, deque()).append(job)
+                    continue
+                self._start(job)
+
+    def _start(self, job):
+        self.depth[job.priority] -= 1
+        self._active += 1
+        if job.priority != PRIORITY_INTERACTION:
+            self._active_background += 1
+        if job.route is not None:
+            self._busy_routes.add(job.route)
+        asyncio.create_task(self._run(job))
+
+    async def _run(self, job):
+        stats = self.class_stats[job.priority]
+        waited = time.monotonic() - job.submitted
+        stats['wait_seconds'] += waited
+        stats['max_wait_seconds'] = max(stats['max_wait_seconds'], waited)
+        try:
+            result = await job.factory()
+        except Exception as e:
+            stats['errors'] += 1
+            for future in job.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in job.futures:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            stats['executed'] += 1
+            self._active -= 1
+            if job.priority != PRIORITY_INTERACTION:
+                self._active_background -= 1
+            if job.route is not None:
+                self._busy_routes.discard(job.route)
+                parked = self._parked.get(job.route)
+                if parked:
+                    heapq.heappush(self._heap, parked.popleft())
+                    if not parked:
+                        del self._parked[job.route]
+            self._wakeup.set()
+
+    def stats(self):
+        classes = {}
+        for priority, name in enumerate(PRIORITY_NAMES):
+            stats = self.class_stats[priority]
+            classes[name] = {
+                **stats,
+                'queued': self.depth[priority],
+                'avg_wait_seconds': stats['wait_seconds'] / stats['executed'] if stats['executed'] else 0.0,
+            }
+        return {'active': self._active, 'queued': sum(self.depth), 'classes': classes}
+
+rest_scheduler = RestScheduler()
+
+def _send_route(destination):
+    if isinstance(destination, (discord.User, discord.Member)):
+        return f"POST /users/{destination.id}/dm"
+    channel = getattr(destination, 'channel', destination)
+    return f"POST /channels/{channel.id}/messages"
+
+async def send_message(destination, *args, priority=PRIORITY_INTERACTION, delete_after=None, **kwargs):
+    # Scheduled replacement for `destination.send(...)`; returns None if the send was shed
+    message = await rest_scheduler.call(priority, _send_route(destination), lambda: destination.send(*args, **kwargs))
+    if message is not None and delete_after is not None:
+        schedule_message_delete(message, delete_after)
+    return message
+
+async def edit_message(message, *, priority, merge_key=None, **kwargs):
+    return await rest_scheduler.call(priority, f"PATCH /channels/{message.channel.id}/messages", lambda: message.edit(**kwargs), merge_key)
+
+def schedule_message_delete(message, delay=None):
+    # Fire-and-forget delete through the deletion service; repeated deletes of one message are dropped
+    if message is None:
+        return
+    deletion_service.schedule(message, delay or 0)
+
+# --- Message Deletion Service ---
+class DeletionService:
+    # Hashed timer wheel of pending deletes, per channel. Each tick, the messages that fell due
+    # together in a channel are removed with one bulk delete (up to 100 per call) at delete priority.
+    BULK_DELETE_LIMIT = 100
+
+    def __init__(self, scheduler, tick=DELETION_TICK, slots=DELETION_WHEEL_SLOTS):
+        self.scheduler = scheduler
+        self.tick = tick
+        self.wheel = [{} for _ in range(slots)]  # slot -> {channel_id: {message_id: due_tick}}
+        self._due = {}       # {message_id: due_tick}
+        self._channels = {}  # {channel_id: channel}
+        self._origin = None
+        self._current_tick = 0
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.scheduled = 0
+        self.duplicates = 0
+        self.bulk_calls = 0
+        self.single_calls = 0
+        self.deleted = 0
+
+    def _tick_at(self, when):
+        return int((when - self._origin) / self.tick)
+
+    def schedule(self, message, delay=0):
+        loop = asyncio.get_running_loop()
+        if self._origin is None:
+            self._origin = loop.time()
+        due = max(self._tick_at(loop.time() + delay), self._current_tick + 1)
+        existing = self._due.get(message.id)
+        if existing is not None:
+            if existing <= due:
+                self.duplicates += 1
+                return
+            # An earlier delete wins over a later one for the same message
+            self.duplicates += 1
+            self.wheel[existing % len(self.wheel)].get(message.channel.id, {}).pop(message.id, None)
+        self.scheduled += 1
+        self._due[message.id] = due
+        self._channels[message.channel.id] = message.channel
+        self.wheel[due % len(self.wheel)].setdefault(message.channel.id, {})[message.id] = due
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="deletion-service")
+        self._wakeup.set()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._due:
+                await self._wakeup.wait()
+                continue
+            # Sleep until the earliest pending delete; scheduling an earlier one wakes us up
+            delay = self._origin + min(self._due.values()) * self.tick - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            now_tick = self._tick_at(loop.time())
+            # Every slot is visited at most once however many ticks passed, so ticks skipped
+            # while asleep or idle cost nothing
+            first = max(self._current_tick + 1, now_tick - len(self.wheel) + 1)
+            for tick in range(first, now_tick + 1):
+                self._advance(tick, now_tick)
+            self._current_tick = max(self._current_tick, now_tick)
+
+    def _advance(self, tick, now_tick):
+        slot = self.wheel[tick % len(self.wheel)]
+        for channel_id in list(slot):
+            pending = slot[channel_id]
+            due_now = [message_id for message_id, due in pending.items() if due <= now_tick]
+            if not due_now:
+                continue
+            for message_id in due_now:
+                del pending[message_id]
+                del self._due[message_id]
+            if not pending:
+                del slot[channel_id]
+            channel = self._channels[channel_id]
+            for start in range(0, len(due_now), self.BULK_DELETE_LIMIT):
+                chunk = due_now[start:start + self.BULK_DELETE_LIMIT]
+                self.scheduler.fire(PRIORITY_DELETE, f"DELETE /channels/{channel_id}/messages", lambda channel=channel, chunk=chunk: self._delete(channel, chunk))
+
+    async def _delete(self, channel, message_ids):
+        if len(message_ids) > 1 and hasattr(channel, 'delete_messages'):
+            try:
+                await channel.delete_messages([discord.Object(id=message_id) for message_id in message_ids])
+                self.bulk_calls += 1
+                self.deleted += len(message_ids)
+                return
+            except discord.HTTPException:
+                # Bulk delete needs Manage Messages and rejects unknown IDs; fall back to one by one
+                pass
+        for message_id in message_ids:
+            self.single_calls += 1
+            try:
+                await channel.get_partial_message(message_id).delete()
+                self.deleted += 1
+            except (discord.NotFound, discord.Forbidden):
+                pass
+
+    def stats(self):
+        return {
+            'scheduled': self.scheduled,
+            'pending': len(self._due),
+            'duplicates_dropped': self.duplicates,
+            'bulk_calls': self.bulk_calls,
+            'single_calls': self.single_calls,
+            'deleted': self.deleted,
+        }
+
+deletion_service = DeletionService(rest_scheduler)
+
+async def defer_interaction(interaction: discord.Interaction):
+    await rest_scheduler.call(PRIORITY_INTERACTION, None, lambda: interaction.response.defer(ephemeral=True))
+
+async def send_interaction_response(interaction: discord.Interaction, content, **kwargs):
+    await rest_scheduler.call(PRIORITY_INTERACTION, None, lambda: interaction.response.send_message(content, **kwargs))
+
+async def send_followup(interaction: discord.Interaction, content, **kwargs):
+    return await rest_scheduler.call(PRIORITY_INTERACTION, None, lambda: interaction.followup.send(content, **kwargs))
+
 # --- Helper Functions for Permissions ---
 async def is_staff(user: discord.Member):
     if user.guild_permissions.administrator:
@@ -112,7 +1884,7 @@ async def log_suggestion_action(suggestion_index: int, moderator: discord.Member
         log_embed.add_field(name="Reason", value=reason, inline=False)
 
     try:
-        await log_channel.send(embed=log_embed)
+        await send_message(log_channel, embed=log_embed, priority=PRIORITY_NOTICE)
     except discord.Forbidden:
         print(f"Bot lacks permissions to send messages in log channel {SUGGESTION_LOG_CHANNEL_ID}.")
 
@@ -196,82 +1968,247 @@ async def notify_suggestion_author(author: discord.Member, status: str, suggesti
         dm_embed.set_footer(text="Thank you for your contribution!")
 
     try:
-        await author.send(embed=dm_embed)
+        await send_message(author, embed=dm_embed, priority=PRIORITY_NOTICE)
     except discord.Forbidden:
         print(f"Cannot send DM to {author.display_name} - DMs are disabled.")
 
+# --- Display Name Cache ---
+class DisplayNameCache:
+    # Board renders read names from here instead of walking every guild per row. Entries are
+    # filled on first lookup and dropped by the member/user events below when a name can change.
+    def __init__(self):
+        self._names = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0  # Bumped whenever a name the board may show is dropped
+
+    def get(self, user_id):
+        name = self._names.get(user_id)
+        if name is not None:
+            self.hits += 1
+            return name
+        self.misses += 1
+        user = bot.get_user(user_id)
+        if user is None:
+            for guild in bot.guilds:
+                user = guild.get_member(user_id)
+                if user: break
+        # Unresolved IDs are cached too so a missing member doesn't cost a guild walk on every
+        # render; on_member_join drops the entry once they show up.
+        name = user.display_name if user else f"User ID: {user_id}"
+        self._names[user_id] = name
+        return name
+
+    def invalidate(self, user_id):
+        if self._names.pop(user_id, None) is None:
+            return False
+        self.invalidations += 1
+        return True
+
+    def stats(self):
+        return {'cached': len(self._names), 'hits': self.hits, 'misses': self.misses, 'invalidations': self.invalidations}
+
+display_names = DisplayNameCache()
+
+def invalidate_display_name(user_id):
+    # A cached name for someone on the board means the board shows it, so refresh the board too
+    if display_names.invalidate(user_id) and user_id in user_statuses:
+        status_board_refresher.mark_dirty()
+
 # --- Embed Creation Functions ---
-def create_status_embed():
+def render_status_rows():
+    # Rows keep the order members first appeared on the board, so a status change
+    # only touches the page that member is already on.
+    get_name = display_names.get
+    return [
+        (f"👤 {get_name(record.user_id)}", f"Status: **{STATUS_KINDS[record.kind]}**\nUpdated: {record.display_time()}")
+        for record in user_statuses.values()
+    ]
+
+def paginate_status_rows(rows):
+    pages = []
+    page = []
+    page_chars = 0
+    for name, value in rows:
+        row_chars = len(name) + len(value)
+        if page and (len(page) >= STATUS_BOARD_PAGE_SIZE or page_chars + row_chars > STATUS_BOARD_PAGE_CHAR_BUDGET):
+            pages.append(tuple(page))
+            page = []
+            page_chars = 0
+        page.append((name, value))
+        page_chars += row_chars
+    if page or not pages:
+        pages.append(tuple(page))
+    return pages
+
+def create_status_embed(page_rows=None, page_number=1):
+    if page_rows is None:
+        page_rows = paginate_status_rows(render_status_rows())[0]
+    title = ":hastag~1: Member Status Board ✨"
+    # No "of N": a page's content must not depend on how many pages follow it, or the board
+    # growing or shrinking by one page would rewrite every page
+    if page_number > 1:
+        title += f" (page {page_number})"
     embed = discord.Embed(
-        title=":hastag~1: Member Status Board ✨",
+        title=title,
         description="Here's what everyone's up to right now!",
         color=discord.Color.blue()
     )
     embed.set_thumbnail(url="https://placehold.co/100x100/ADD8E6/000000?text=Status")
-    sorted_statuses = sorted(user_statuses.items(), key=lambda item: item[1].get('timestamp', ''))
-    if not sorted_statuses:
+    if not page_rows:
         embed.add_field(name="No statuses yet!", value=f"Use a command like `{STATUS_COMMAND_PREFIX}f` to set your status, or `{STATUS_COMMAND_PREFIX}f @user` to set another's.", inline=False)
     else:
-        for user_id_str, status_info in sorted_statuses:
-            status_text = status_info.get('status', 'Unknown')
-            timestamp_str = status_info.get('timestamp', 'N/A')
-            
-            user = bot.get_user(int(user_id_str))
-            if user is None:
-                for guild in bot.guilds:
-                    user = guild.get_member(int(user_id_str))
-                    if user: break
-            
-            user_display_name = user.display_name if user else f"User ID: {user_id_str}"
-            
-            try:
-                dt_object_utc = datetime.datetime.fromisoformat(timestamp_str)
-                if dt_object_utc.tzinfo is None:
-                    dt_object_utc = dt_object_utc.replace(tzinfo=datetime.timezone.utc)
-                unix_timestamp = int(dt_object_utc.timestamp())
-                display_time_discord = f"<t:{unix_timestamp}:R>"
-            except (ValueError, TypeError):
-                display_time_discord = timestamp_str
-
-            embed.add_field(
-                name=f"👤 {user_display_name}",
-                value=f"Status: **{status_text}**\nUpdated: {display_time_discord}",
-                inline=False
-            )
-    embed.set_footer(text=f"Last updated: {datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} (Data is in-memory and resets on bot restart)")
+        for name, value in page_rows:
+            embed.add_field(name=name, value=value, inline=False)
+    embed.set_footer(text=f"Last updated: {datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
     return embed
 
+status_board_page_stats = {'edits': 0, 'sends': 0, 'deletes': 0, 'skipped': 0, 'unchanged_refreshes': 0}
+status_board_version = None  # (statuses version, name invalidations) of the last complete refresh
+
 async def update_status_embed():
+    global status_board_version
     channel = bot.get_channel(STATUS_CHANNEL_ID)
     if not channel:
         print(f"Status channel {STATUS_CHANNEL_ID} not found.")
         return
-    embed = create_status_embed()
+    for message_id in list(status_embed_orphans):
+        status_embed_orphans.discard(message_id)
+        if message_id in status_embed_message_ids:
+            continue  # Adopted back since
+        message = status_embed_messages.pop(message_id, None) or channel.get_partial_message(message_id)
+        try:
+            await rest_scheduler.call(PRIORITY_BOARD_EDIT, f"DELETE /channels/{channel.id}/messages", message.delete)
+        except discord.NotFound:
+            pass
+        status_board_page_stats['deletes'] += 1
+    # Rows are a function of the statuses and the names shown, so if neither changed since the
+    # last complete refresh every page would be skipped anyway; don't even render them
+    version = (data_versions['statuses'], display_names.invalidations)
+    if version == status_board_version and status_embed_rendered:
+        status_board_page_stats['unchanged_refreshes'] += 1
+        return
+    status_board_version = None
+    pages = paginate_status_rows(render_status_rows())
+    page_count = len(pages)
+    message_ids = list(await get_status_embed_message_ids_in_memory())
+    rendered = status_embed_rendered
     try:
-        if status_embed_message_id:
+        for page_index, page_rows in enumerate(pages):
+            content = page_rows
+            if page_index < len(rendered) and page_index < len(message_ids) and rendered[page_index] == content:
+                status_board_page_stats['skipped'] += 1
+                continue
+            embed = create_status_embed(page_rows, page_index + 1)
+            message = None
+            if page_index < len(message_ids):
+                # Edit through a cached partial message so refreshes don't pay for a fetch_message call
+                message = status_embed_messages.get(message_ids[page_index])
+                if message is None:
+                    message = channel.get_partial_message(message_ids[page_index])
+                    status_embed_messages[message.id] = message
+                try:
+                    await edit_message(message, embed=embed, priority=PRIORITY_BOARD_EDIT)
+                    status_board_page_stats['edits'] += 1
+                except discord.NotFound:
+                    status_embed_messages.pop(message.id, None)
+                    message = None
+            if message is None:
+                message = await send_message(channel, embed=embed, priority=PRIORITY_BOARD_EDIT)
+                status_embed_messages[message.id] = message
+                status_board_page_stats['sends'] += 1
+                if page_index < len(message_ids):
+                    message_ids[page_index] = message.id
+                else:
+                    message_ids.append(message.id)
+            if page_index < len(rendered):
+                rendered[page_index] = content
+            else:
+                rendered.append(content)
+
+        # Remove pages left over from when the board was larger
+        for message_id in message_ids[page_count:]:
+            message = status_embed_messages.pop(message_id, None) or channel.get_partial_message(message_id)
             try:
-                message = await channel.fetch_message(status_embed_message_id)
-                await message.edit(embed=embed)
+                await rest_scheduler.call(PRIORITY_BOARD_EDIT, f"DELETE /channels/{channel.id}/messages", message.delete)
             except discord.NotFound:
-                new_message = await channel.send(embed=embed)
-                await set_status_embed_message_id_in_memory(new_message.id)
-        else:
-            new_message = await channel.send(embed=embed)
-            await set_status_embed_message_id_in_memory(new_message.id)
+                pass
+            status_board_page_stats['deletes'] += 1
+        del message_ids[page_count:]
+        del rendered[page_count:]
+        status_board_version = version
     except discord.Forbidden:
         print(f"Bot lacks permissions to edit messages in status channel {STATUS_CHANNEL_ID}.")
+    finally:
+        del rendered[len(message_ids):]
+        await set_status_embed_message_ids_in_memory(message_ids)
+
+# --- Coalescing Refresh Service ---
+class CoalescingRefresher:
+    # Collects "dirty" marks per key and lets a single background task flush each key
+    # at most once per window, so a burst of changes costs one REST call instead of one each.
+    def __init__(self, name, flush, window):
+        self.name = name
+        self.flush = flush
+        self.window = window
+        self.pending = {}  # {key: number of marks since the last flush}
+        self.marks = 0
+        self.flushes = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._last_flush = 0.0
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"{self.name}-refresher")
+
+    def mark_dirty(self, key=None):
+        self.marks += 1
+        self.pending[key] = self.pending.get(key, 0) + 1
+        self._wakeup.set()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            delay = self._last_flush + self.window - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._wakeup.clear()
+            batch, self.pending = self.pending, {}
+            self._last_flush = loop.time()
+            for key, count in batch.items():
+                self.coalesced += count - 1
+                self.flushes += 1
+                try:
+                    await self.flush(key)
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Error flushing {self.name} ({key}): {e}")
+
+    def stats(self):
+        return {
+            'marks': self.marks,
+            'flushes': self.flushes,
+            'coalesced': self.coalesced,
+            'pending': len(self.pending),
+            'errors': self.errors,
+        }
+
+async def _flush_status_board(_key):
+    await update_status_embed()
+
+status_board_refresher = CoalescingRefresher('status-board', _flush_status_board, STATUS_BOARD_REFRESH_WINDOW)
 
 def create_suggestion_embed(suggestion_data):
-    author = suggestion_data['author']
+    author_mention = f"<@{suggestion_data['author_id']}>"
     suggestion_text = suggestion_data['suggestion_text']
     status = suggestion_data.get('status', 'Pending')
-    upvotes_list = suggestion_data.get('upvotes', [])
-    downvotes_list = suggestion_data.get('downvotes', [])
+    votes = suggestion_data['votes']
     rejection_reason = suggestion_data.get('rejection_reason', None)
 
-    upvotes = len(upvotes_list)
-    downvotes = len(downvotes_list)
-
     embed = discord.Embed(
         title="💡 New Suggestion",
         color=0xFFA500 if status == 'Pending' else \
@@ -281,159 +2218,302 @@ def create_suggestion_embed(suggestion_data):
         timestamp=datetime.datetime.now(datetime.timezone.utc)
     )
 
-    embed.add_field(name="Suggested By:", value=f"{author.mention}", inline=False)
+    embed.add_field(name="Suggested By:", value=author_mention, inline=False)
     embed.add_field(name="Suggestion:", value=suggestion_text, inline=False)
     embed.add_field(name="Status:", value=status, inline=True)
-    embed.add_field(name="Votes:", value=f"✅ Upvotes: {upvotes} | ❌ Downvotes: {downvotes}", inline=True)
+    embed.add_field(name="Votes:", value=f"✅ Upvotes: {votes.up_count} | ❌ Downvotes: {votes.down_count}", inline=True)
     if status == 'Rejected' and rejection_reason:
         embed.add_field(name="Reason for Rejection:", value=rejection_reason, inline=False)
     embed.set_footer(text="Use the buttons below to vote or manage this suggestion.")
 
     return embed
 
-async def update_suggestion_message(suggestion_index: int, suggestion_message_id: int):
-    suggestion_channel = bot.get_channel(SUGGESTION_CHANNEL_ID)
-    if not suggestion_channel:
-        print(f"Suggestion channel {SUGGESTION_CHANNEL_ID} not found.")
-        return
-
-    suggestion_data = await get_suggestion_from_memory(suggestion_index)
-    if not suggestion_data:
-        print(f"Suggestion index {suggestion_index} not found in memory.")
-        return
+def suggestion_embed_key(suggestion_data):
+    # Everything the suggestion embed and its buttons show, except the timestamp
+    status = suggestion_data.get('status', 'Pending')
+    votes = suggestion_data['votes']
+    return (
+        suggestion_data['author_id'],
+        suggestion_data['suggestion_text'],
+        status,
+        votes.up_count,
+        votes.down_count,
+        suggestion_data.get('rejection_reason') if status == 'Rejected' else None,
+    )
 
-    embed = create_suggestion_embed(suggestion_data)
+class RenderCache:
+    # Content key of the last edit sent to each message. An edit whose key matches is skipped,
+    # so a vote toggled on and back off within a refresh window costs no REST call.
+    def __init__(self):
+        self._sent = {}  # {message_id: content key}
+        self.claimed = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def claim(self, message_id, key):
+        # True if the edit should go out. The key is stored up front so a concurrent update with
+        # the same content is skipped while the first edit is still queued.
+        if self._sent.get(message_id) == key:
+            self.skipped += 1
+            return False
+        self._sent[message_id] = key
+        self.claimed += 1
+        return True
 
-    try:
-        message = await suggestion_channel.fetch_message(suggestion_message_id)
-        guild = message.guild
-        if not guild:
-            print("Guild not found for suggestion message.")
+    def release(self, message_id):
+        # The claimed edit never landed; the next update has to send it again
+        self._sent.pop(message_id, None)
+        self.failed += 1
+
+    def stats(self):
+        return {'cached': len(self._sent), 'sent': self.claimed - self.failed, 'skipped': self.skipped, 'failed': self.failed}
+
+suggestion_renders = RenderCache()
+
+# --- Status Expiry ---
+class StatusExpiryScheduler:
+    # One task and one min-heap of (expires_at, seq, record) for every status with a TTL. A
+    # record that was replaced or cleared before expiring is skipped when it reaches the top,
+    # and everything due at once is cleared as one batch with one board refresh.
+    def __init__(self, ttls):
+        self.ttls = ttls
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.expired = 0
+        self.batches = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="status-expiry")
+
+    def expires_at(self, record):
+        ttl = self.ttls.get(record.status)
+        return record.updated_at + ttl if ttl and record.updated_at else None
+
+    def schedule(self, record):
+        expires_at = self.expires_at(record)
+        if expires_at is None:
+            return
+        wake = not self._heap or expires_at < self._heap[0][0]
+        heapq.heappush(self._heap, (expires_at, next(self._seq), record))
+        # Superseded entries only leave the heap when they reach the top, so rebuild it if
+        # they ever outnumber the live ones
+        if len(self._heap) > 2 * len(user_statuses) + 1024:
+            self._heap = [entry for entry in self._heap if user_statuses.get(entry[2].user_id) is entry[2]]
+            heapq.heapify(self._heap)
+        if wake:
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            if not self._heap:
+                await self._wakeup.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, self._heap[0][0] - time.time()))
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            try:
+                await self.expire_due()
+            except Exception as e:
+                print(f"Error expiring statuses: {e}")
+
+    async def expire_due(self):
+        now = time.time()
+        expired = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, _, record = heapq.heappop(self._heap)
+            if user_statuses.get(record.user_id) is record and await clear_user_status_in_memory(record.user_id):
+                expired += 1
+        if expired:
+            self.expired += expired
+            self.batches += 1
+            status_board_refresher.mark_dirty()
+        return expired
+
+    def stats(self):
+        return {'scheduled': len(self._heap), 'expired': self.expired, 'batches': self.batches}
+
+status_expiry = StatusExpiryScheduler(STATUS_TTLS)
+
+# --- Persistent Suggestion Buttons ---
+SUGGESTION_BUTTONS = {
+    'upvote': ("Upvote", discord.ButtonStyle.success, "✅"),
+    'downvote': ("Downvote", discord.ButtonStyle.danger, "❌"),
+    'approve': ("Approve", discord.ButtonStyle.green, "✔️"),
+    'reject': ("Reject", discord.ButtonStyle.red, "✖️"),
+    'implement': ("Implement", discord.ButtonStyle.blurple, "⚙️"),
+}
+# Name each click is profiled under
+SUGGESTION_BUTTON_HANDLERS = {
+    'upvote': 'handle_vote',
+    'downvote': 'handle_vote',
+    'approve': 'handle_suggestion_action',
+    'reject': 'handle_suggestion_action',
+    'implement': 'implement_suggestion',
+}
+
+class SuggestionButton(discord.ui.DynamicItem[discord.ui.Button], template=r'(?P<action>upvote|downvote|approve|reject|implement)_(?P<index>[0-9]+)'):
+    # One router for every suggestion button: the action and suggestion index live in the
+    # custom_id, so no per-message View or closure is kept and buttons survive restarts.
+    def __init__(self, action: str, suggestion_index: int):
+        label, style, emoji = SUGGESTION_BUTTONS[action]
+        super().__init__(discord.ui.Button(label=label, style=style, custom_id=f"{action}_{suggestion_index}", emoji=emoji))
+        self.action = action
+        self.suggestion_index = suggestion_index
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match['action'], int(match['index']))
+
+    async def callback(self, interaction: discord.Interaction):
+        profile = start_call_profile(SUGGESTION_BUTTON_HANDLERS[self.action])
+        try:
+            await self.dispatch(interaction)
+        finally:
+            button_latency.observe(self.action, finish_call_profile(profile))
+
+    async def dispatch(self, interaction: discord.Interaction):
+        # Before index allocation survived restarts, several messages were posted with the same
+        # index; only the message the suggestion is stored with may act on it
+        suggestion_data = await get_suggestion_from_memory(self.suggestion_index)
+        if suggestion_data is not None and (interaction.message is None or suggestion_data.get('message_id') != interaction.message.id):
+            await send_interaction_response(interaction, "This is a stale suggestion message; its buttons no longer work. Please use the current post for this suggestion.", ephemeral=True)
             return
 
-        view = discord.ui.View(timeout=None)
+        if self.action == 'upvote' or self.action == 'downvote':
+            await handle_vote(interaction, self.suggestion_index, self.action)
+            return
 
-        # Add Upvote and Downvote buttons (visible to everyone)
-        upvote_button = discord.ui.Button(label="Upvote", style=discord.ButtonStyle.success, custom_id=f"upvote_{suggestion_index}", emoji="✅")
-        downvote_button = discord.ui.Button(label="Downvote", style=discord.ButtonStyle.danger, custom_id=f"downvote_{suggestion_index}", emoji="❌")
+        if not await can_manage_suggestion(interaction.user):
+            await send_interaction_response(interaction, f"You don't have permission to {self.action} suggestions.", ephemeral=True)
+            return
 
-        async def upvote_callback(interaction: discord.Interaction):
-            await handle_vote(interaction, suggestion_index, 'upvote')
+        if self.action == 'approve':
+            await handle_suggestion_action(interaction, self.suggestion_index, 'Approved')
+        elif self.action == 'reject':
+            await handle_suggestion_action(interaction, self.suggestion_index, 'Rejected')
+        else:
+            await implement_suggestion(interaction, self.suggestion_index)
 
-        async def downvote_callback(interaction: discord.Interaction):
-            await handle_vote(interaction, suggestion_index, 'downvote')
+bot.add_dynamic_items(SuggestionButton)
 
-        upvote_button.callback = upvote_callback
-        downvote_button.callback = downvote_callback
+def build_suggestion_view(suggestion_index: int, status: str):
+    view = discord.ui.View(timeout=None)
 
-        view.add_item(upvote_button)
-        view.add_item(downvote_button)
+    # Add Upvote and Downvote buttons (visible to everyone)
+    view.add_item(SuggestionButton('upvote', suggestion_index))
+    view.add_item(SuggestionButton('downvote', suggestion_index))
 
-        # Add Approve, Reject, and Implement buttons (only interactable by Admins and Server Designers)
-        if suggestion_data['status'] in ['Pending', 'Approved', 'Rejected', 'Implemented']:
-            approve_button = discord.ui.Button(label="Approve", style=discord.ButtonStyle.green, custom_id=f"approve_{suggestion_index}", emoji="✔️")
-            reject_button = discord.ui.Button(label="Reject", style=discord.ButtonStyle.red, custom_id=f"reject_{suggestion_index}", emoji="✖️")
+    # Add Approve, Reject, and Implement buttons (only interactable by Admins and Server Designers)
+    if status in ['Pending', 'Approved', 'Rejected', 'Implemented']:
+        view.add_item(SuggestionButton('approve', suggestion_index))
+        view.add_item(SuggestionButton('reject', suggestion_index))
 
-            async def approve_callback(interaction: discord.Interaction):
-                if not await can_manage_suggestion(interaction.user):
-                    await interaction.response.send_message("You don't have permission to approve suggestions.", ephemeral=True)
-                    return
-                await handle_suggestion_action(interaction, suggestion_index, 'Approved')
+    if status == 'Pending':
+        view.add_item(SuggestionButton('implement', suggestion_index))
 
-            async def reject_callback(interaction: discord.Interaction):
-                if not await can_manage_suggestion(interaction.user):
-                    await interaction.response.send_message("You don't have permission to reject suggestions.", ephemeral=True)
-                    return
-                await handle_suggestion_action(interaction, suggestion_index, 'Rejected')
+    # The view is only a layout; clicks are routed by SuggestionButton. Stopping it keeps
+    # discord.py from registering a copy in the view store for every message it's sent with.
+    view.stop()
+    return view
 
-            approve_button.callback = approve_callback
-            reject_button.callback = reject_callback
+async def update_suggestion_message(suggestion_index: int, suggestion_message_id: int):
+    suggestion_channel = bot.get_channel(SUGGESTION_CHANNEL_ID)
+    if not suggestion_channel:
+        print(f"Suggestion channel {SUGGESTION_CHANNEL_ID} not found.")
+        return
 
-            view.add_item(approve_button)
-            view.add_item(reject_button)
+    suggestion_data = await get_suggestion_from_memory(suggestion_index)
+    if not suggestion_data:
+        print(f"Suggestion index {suggestion_index} not found in memory.")
+        return
 
-        if suggestion_data['status'] == 'Pending':
-            implement_button = discord.ui.Button(label="Implement", style=discord.ButtonStyle.blurple, custom_id=f"implement_{suggestion_index}", emoji="⚙️")
+    if not suggestion_renders.claim(suggestion_message_id, suggestion_embed_key(suggestion_data)):
+        return
 
-            async def implement_callback(interaction: discord.Interaction):
-                if not await can_manage_suggestion(interaction.user):
-                    await interaction.response.send_message("You don't have permission to implement suggestions.", ephemeral=True)
-                    return
-                await implement_suggestion(interaction, suggestion_index)
+    with profile_phase('render'):
+        embed = create_suggestion_embed(suggestion_data)
+        view = build_suggestion_view(suggestion_index, suggestion_data['status'])
 
-            implement_button.callback = implement_callback
-            view.add_item(implement_button)
+    sent = False
+    try:
+        message = suggestion_channel.get_partial_message(suggestion_message_id)
+        if not message.guild:
+            print("Guild not found for suggestion message.")
+            return
 
-        await message.edit(embed=embed, view=view)
+        sent = await edit_message(message, embed=embed, view=view, priority=PRIORITY_SUGGESTION_EDIT, merge_key=('suggestion', suggestion_index)) is not None
     except discord.NotFound:
         print(f"Suggestion message {suggestion_message_id} not found in channel {SUGGESTION_CHANNEL_ID}.")
     except discord.Forbidden:
         print(f"Bot lacks permissions to edit message {suggestion_message_id} in channel {SUGGESTION_CHANNEL_ID}.")
+    finally:
+        if not sent:
+            suggestion_renders.release(suggestion_message_id)
+
+async def _flush_suggestion_message(suggestion_index):
+    data = suggestions.get(suggestion_index)
+    if data and data.get('message_id'):
+        await update_suggestion_message(suggestion_index, data['message_id'])
+
+suggestion_message_refresher = CoalescingRefresher('suggestion-messages', _flush_suggestion_message, SUGGESTION_REFRESH_WINDOW)
+vote_stats = {'applied': 0}
+vote_ledger_compactor = None
+
+async def compact_vote_ledgers_loop():
+    while True:
+        await asyncio.sleep(VOTE_LEDGER_COLD_AFTER)
+        await compact_cold_vote_ledgers(VOTE_LEDGER_COLD_AFTER)
 
 async def handle_vote(interaction: discord.Interaction, suggestion_index: int, vote_type: str):
-    await interaction.response.defer(ephemeral=True)
+    await defer_interaction(interaction)
 
     suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not suggestion_data:
-        await interaction.followup.send("Error: Suggestion not found.", ephemeral=True)
+        await send_followup(interaction, "Error: Suggestion not found.", ephemeral=True)
         return
 
     if suggestion_data.get('status') not in ['Pending', 'Approved', 'Rejected', 'Implemented']:
-        await interaction.followup.send("This suggestion cannot be voted on.", ephemeral=True)
+        await send_followup(interaction, "This suggestion cannot be voted on.", ephemeral=True)
         return
 
-    user_id_str = str(interaction.user.id)
-    if user_id_str == str(suggestion_data.get('author').id):
-        await interaction.followup.send("You cannot vote on your own suggestion!", ephemeral=True)
+    if interaction.user.id == suggestion_data.get('author_id'):
+        await send_followup(interaction, "You cannot vote on your own suggestion!", ephemeral=True)
         return
 
     if VOTER_ROLE_IDS and not any(role.id in VOTER_ROLE_IDS for role in interaction.user.roles):
-        await interaction.followup.send("You do not have the required role to vote on suggestions.", ephemeral=True)
+        await send_followup(interaction, "You do not have the required role to vote on suggestions.", ephemeral=True)
         return
 
-    upvotes = set(suggestion_data.get('upvotes', []))
-    downvotes = set(suggestion_data.get('downvotes', []))
-    changed = False
+    with profile_phase('state'):
+        result = await apply_vote_in_memory(suggestion_index, interaction.user.id, vote_type)
+    if result is None:
+        await send_followup(interaction, "Error: Suggestion not found.", ephemeral=True)
+        return
 
-    if vote_type == 'upvote':
-        if user_id_str in upvotes:
-            upvotes.remove(user_id_str)
-            await interaction.followup.send("Your upvote has been removed.", ephemeral=True)
-        else:
-            upvotes.add(user_id_str)
-            if user_id_str in downvotes:
-                downvotes.remove(user_id_str)
-            await interaction.followup.send("You have upvoted this suggestion!", ephemeral=True)
-        changed = True
-    elif vote_type == 'downvote':
-        if user_id_str in downvotes:
-            downvotes.remove(user_id_str)
-            await interaction.followup.send("Your downvote has been removed.", ephemeral=True)
-        else:
-            downvotes.add(user_id_str)
-            if user_id_str in upvotes:
-                upvotes.remove(user_id_str)
-            await interaction.followup.send("You have downvoted this suggestion!", ephemeral=True)
-        changed = True
+    # The tally is live in memory; the embed edit is merged with other votes in the same window
+    vote_stats['applied'] += 1
+    suggestion_message_refresher.mark_dirty(suggestion_index)
 
-    if changed:
-        updated_data = {
-            'upvotes': list(upvotes),
-            'downvotes': list(downvotes)
-        }
-        await update_suggestion_in_memory(suggestion_index, updated_data)
-        await update_suggestion_message(suggestion_index, suggestion_data['message_id'])
+    if result == 'removed':
+        await send_followup(interaction, f"Your {vote_type} has been removed.", ephemeral=True)
+    else:
+        await send_followup(interaction, f"You have {vote_type}d this suggestion!", ephemeral=True)
 
 async def handle_suggestion_action(interaction: discord.Interaction, suggestion_index: int, new_status: str, reason: str = None):
-    await interaction.response.defer(ephemeral=True)
+    await defer_interaction(interaction)
 
     suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not suggestion_data:
-        await interaction.followup.send("Error: Suggestion not found.", ephemeral=True)
+        await send_followup(interaction, "Error: Suggestion not found.", ephemeral=True)
         return
 
     if suggestion_data.get('status') == new_status:
-        await interaction.followup.send(f"This suggestion is already **{new_status}**.", ephemeral=True)
+        await send_followup(interaction, f"This suggestion is already **{new_status}**.", ephemeral=True)
         return
 
     updated_data = {
@@ -442,47 +2522,43 @@ async def handle_suggestion_action(interaction: discord.Interaction, suggestion_
     if new_status == 'Rejected' and reason:
         updated_data['rejection_reason'] = reason
 
-    success = await update_suggestion_in_memory(suggestion_index, updated_data)
+    with profile_phase('state'):
+        success = await update_suggestion_in_memory(suggestion_index, updated_data)
 
     if not success:
-        await interaction.followup.send("Failed to update suggestion status.", ephemeral=True)
+        await send_followup(interaction, "Failed to update suggestion status.", ephemeral=True)
         return
 
     updated_suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not updated_suggestion_data:
-        await interaction.followup.send("Error fetching updated suggestion data.", ephemeral=True)
+        await send_followup(interaction, "Error fetching updated suggestion data.", ephemeral=True)
         return
 
     message_id = updated_suggestion_data.get('message_id')
     if message_id:
         await update_suggestion_message(suggestion_index, message_id)
-        await interaction.followup.send(f"Suggestion successfully marked as **{new_status}**.", ephemeral=True)
+        await send_followup(interaction, f"Suggestion successfully marked as **{new_status}**.", ephemeral=True)
 
-    author = updated_suggestion_data.get('author')
+    author = resolve_suggestion_author(updated_suggestion_data, interaction.guild)
     if author:
         await notify_suggestion_author(author, new_status, updated_suggestion_data['suggestion_text'], reason)
 
     await log_suggestion_action(suggestion_index, interaction.user, new_status, reason)
 
 async def handle_suggestion_action_by_message_id(ctx, message_id: int, new_status: str, reason: str = None):
-    # Find the suggestion with the matching message ID
-    suggestion_index = None
-    for idx, data in suggestions.items():
-        if data.get('message_id') == message_id:
-            suggestion_index = idx
-            break
+    suggestion_index = await get_suggestion_index_by_message_id_in_memory(message_id)
 
     if suggestion_index is None:
-        await ctx.send("**[Bot]** No suggestion found with that message ID.", delete_after=8)
+        await send_message(ctx, "**[Bot]** No suggestion found with that message ID.", delete_after=8)
         return None, None
 
     suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not suggestion_data:
-        await ctx.send("**[Bot]** Error: Suggestion data not found.", delete_after=8)
+        await send_message(ctx, "**[Bot]** Error: Suggestion data not found.", delete_after=8)
         return None, None
 
     if suggestion_data.get('status') != 'Pending':
-        await ctx.send("**[Bot]** This suggestion is no longer pending and cannot be modified.", delete_after=8)
+        await send_message(ctx, "**[Bot]** This suggestion is no longer pending and cannot be modified.", delete_after=8)
         return None, None
 
     updated_data = {
@@ -491,15 +2567,16 @@ async def handle_suggestion_action_by_message_id(ctx, message_id: int, new_statu
     if new_status == 'Rejected' and reason:
         updated_data['rejection_reason'] = reason
 
-    success = await update_suggestion_in_memory(suggestion_index, updated_data)
+    with profile_phase('state'):
+        success = await update_suggestion_in_memory(suggestion_index, updated_data)
 
     if not success:
-        await ctx.send("**[Bot]** Failed to update suggestion status. Please try again.", delete_after=8)
+        await send_message(ctx, "**[Bot]** Failed to update suggestion status. Please try again.", delete_after=8)
         return None, None
 
     updated_suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not updated_suggestion_data:
-        await ctx.send("**[Bot]** Error fetching updated suggestion data.", delete_after=8)
+        await send_message(ctx, "**[Bot]** Error fetching updated suggestion data.", delete_after=8)
         return None, None
 
     message_id = updated_suggestion_data.get('message_id')
@@ -510,23 +2587,23 @@ async def handle_suggestion_action_by_message_id(ctx, message_id: int, new_statu
 
 # --- Special Function for Implementation (Ticket System) ---
 async def implement_suggestion(interaction: discord.Interaction, suggestion_index: int):
-    await interaction.response.defer(ephemeral=True)
+    await defer_interaction(interaction)
 
     suggestion_data = await get_suggestion_from_memory(suggestion_index)
     if not suggestion_data:
-        await interaction.followup.send("Error: Suggestion not found.", ephemeral=True)
+        await send_followup(interaction, "Error: Suggestion not found.", ephemeral=True)
         return
 
     if suggestion_data.get('status') != 'Pending':
-        await interaction.followup.send("This suggestion is no longer pending and cannot be implemented.", ephemeral=True)
+        await send_followup(interaction, "This suggestion is no longer pending and cannot be implemented.", ephemeral=True)
         return
 
     guild = interaction.guild
     if not guild:
-        await interaction.followup.send("This action can only be performed in a server.", ephemeral=True)
+        await send_followup(interaction, "This action can only be performed in a server.", ephemeral=True)
         return
 
-    author = suggestion_data.get('author')
+    author = resolve_suggestion_author(suggestion_data, guild)
     staff_roles = [guild.get_role(r_id) for r_id in STAFF_ROLE_IDS if guild.get_role(r_id)]
 
     # Set up permissions for the private channel
@@ -544,11 +2621,23 @@ async def implement_suggestion(interaction: discord.Interaction, suggestion_inde
     # Create a private channel (not under a category)
     channel_name = f"suggestion-ticket-{suggestion_index}"
     try:
-        discussion_channel = await guild.create_text_channel(
+        discussion_channel = await rest_scheduler.call(PRIORITY_SUGGESTION_EDIT, f"POST /guilds/{guild.id}/channels", lambda: guild.create_text_channel(
             channel_name,
             overwrites=overwrites,
             topic=f"Discussion for suggestion: {suggestion_data.get('suggestion_text')[:100]}..."
-        )
+        ))
+        updated_data = {
+            'status': 'Implemented',
+            'discussion_channel_id': discussion_channel.id
+        }
+        with profile_phase('state'):
+            success = await update_suggestion_in_memory(suggestion_index, updated_data)
+        if not success:
+            # Another bot process handled the suggestion while the channel was being created
+            await rest_scheduler.call(PRIORITY_SUGGESTION_EDIT, f"DELETE /channels/{discussion_channel.id}", lambda: discussion_channel.delete())
+            await send_followup(interaction, "This suggestion is no longer pending and cannot be implemented.", ephemeral=True)
+            return
+
         initial_message_content = (
             f"📋 **Suggestion Discussion Channel**\n"
             f"**Author:** {author.mention if author else suggestion_data.get('author_name')}\n"
@@ -556,44 +2645,494 @@ async def implement_suggestion(interaction: discord.Interaction, suggestion_inde
             f"**Participants:** {', '.join(r.mention for r in staff_roles if r)}\n"
             "Let's discuss the implementation details here!"
         )
-        await discussion_channel.send(initial_message_content)
+        await send_message(discussion_channel, initial_message_content, priority=PRIORITY_SUGGESTION_EDIT)
         
         if author:
-            await discussion_channel.send(f"{author.mention}, your suggestion has been moved to discussion! Please join us here.")
-        
-        updated_data = {
-            'status': 'Implemented',
-            'discussion_channel_id': discussion_channel.id
-        }
-        await update_suggestion_in_memory(suggestion_index, updated_data)
+            await send_message(discussion_channel, f"{author.mention}, your suggestion has been moved to discussion! Please join us here.", priority=PRIORITY_SUGGESTION_EDIT)
 
         message_id = suggestion_data.get('message_id')
         if message_id:
             await update_suggestion_message(suggestion_index, message_id)
-            await interaction.followup.send(f"Suggestion has been marked as **Implemented**. A private discussion channel has been created: {discussion_channel.mention}.", ephemeral=True)
+            await send_followup(interaction, f"Suggestion has been marked as **Implemented**. A private discussion channel has been created: {discussion_channel.mention}.", ephemeral=True)
 
         await notify_suggestion_author(author, 'Implemented', suggestion_data['suggestion_text'])
         await log_suggestion_action(suggestion_index, interaction.user, 'Implemented')
 
     except discord.Forbidden:
-        await interaction.followup.send("Bot lacks permissions to create channels or set overwrites. Please check my role permissions (Manage Channels, Manage Roles).", ephemeral=True)
+        await send_followup(interaction, "Bot lacks permissions to create channels or set overwrites. Please check my role permissions (Manage Channels, Manage Roles).", ephemeral=True)
         return
     except Exception as e:
-        await interaction.followup.send(f"An error occurred while creating the discussion channel: {e}", ephemeral=True)
+        await send_followup(interaction, f"An error occurred while creating the discussion channel: {e}", ephemeral=True)
+        return
+
+# --- Suggestion Rehydration ---
+# Rebuilds suggestions the store doesn't know about from the embeds in the suggestion channel,
+# so their buttons keep working after a restart. Only messages newer than the checkpoint are read.
+SUGGESTION_HISTORY_BATCH_SIZE = 100  # Discord's maximum page size for channel history
+MENTION_PATTERN = re.compile(r'<@!?([0-9]+)>')
+VOTES_PATTERN = re.compile(r'Upvotes: ([0-9]+) \| ❌ Downvotes: ([0-9]+)')
+
+def parse_suggestion_message(message: discord.Message):
+    # Returns (index, data) for a suggestion embed posted by create_suggestion_embed, else None
+    if not message.embeds or message.embeds[0].title != "💡 New Suggestion":
+        return None
+
+    suggestion_index = None
+    for row in message.components:
+        for component in getattr(row, 'children', ()):
+            match = SuggestionButton.__discord_ui_compiled_template__.fullmatch(getattr(component, 'custom_id', None) or '')
+            if match:
+                suggestion_index = int(match['index'])
+                break
+        if suggestion_index is not None:
+            break
+    if suggestion_index is None:
+        return None
+
+    fields = {field.name: field.value for field in message.embeds[0].fields}
+    author_match = MENTION_PATTERN.search(fields.get("Suggested By:", ''))
+    votes_match = VOTES_PATTERN.search(fields.get("Votes:", ''))
+    author_id = int(author_match[1]) if author_match else None
+    author = message.guild.get_member(author_id) if message.guild and author_id else None
+    return suggestion_index, {
+        'author_id': author_id,
+        'author_name': author.display_name if author else None,
+        'suggestion_text': fields.get("Suggestion:", ''),
+        'timestamp': message.created_at.isoformat(),
+        'status': fields.get("Status:", 'Pending'),
+        'rejection_reason': fields.get("Reason for Rejection:"),
+        'message_id': message.id,
+        'carried_upvotes': int(votes_match[1]) if votes_match else 0,
+        'carried_downvotes': int(votes_match[2]) if votes_match else 0,
+    }
+
+async def rehydrate_suggestions_from_history():
+    global suggestion_counter, suggestion_history_checkpoint
+    channel = bot.get_channel(SUGGESTION_CHANNEL_ID)
+    if not channel:
+        print(f"Suggestion channel {SUGGESTION_CHANNEL_ID} not found, skipping rehydration.")
+        return
+
+    started = time.perf_counter()
+    scanned = 0
+    restored = 0
+    reindexed = 0
+    after = discord.Object(suggestion_history_checkpoint) if suggestion_history_checkpoint else None
+    try:
+        # New suggestions are taken while the scan runs, so first move the counter past the
+        # newest indexes in the channel to keep them from reusing one not restored yet
+        newest = 0
+        async for message in channel.history(limit=SUGGESTION_HISTORY_BATCH_SIZE):
+            parsed = parse_suggestion_message(message) if message.author == bot.user else None
+            if parsed is not None:
+                newest = max(newest, parsed[0])
+        if newest > suggestion_counter:
+            suggestion_counter = newest
+            state_store.set_meta('suggestion_counter', suggestion_counter)
+            await state_store.raise_suggestion_counter(suggestion_counter)
+
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            scanned += 1
+            suggestion_history_checkpoint = message.id
+            if message.author != bot.user or message.id in suggestion_indexes.by_message_id:
+                continue
+            parsed = parse_suggestion_message(message)
+            if parsed is None:
+                continue
+            idx, data = parsed
+            duplicate_of = suggestions[idx].get('message_id') if idx in suggestions else None
+            if duplicate_of is not None:
+                # Before the counter survived restarts several messages were posted with the same
+                # index. The first one keeps it; later ones get a fresh index and their buttons
+                # are re-rendered so clicks reach the right suggestion.
+                old_idx, idx = idx, await allocate_suggestion_index()
+                print(f"Suggestion message {message.id} reuses index {old_idx} of message {duplicate_of}; moved to #{idx}.")
+                reindexed += 1
+            elif idx in suggestions:
+                continue
+            data = cache_stored_suggestion(idx, tuple(data.get(column) for column in SUGGESTION_COLUMNS))
+            state_store.save_suggestion(idx, data)
+            suggestion_counter = max(suggestion_counter, idx)
+            restored += 1
+            if duplicate_of is not None:
+                await update_suggestion_message(idx, message.id)
+            if scanned % SUGGESTION_HISTORY_BATCH_SIZE == 0:
+                state_store.set_meta('suggestion_history_checkpoint', suggestion_history_checkpoint)
+    except discord.Forbidden:
+        print(f"Bot lacks permissions to read history in suggestion channel {SUGGESTION_CHANNEL_ID}.")
+    except discord.HTTPException as e:
+        # Runs in the background, so nothing else would report it; the checkpoint lets the next start resume
+        print(f"Suggestion rehydration stopped early: {e}")
+    finally:
+        if suggestion_history_checkpoint:
+            state_store.set_meta('suggestion_history_checkpoint', suggestion_history_checkpoint)
+        if restored:
+            state_store.set_meta('suggestion_counter', suggestion_counter)
+            await state_store.raise_suggestion_counter(suggestion_counter)
+    print(f"Rehydrated {restored} suggestions ({reindexed} with a reused index) from {scanned} messages in {time.perf_counter() - started:.2f}s.")
+
+# --- Mention Auto-Replies ---
+STATUS_MENTION_RESPONSES = {
+    "Do Later": "Hey! {name} is busy and will get to it later. 🚧",
+    "Sleeping": "Shhh! {name} is sleeping. 😴",
+    "Free": "Good news! {name} is free! ✅",
+    "Studying Right Now": "{name} is studying right now. 📚",
+    "Outside": "{name} is outside and will see your message later. 🚶‍♂️",
+    "On Break": "{name} is on a break. ☕"
+}
+
+class TTLCache:
+    # Bounded set of keys that expire after `ttl` seconds. Every entry has the same TTL, so
+    # insertion order is expiry order and expired keys are always at the front.
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._expiry = OrderedDict()
+
+    def _evict(self, now):
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now and len(self._expiry) <= self.max_size:
+                break
+            del self._expiry[key]
+
+    def add_if_absent(self, key):
+        # Returns True and starts the cooldown if `key` isn't cooling down, otherwise False
+        now = time.monotonic()
+        self._evict(now)
+        if key in self._expiry:
+            return False
+        self._expiry[key] = now + self.ttl
+        self._evict(now)
+        return True
+
+    def restart(self, key):
+        # Restarts the cooldown of `key` from now
+        self._expiry.pop(key, None)
+        self._expiry[key] = time.monotonic() + self.ttl
+
+    def discard(self, key):
+        self._expiry.pop(key, None)
+
+    def __len__(self):
+        return len(self._expiry)
+
+mention_reply_cooldowns = TTLCache(MENTION_REPLY_COOLDOWN, MENTION_REPLY_CACHE_SIZE)
+mention_reply_stats = {'sent': 0, 'suppressed': 0, 'shed': 0}
+
+async def reply_with_mentioned_statuses(message):
+    # One reply per message covering every mentioned member with a status
+    lines = []
+    keys = []
+    seen = set()
+    for user_mentioned in message.mentions:
+        if user_mentioned.id in seen:
+            continue
+        seen.add(user_mentioned.id)
+        record = user_statuses.get(user_mentioned.id)
+        if record is None:
+            continue
+        # Claimed now so a burst of messages gets one reply; the cooldown itself runs from the
+        # moment the reply is sent and is dropped if it never is
+        key = (message.channel.id, user_mentioned.id)
+        if not mention_reply_cooldowns.add_if_absent(key):
+            mention_reply_stats['suppressed'] += 1
+            continue
+        keys.append(key)
+        status_text = record.status
+        template = STATUS_MENTION_RESPONSES.get(status_text, "{name}'s status: '{status}'.")
+        lines.append(template.format(name=user_mentioned.display_name, status=status_text))
+
+    if not lines:
+        return
+    response_message_text = "\n".join(lines)
+    if len(response_message_text) > 2000:
+        response_message_text = response_message_text[:1997] + "..."
+    bot_reply = None
+    try:
+        bot_reply = await send_message(message.channel, response_message_text, reference=message, priority=PRIORITY_NOTICE)
+    except discord.Forbidden:
+        pass
+    finally:
+        for key in keys:
+            if bot_reply is None:
+                mention_reply_cooldowns.discard(key)
+            else:
+                mention_reply_cooldowns.restart(key)
+    if bot_reply is None:
+        # Shed by the scheduler under load, or not allowed to post here
+        mention_reply_stats['shed'] += 1
+        return
+    mention_reply_stats['sent'] += 1
+    schedule_message_delete(bot_reply, 8)
+
+# --- Metrics ---
+def prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class LatencyHistogram:
+    # Per-label latency histogram rendered in the Prometheus text format. Counts are kept per
+    # bucket and only made cumulative when rendered.
+    def __init__(self, name, help_text, label, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = buckets
+        self.series = {}  # {label value: [per-bucket counts (last one is +Inf), sum of observations]}
+
+    def observe(self, label_value, seconds):
+        series = self.series.get(label_value)
+        if series is None:
+            series = self.series[label_value] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, seconds)] += 1
+        series[1] += seconds
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for label_value, (counts, total) in list(self.series.items()):
+            label = f'{self.label}="{prometheus_label(label_value)}"'
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label}}} {total}")
+            lines.append(f"{self.name}_count{{{label}}} {cumulative}")
+
+command_latency = LatencyHistogram('statusbot_command_duration_seconds', 'Time spent running prefix commands.', 'command')
+button_latency = LatencyHistogram('statusbot_button_duration_seconds', 'Time spent handling suggestion button clicks.', 'action')
+phase_latency = LatencyHistogram('statusbot_call_phase_duration_seconds', 'Time spent per phase of a command or button call.', 'call_phase')
+
+# Sampled periodically so a scrape doesn't walk every suggestion
+runtime_metrics = {'loop_lag': 0.0, 'loop_lag_max': 0.0, 'statuses': 0, 'suggestions': 0, 'suggestion_voters': 0}
+metrics_sampler = None
+
+async def sample_runtime_metrics_loop():
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + METRICS_SAMPLE_INTERVAL
+        await asyncio.sleep(METRICS_SAMPLE_INTERVAL)
+        lag = max(0.0, loop.time() - expected)
+        runtime_metrics['loop_lag'] = lag
+        runtime_metrics['loop_lag_max'] = max(runtime_metrics['loop_lag_max'], lag)
+        runtime_metrics['statuses'] = len(user_statuses)
+        runtime_metrics['suggestions'] = len(suggestions)
+        runtime_metrics['suggestion_voters'] = sum(len(data['votes']) for data in suggestions.values())
+
+def bot_is_ready():
+    # Ready means logged in with a live gateway connection, not merely that the process is up
+    return bot.is_ready() and not bot.is_closed() and math.isfinite(bot.latency)
+
+def render_metrics():
+    lines = []
+
+    def gauge(name, help_text, value, kind='gauge'):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {value}")
+
+    gauge('statusbot_gateway_connected', 'Whether the Discord gateway connection is up.', int(bot_is_ready()))
+    if math.isfinite(bot.latency):
+        gauge('statusbot_gateway_latency_seconds', 'Discord gateway heartbeat latency.', bot.latency)
+    gauge('statusbot_event_loop_lag_seconds', 'Event loop lag at the last sample.', runtime_metrics['loop_lag'])
+    gauge('statusbot_event_loop_lag_max_seconds', 'Largest event loop lag sampled since startup.', runtime_metrics['loop_lag_max'])
+    gauge('statusbot_statuses', 'Member statuses held in memory.', runtime_metrics['statuses'])
+    gauge('statusbot_suggestions', 'Suggestions held in memory.', runtime_metrics['suggestions'])
+    gauge('statusbot_suggestion_voters', 'Votes held in memory across all suggestions.', runtime_metrics['suggestion_voters'])
+
+    route_stats = list(rest_http_stats.items())
+    for field, name, help_text in (
+        ('calls', 'statusbot_rest_calls_total', 'Discord REST HTTP requests by route, retries included.'),
+        ('errors', 'statusbot_rest_errors_total', 'Discord REST HTTP requests that failed or got an error status, by route.'),
+        ('rate_limited', 'statusbot_rest_rate_limited_total', 'Discord REST HTTP requests answered with 429, by route.'),
+    ):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for route, stats in route_stats:
+            lines.append(f'{name}{{route="{prometheus_label(route)}"}} {stats[field]}')
+
+    renders = suggestion_renders.stats()
+    lines.append("# HELP statusbot_embed_edits_total Embed edits sent or skipped because nothing visible changed.")
+    lines.append("# TYPE statusbot_embed_edits_total counter")
+    for target, sent, skipped in (
+        ('suggestion', renders['sent'], renders['skipped']),
+        ('status_board', status_board_page_stats['edits'], status_board_page_stats['skipped']),
+    ):
+        lines.append(f'statusbot_embed_edits_total{{target="{target}",result="sent"}} {sent}')
+        lines.append(f'statusbot_embed_edits_total{{target="{target}",result="skipped"}} {skipped}')
+
+    command_latency.render(lines)
+    button_latency.render(lines)
+    phase_latency.render(lines)
+    return "\n".join(lines) + "\n"
+
+# --- Profiling ---
+class CallProfile:
+    # Timings of one command or button call. Phases are summed, so a phase entered twice
+    # (e.g. two REST calls) is reported once.
+    __slots__ = ('name', 'started', 'phases', 'duration', 'finished_at')
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.phases = {}  # {phase: seconds}
+        self.duration = None
+        self.finished_at = None
+
+    def add(self, phase, seconds):
+        # Tasks spawned during the call inherit it through the context; ignore them once it's done
+        if self.duration is None:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def summary(self):
+        return {
+            'call': self.name,
+            'seconds': round(self.duration, 6),
+            'finished_at': datetime.datetime.fromtimestamp(self.finished_at, datetime.timezone.utc).isoformat(),
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+        }
+
+current_call_profile = contextvars.ContextVar('current_call_profile', default=None)
+
+@contextlib.contextmanager
+def profile_phase(phase):
+    profile = current_call_profile.get()
+    if profile is None:
+        yield
         return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(phase, time.perf_counter() - started)
+
+class SlowCallLog:
+    # The slowest calls of the last `window` seconds: a min-heap capped at `size`, so a new
+    # call only has to beat the fastest one kept. Expired entries are dropped on insert.
+    def __init__(self, size, window):
+        self.size = size
+        self.window = window
+        self.heap = []  # [(duration, seq, CallProfile)]
+        self.seq = itertools.count()
+
+    def record(self, profile):
+        cutoff = time.time() - self.window
+        if self.heap and self.heap[0][2].finished_at < cutoff:
+            self.heap = [entry for entry in self.heap if entry[2].finished_at >= cutoff]
+            heapq.heapify(self.heap)
+        entry = (profile.duration, next(self.seq), profile)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, entry)
+        elif profile.duration > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def entries(self):
+        cutoff = time.time() - self.window
+        return [profile.summary() for _, _, profile in sorted(self.heap, reverse=True) if profile.finished_at >= cutoff]
+
+slow_calls = SlowCallLog(SLOW_CALL_LOG_SIZE, SLOW_CALL_WINDOW)
+
+def start_call_profile(name):
+    profile = CallProfile(name)
+    current_call_profile.set(profile)
+    return profile
+
+def finish_call_profile(profile):
+    profile.duration = time.perf_counter() - profile.started
+    profile.finished_at = time.time()
+    # Whatever isn't covered by a phase (permission checks, lookups, awaiting the loop) is 'other'
+    profile.phases['other'] = max(0.0, profile.duration - sum(profile.phases.values()))
+    for phase, seconds in profile.phases.items():
+        phase_latency.observe(f"{profile.name}/{phase}", seconds)
+    slow_calls.record(profile)
+    if profile.duration >= SLOW_CALL_THRESHOLD:
+        breakdown = ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in profile.phases.items())
+        print(f"Slow call {profile.name}: {profile.duration * 1000:.0f}ms ({breakdown})")
+    return profile.duration
+
+@bot.before_invoke
+async def start_command_timer(ctx):
+    ctx.call_profile = start_call_profile(ctx.command.qualified_name)
+
+@bot.after_invoke
+async def record_command_latency(ctx):
+    profile = getattr(ctx, 'call_profile', None)
+    if profile is not None:
+        command_latency.observe(ctx.command.qualified_name, finish_call_profile(profile))
+
+class SamplingProfiler:
+    # Samples the event loop thread's stack from a helper thread every `interval` seconds and
+    # counts identical stacks, producing the collapsed format flamegraph tools read.
+    def __init__(self, interval=PROFILER_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.running = False
+
+    @staticmethod
+    def _frame_label(frame):
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _collect(self, thread_id, seconds):
+        stacks = {}
+        own_frames = sys._current_frames
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            frame = own_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                stacks[key] = stacks.get(key, 0) + 1
+            time.sleep(self.interval)
+        return stacks
+
+    async def run(self, seconds):
+        # Returns (path of the collapsed-stack file, samples taken)
+        self.running = True
+        try:
+            stacks = await asyncio.to_thread(self._collect, threading.get_ident(), seconds)
+        finally:
+            self.running = False
+        os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_OUTPUT_DIR, f"profile-{datetime.datetime.now(datetime.timezone.utc):%Y%m%dT%H%M%SZ}.folded")
+        with open(path, 'w') as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return path, sum(stacks.values())
+
+sampling_profiler = SamplingProfiler()
 
 # --- Discord Bot Events ---
+startup_complete = False
+history_rehydration = None
+
 @bot.event
 async def on_ready():
     print(f'Logged in as {bot.user} (ID: {bot.user.id})')
-    global user_statuses, suggestions, status_embed_message_id, suggestion_counter
-    user_statuses.clear()
-    suggestions.clear()
-    status_embed_message_id = None
-    suggestion_counter = 0
-
-    await update_status_embed()
-    print("Bot is ready. All data (statuses, suggestions) is stored in-memory and will be lost on bot restart.")
+    global vote_ledger_compactor, metrics_sampler, startup_complete, history_rehydration
+    # State is loaded from the store before login and on_ready fires again on every reconnect,
+    # so nothing here may wipe it; the one-time work is guarded by startup_complete.
+    status_board_refresher.start()
+    suggestion_message_refresher.start()
+    status_expiry.start()
+    trending_suggestions.start()
+    if vote_ledger_compactor is None or vote_ledger_compactor.done():
+        vote_ledger_compactor = asyncio.create_task(compact_vote_ledgers_loop())
+    if metrics_sampler is None or metrics_sampler.done():
+        metrics_sampler = asyncio.create_task(sample_runtime_metrics_loop())
+    # Through the refresher, which may already be flushing expiries; two refreshes at once would
+    # both post a missing page
+    status_board_refresher.mark_dirty()
+    if not startup_complete:
+        startup_complete = True
+        # A full history scan can take minutes; the bot serves commands meanwhile
+        history_rehydration = asyncio.create_task(rehydrate_suggestions_from_history(), name="suggestion-rehydration")
+    if STORAGE_BACKEND == 'memory':
+        print("Bot is ready. All data (statuses, suggestions) is stored in-memory and will be lost on bot restart.")
+    else:
+        print(f"Bot is ready. Statuses and suggestions are persisted with the {STORAGE_BACKEND} backend.")
 
 @bot.event
 async def on_message(message):
@@ -601,55 +3140,52 @@ async def on_message(message):
         return
 
     if message.mentions and bot.user not in message.mentions:
-        for user_mentioned in message.mentions:
-            user_id_str = str(user_mentioned.id)
-            if user_id_str in user_statuses:
-                status_info = user_statuses[user_id_str]
-                status_text = status_info.get('status', 'Unknown')
-                responses = {
-                    "Do Later": f"Hey! {user_mentioned.display_name} is busy and will get to it later. 🚧",
-                    "Sleeping": f"Shhh! {user_mentioned.display_name} is sleeping. 😴",
-                    "Free": f"Good news! {user_mentioned.display_name} is free! ✅",
-                    "Studying Right Now": f"{user_mentioned.display_name} is studying right now. 📚",
-                    "Outside": f"{user_mentioned.display_name} is outside and will see your message later. 🚶‍♂️",
-                    "On Break": f"{user_mentioned.display_name} is on a break. ☕"
-                }
-                response_message_text = responses.get(status_text, f"{user_mentioned.display_name}'s status: '{status_text}'.")
-                try:
-                    bot_reply = await message.channel.send(response_message_text, reference=message)
-                    await bot_reply.delete(delay=8)
-                except discord.Forbidden:
-                    pass
+        await reply_with_mentioned_statuses(message)
 
     await bot.process_commands(message)
 
+@bot.event
+async def on_member_update(before, after):
+    if before.display_name != after.display_name:
+        invalidate_display_name(after.id)
+
+@bot.event
+async def on_user_update(before, after):
+    if before.display_name != after.display_name:
+        invalidate_display_name(after.id)
+
+@bot.event
+async def on_member_join(member):
+    invalidate_display_name(member.id)
+
+@bot.event
+async def on_member_remove(member):
+    invalidate_display_name(member.id)
+
 @bot.event
 async def on_command_error(ctx, error):
     if isinstance(error, commands.CommandNotFound):
         if ctx.message.content.startswith(STATUS_COMMAND_PREFIX) or \
            ctx.message.content.startswith(SUGGESTION_COMMAND_PREFIX) or \
            ctx.message.content.startswith(bot.user.mention):
-            await ctx.send(f"**[Bot]** That command doesn't exist! Use `{STATUS_COMMAND_PREFIX}statushelp` or `{SUGGESTION_COMMAND_PREFIX}suggesthelp`.", delete_after=8)
+            await send_message(ctx, f"**[Bot]** That command doesn't exist! Use `{STATUS_COMMAND_PREFIX}statushelp` or `{SUGGESTION_COMMAND_PREFIX}suggesthelp`.", delete_after=8)
         return
     elif isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(f"**[Bot]** Missing argument. Please check the command syntax.", delete_after=8)
+        await send_message(ctx, f"**[Bot]** Missing argument. Please check the command syntax.", delete_after=8)
     elif isinstance(error, commands.BadArgument):
-        await ctx.send(f"**[Bot]** Invalid argument. Please provide a valid message ID (a number).", delete_after=8)
+        await send_message(ctx, f"**[Bot]** Invalid argument. Please provide a valid message ID (a number).", delete_after=8)
     elif isinstance(error, commands.CommandOnCooldown):
-        await ctx.send(f"**[Bot]** Command on cooldown. Try again in {error.retry_after:.2f} seconds.", delete_after=8)
+        await send_message(ctx, f"**[Bot]** Command on cooldown. Try again in {error.retry_after:.2f} seconds.", delete_after=8)
     elif isinstance(error, commands.MissingPermissions) or isinstance(error, commands.BotMissingPermissions):
-        await ctx.send("**[Bot]** I don't have the necessary permissions for that, or you don't.", delete_after=8)
+        await send_message(ctx, "**[Bot]** I don't have the necessary permissions for that, or you don't.", delete_after=8)
     elif isinstance(error, commands.NoPrivateMessage):
-        await ctx.send("**[Bot]** This command cannot be used in private messages.", delete_after=8)
+        await send_message(ctx, "**[Bot]** This command cannot be used in private messages.", delete_after=8)
     else:
-        await ctx.send(f"**[Bot]** An unexpected error occurred: `{error}`", delete_after=8)
+        await send_message(ctx, f"**[Bot]** An unexpected error occurred: `{error}`", delete_after=8)
 
 # --- Status Commands ---
 async def process_status_command(ctx, status_text, creative_response, target_user: discord.Member = None):
-    try:
-        await ctx.message.delete(delay=5)
-    except discord.Forbidden:
-        pass
+    schedule_message_delete(ctx.message, 5)
 
     if target_user:
         if ctx.author.id == target_user.id:
@@ -658,8 +3194,7 @@ async def process_status_command(ctx, status_text, creative_response, target_use
             pass
         else:
             try:
-                bot_response = await ctx.send(f"**[Bot]** {ctx.author.mention}, you do not have permission to set {target_user.display_name}'s status.", delete_after=8)
-                await bot_response.delete(delay=8)
+                await send_message(ctx, f"**[Bot]** {ctx.author.mention}, you do not have permission to set {target_user.display_name}'s status.", delete_after=8)
             except discord.Forbidden:
                 pass
             return
@@ -674,16 +3209,10 @@ async def process_status_command(ctx, status_text, creative_response, target_use
         response_display_name = ctx.author.display_name
         final_creative_response = creative_response
 
-    user_id_str = str(user_to_set_status_for.id)
-    user_statuses[user_id_str] = {
-        'status': status_text,
-        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat()
-    }
-    await set_all_user_statuses_in_memory(user_statuses)
-    await update_status_embed()
+    await set_user_status_in_memory(user_to_set_status_for.id, status_text)
+    status_board_refresher.mark_dirty()
     try:
-        bot_response = await ctx.send(f"**[Bot]** {response_mention}, {final_creative_response}")
-        await bot_response.delete(delay=8)
+        await send_message(ctx, f"**[Bot]** {response_mention}, {final_creative_response}", delete_after=8)
     except discord.Forbidden:
         pass
 
@@ -713,78 +3242,107 @@ async def on_break(ctx, target: discord.Member = None):
 
 @bot.command(name='clearstatus')
 async def clear_status(ctx, target: discord.Member = None):
-    try:
-        await ctx.message.delete(delay=5)
-    except discord.Forbidden:
-        pass
+    schedule_message_delete(ctx.message, 5)
 
     user_to_clear_status_for = target if target else ctx.author
 
     if user_to_clear_status_for.id != ctx.author.id and not await is_staff(ctx.author):
         try:
-            bot_response = await ctx.send(f"**[Bot]** {ctx.author.mention}, you do not have permission to clear {user_to_clear_status_for.display_name}'s status.", delete_after=8)
-            await bot_response.delete(delay=8)
+            await send_message(ctx, f"**[Bot]** {ctx.author.mention}, you do not have permission to clear {user_to_clear_status_for.display_name}'s status.", delete_after=8)
         except discord.Forbidden:
             pass
         return
 
-    user_id_str = str(user_to_clear_status_for.id)
-    if user_id_str in user_statuses:
-        del user_statuses[user_id_str]
-        await set_all_user_statuses_in_memory(user_statuses)
-        await update_status_embed()
+    if await clear_user_status_in_memory(user_to_clear_status_for.id):
+        status_board_refresher.mark_dirty()
         try:
-            bot_response = await ctx.send(f"**[Bot]** {user_to_clear_status_for.mention}'s status has been cleared! 🤔")
-            await bot_response.delete(delay=8)
+            await send_message(ctx, f"**[Bot]** {user_to_clear_status_for.mention}'s status has been cleared! 🤔", delete_after=8)
         except discord.Forbidden:
             pass
     else:
         try:
-            bot_response = await ctx.send(f"**[Bot]** No status to clear for {user_to_clear_status_for.display_name}! 🤔")
-            await bot_response.delete(delay=8)
+            await send_message(ctx, f"**[Bot]** No status to clear for {user_to_clear_status_for.display_name}! 🤔", delete_after=8)
         except discord.Forbidden:
             pass
 
 @bot.command(name='status')
 async def show_status(ctx, target: discord.Member = None):
-    try:
-        await ctx.message.delete(delay=5)
-    except discord.Forbidden:
-        pass
+    schedule_message_delete(ctx.message, 5)
 
     user_to_show_status_for = target if target else ctx.author
-    user_id_str = str(user_to_show_status_for.id)
     
     response = ""
-    if user_id_str in user_statuses:
-        status_info = user_statuses[user_id_str]
-        status_text = status_info.get('status', 'Unknown')
-        timestamp_str = status_info.get('timestamp', 'N/A')
-
-        try:
-            dt_object_utc = datetime.datetime.fromisoformat(timestamp_str)
-            if dt_object_utc.tzinfo is None:
-                dt_object_utc = dt_object_utc.replace(tzinfo=datetime.timezone.utc)
-            unix_timestamp = int(dt_object_utc.timestamp())
-            display_time_discord = f"<t:{unix_timestamp}:R>"
-        except (ValueError, TypeError):
-            display_time_discord = timestamp_str
-
-        response = f"{user_to_show_status_for.display_name}'s status: **{status_text}** (Updated: {display_time_discord})"
+    record = user_statuses.get(user_to_show_status_for.id)
+    if record is not None:
+        response = f"{user_to_show_status_for.display_name}'s status: **{record.status}** (Updated: {record.display_time()})"
+        expires_at = status_expiry.expires_at(record)
+        if expires_at is not None:
+            response += f", expires <t:{expires_at}:R>"
     else:
         response = f"No status set for {user_to_show_status_for.display_name}. Use `{STATUS_COMMAND_PREFIX}f`, `{STATUS_COMMAND_PREFIX}s`, etc., to set one!"
     try:
-        bot_response = await ctx.send(f"**[Bot]** {response}")
-        await bot_response.delete(delay=8)
+        await send_message(ctx, f"**[Bot]** {response}", delete_after=8)
     except discord.Forbidden:
         pass
 
+@bot.command(name='statushistory')
+async def show_status_history(ctx, target: discord.Member = None):
+    schedule_message_delete(ctx.message, 5)
+
+    user_to_show = target if target else ctx.author
+    entries = status_history.recent(user_to_show.id, 10)
+    if not entries:
+        await send_message(ctx, f"**[Bot]** No status history for {user_to_show.display_name} yet.", delete_after=8)
+        return
+
+    lines = []
+    for code, epoch in entries:
+        status_text = "*Cleared*" if code == STATUS_CLEARED else f"**{STATUS_KINDS[code]}**"
+        lines.append(f"<t:{epoch}:R> → {status_text}")
+    history_embed = discord.Embed(
+        title=f"🕒 Status History: {user_to_show.display_name}",
+        description="\n".join(lines),
+        color=discord.Color.blue()
+    )
+    history_embed.set_footer(text="Most recent changes first.")
+    await send_message(ctx, embed=history_embed, delete_after=30)
+
+@bot.command(name='statusstats')
+async def show_status_stats(ctx, target: Optional[discord.Member] = None, days: int = STATUS_STATS_DEFAULT_DAYS):
+    schedule_message_delete(ctx.message, 5)
+
+    days = max(1, min(days, 365))
+    now = int(time.time())
+    since = now - days * 86400
+    totals = {}
+    if target is not None:
+        status_history.time_per_status(target.id, since, now, totals)
+        scope = target.display_name
+    else:
+        for user_id in list(status_history.user_ids_logged()):
+            status_history.time_per_status(user_id, since, now, totals)
+        scope = "Everyone"
+
+    if not totals:
+        await send_message(ctx, f"**[Bot]** No status activity for {scope} in the last {days} day(s).", delete_after=8)
+        return
+
+    grand_total = sum(totals.values())
+    lines = [
+        f"**{STATUS_KINDS[code]}**: {format_duration(seconds)} ({seconds * 100 // grand_total}%)"
+        for code, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    ]
+    stats_embed = discord.Embed(
+        title=f"📊 Status Stats: {scope}",
+        description="\n".join(lines),
+        color=discord.Color.blue()
+    )
+    stats_embed.set_footer(text=f"Time spent per status over the last {days} day(s).")
+    await send_message(ctx, embed=stats_embed, delete_after=30)
+
 @bot.command(name='statushelp')
 async def status_help(ctx):
-    try:
-        await ctx.message.delete(delay=5)
-    except discord.Forbidden:
-        pass
+    schedule_message_delete(ctx.message, 5)
     help_embed = discord.Embed(
         title="📚 Status System Help 📚",
         description="Quick guide to managing your availability!",
@@ -807,6 +3365,8 @@ async def status_help(ctx):
             f"`{STATUS_COMMAND_PREFIX}b [mention]` - Set status to 'On Break'\n"
             f"`{STATUS_COMMAND_PREFIX}clearstatus [mention]` - Clear your/mentioned user's status\n"
             f"`{STATUS_COMMAND_PREFIX}status [mention]` - Show your/mentioned user's current status\n"
+            f"`{STATUS_COMMAND_PREFIX}statushistory [mention]` - Show recent status changes\n"
+            f"`{STATUS_COMMAND_PREFIX}statusstats [mention] [days]` - Time spent per status over the last N days\n"
             f"`{STATUS_COMMAND_PREFIX}statushelp` - Show this help message"
         ),
         inline=False
@@ -819,25 +3379,60 @@ async def status_help(ctx):
         ),
         inline=False
     )
-    help_embed.set_footer(text="Note: All status data is in-memory and resets when the bot restarts.")
-    await ctx.send(embed=help_embed)
+    help_embed.set_footer(text=f"Note: Statuses stay on the board until you clear or change them. {', '.join(STATUS_TTLS)} clear themselves after a while.")
+    await send_message(ctx, embed=help_embed)
 
 # --- Suggestion System Commands ---
+duplicate_confirmations = {}  # {(author_id, suggestion text): monotonic deadline for posting it anyway}
+
+def format_suggestion_match(guild, suggestion_index):
+    data = suggestions[suggestion_index]
+    text = data['suggestion_text']
+    if len(text) > 100:
+        text = text[:97] + "..."
+    line = f"**#{suggestion_index}** ({data.get('status', 'Pending')}, ✅ {data['votes'].up_count} ❌ {data['votes'].down_count}) {text}"
+    if guild and data.get('message_id'):
+        line += f" [Jump](https://discord.com/channels/{guild.id}/{SUGGESTION_CHANNEL_ID}/{data['message_id']})"
+    return line
+
+def join_embed_lines(lines, limit=EMBED_DESCRIPTION_LIMIT):
+    # Drops whole lines from the end rather than letting Discord reject the embed
+    lines = list(lines)
+    text = "\n".join(lines)
+    while len(text) > limit and lines:
+        lines.pop()
+        text = "\n".join(lines) + "\n…and more not shown"
+    return text
+
 @bot.command(name='suggest')
 async def submit_suggestion(ctx, *, suggestion: str):
     if not ctx.guild:
-        await ctx.send("**[Bot]** Suggestions can only be submitted in a server channel.", delete_after=8)
+        await send_message(ctx, "**[Bot]** Suggestions can only be submitted in a server channel.", delete_after=8)
         return
 
     if not suggestion:
-        await ctx.send(f"**[Bot]** Please provide a suggestion! Usage: `{SUGGESTION_COMMAND_PREFIX}suggest <your suggestion>`", delete_after=8)
+        await send_message(ctx, f"**[Bot]** Please provide a suggestion! Usage: `{SUGGESTION_COMMAND_PREFIX}suggest <your suggestion>`", delete_after=8)
         return
 
     # Delete the user's command message after 4 seconds
-    try:
-        await ctx.message.delete(delay=4)
-    except discord.Forbidden:
-        pass
+    schedule_message_delete(ctx.message, 4)
+
+    # Near-duplicates are pointed out first; sending the same suggestion again within the window posts it anyway
+    duplicates = suggestion_search.near_duplicates(suggestion)
+    confirm_key = (ctx.author.id, suggestion.strip().lower())
+    now = time.monotonic()
+    if duplicates and duplicate_confirmations.pop(confirm_key, 0) < now:
+        for key in [key for key, expires in duplicate_confirmations.items() if expires < now]:
+            del duplicate_confirmations[key]
+        duplicate_confirmations[confirm_key] = now + SUGGESTION_DUPLICATE_CONFIRM_WINDOW
+        warning_embed = discord.Embed(
+            title="🔁 Similar Suggestions Exist",
+            description="\n".join(format_suggestion_match(ctx.guild, idx) for idx, _ in duplicates[:3]),
+            color=0xFFA500
+        )
+        warning_embed.set_footer(text=f"Vote on one of these instead, or send the same suggestion again within {SUGGESTION_DUPLICATE_CONFIRM_WINDOW // 60} minutes to post it anyway.")
+        await send_message(ctx, embed=warning_embed, delete_after=SUGGESTION_DUPLICATE_CONFIRM_WINDOW)
+        return
 
     # Post a temporary confirmation embed in the guide channel
     guide_channel = bot.get_channel(GUIDE_CHANNEL_ID)
@@ -851,19 +3446,19 @@ async def submit_suggestion(ctx, *, suggestion: str):
         )
         confirmation_embed.set_footer(text="This message will auto-delete in 8 seconds.")
         try:
-            bot_response = await guide_channel.send(embed=confirmation_embed)
-            await bot_response.delete(delay=8)
+            await send_message(guide_channel, embed=confirmation_embed, delete_after=8)
         except discord.Forbidden:
             pass
 
     # Store the suggestion data
     suggestion_data = {
         'author': ctx.author,
+        'author_id': ctx.author.id,
+        'author_name': ctx.author.display_name,
         'suggestion_text': suggestion,
         'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
         'status': 'Pending',
-        'upvotes': [],
-        'downvotes': [],
+        'votes': VoteLedger(),
         'message_id': None
     }
 
@@ -874,55 +3469,10 @@ async def submit_suggestion(ctx, *, suggestion: str):
     if suggestion_channel:
         initial_embed = create_suggestion_embed(suggestion_data)
 
-        view = discord.ui.View(timeout=None)
-        upvote_button = discord.ui.Button(label="Upvote", style=discord.ButtonStyle.success, custom_id=f"upvote_{suggestion_index}", emoji="✅")
-        downvote_button = discord.ui.Button(label="Downvote", style=discord.ButtonStyle.danger, custom_id=f"downvote_{suggestion_index}", emoji="❌")
-
-        async def upvote_callback(interaction: discord.Interaction):
-            await handle_vote(interaction, suggestion_index, 'upvote')
-
-        async def downvote_callback(interaction: discord.Interaction):
-            await handle_vote(interaction, suggestion_index, 'downvote')
-
-        upvote_button.callback = upvote_callback
-        downvote_button.callback = downvote_callback
-
-        view.add_item(upvote_button)
-        view.add_item(downvote_button)
-
-        # Add management buttons (only interactable by Admins and Server Designers)
-        approve_button = discord.ui.Button(label="Approve", style=discord.ButtonStyle.green, custom_id=f"approve_{suggestion_index}", emoji="✔️")
-        reject_button = discord.ui.Button(label="Reject", style=discord.ButtonStyle.red, custom_id=f"reject_{suggestion_index}", emoji="✖️")
-        implement_button = discord.ui.Button(label="Implement", style=discord.ButtonStyle.blurple, custom_id=f"implement_{suggestion_index}", emoji="⚙️")
-
-        async def approve_callback(interaction: discord.Interaction):
-            if not await can_manage_suggestion(interaction.user):
-                await interaction.response.send_message("You don't have permission to approve suggestions.", ephemeral=True)
-                return
-            await handle_suggestion_action(interaction, suggestion_index, 'Approved')
-
-        async def reject_callback(interaction: discord.Interaction):
-            if not await can_manage_suggestion(interaction.user):
-                await interaction.response.send_message("You don't have permission to reject suggestions.", ephemeral=True)
-                return
-            await handle_suggestion_action(interaction, suggestion_index, 'Rejected')
-
-        async def implement_callback(interaction: discord.Interaction):
-            if not await can_manage_suggestion(interaction.user):
-                await interaction.response.send_message("You don't have permission to implement suggestions.", ephemeral=True)
-                return
-            await implement_suggestion(interaction, suggestion_index)
-
-        approve_button.callback = approve_callback
-        reject_button.callback = reject_callback
-        implement_button.callback = implement_callback
-
-        view.add_item(approve_button)
-        view.add_item(reject_button)
-        view.add_item(implement_button)
+        view = build_suggestion_view(suggestion_index, suggestion_data['status'])
 
         try:
-            suggestion_message = await suggestion_channel.send(embed=initial_embed, view=view)
+            suggestion_message = await send_message(suggestion_channel, embed=initial_embed, view=view, priority=PRIORITY_SUGGESTION_EDIT)
             await update_suggestion_in_memory(suggestion_index, {'message_id': suggestion_message.id})
         except discord.Forbidden:
             print(f"Bot lacks permissions to send messages in suggestion channel {SUGGESTION_CHANNEL_ID}.")
@@ -936,10 +3486,56 @@ async def submit_suggestion(ctx, *, suggestion: str):
         )
         dm_embed.add_field(name="Suggestion", value=suggestion, inline=False)
         dm_embed.set_footer(text="You will be notified of any updates!")
-        await ctx.author.send(embed=dm_embed)
+        await send_message(ctx.author, embed=dm_embed, priority=PRIORITY_NOTICE)
     except discord.Forbidden:
         pass
 
+@bot.command(name='suggestsearch')
+async def search_suggestions(ctx, *, terms: str):
+    matches = suggestion_search.search(terms)
+    if not matches:
+        await send_message(ctx, f"**[Bot]** No suggestions match `{terms}`.", delete_after=8)
+        return
+    embed = discord.Embed(
+        title=f"🔎 Suggestions matching \"{terms[:100]}\"",
+        description=join_embed_lines(format_suggestion_match(ctx.guild, idx) for idx, _ in matches),
+        color=0x7289DA
+    )
+    embed.set_footer(text=f"Top {len(matches)} of {len(suggestions)} suggestions, best match first.")
+    await send_message(ctx, embed=embed)
+
+async def send_suggestion_ranking(ctx, title, count, status, rank):
+    # `rank(count, status)` returns [(index, line prefix)], best first
+    count = max(1, min(count or SUGGESTION_RANKING_DEFAULT_COUNT, SUGGESTION_RANKING_MAX_COUNT))
+    if status:
+        status = status.capitalize()
+        if status not in SUGGESTION_STATUSES:
+            await send_message(ctx, f"**[Bot]** Unknown status. Use one of: {', '.join(SUGGESTION_STATUSES)}.", delete_after=8)
+            return
+    rows = rank(count, status)
+    if not rows:
+        await send_message(ctx, "**[Bot]** No suggestions to rank yet.", delete_after=8)
+        return
+    embed = discord.Embed(
+        title=f"{title} ({status})" if status else title,
+        description=join_embed_lines(f"{prefix} {format_suggestion_match(ctx.guild, idx)}" for idx, prefix in rows),
+        color=0x7289DA
+    )
+    await send_message(ctx, embed=embed)
+
+@bot.command(name='topsuggestions')
+async def top_suggestions_command(ctx, count: Optional[int] = None, status: str = None):
+    await send_suggestion_ranking(ctx, "🏆 Top Suggestions", count, status, lambda count, status: [
+        (idx, f"`{score:+d}`") for idx, score in top_suggestions.top(count, status)
+    ])
+
+@bot.command(name='trending')
+async def trending_suggestions_command(ctx, count: Optional[int] = None, status: str = None):
+    # Suggestions whose votes have only decayed away are left out
+    await send_suggestion_ranking(ctx, "🔥 Trending Suggestions", count, status, lambda count, status: [
+        (idx, f"`{rate:+.1f}/h`") for idx, rate in trending_suggestions.top(count, status) if rate > 0.05
+    ])
+
 @bot.command(name='denied')
 @commands.check(lambda ctx: any(role.id in STAFF_ROLE_IDS for role in ctx.author.roles))
 async def deny_suggestion(ctx, message_id: int, *, reason: str):
@@ -947,12 +3543,12 @@ async def deny_suggestion(ctx, message_id: int, *, reason: str):
     if suggestion_index is None or updated_suggestion_data is None:
         return
 
-    author = updated_suggestion_data.get('author')
+    author = resolve_suggestion_author(updated_suggestion_data, ctx.guild)
     if author:
         await notify_suggestion_author(author, 'Rejected', updated_suggestion_data['suggestion_text'], reason)
 
     await log_suggestion_action(suggestion_index, ctx.author, 'Rejected', reason)
-    await ctx.send(f"**[Bot]** Suggestion with message ID {message_id} successfully marked as **Rejected** with reason: {reason}", delete_after=8)
+    await send_message(ctx, f"**[Bot]** Suggestion with message ID {message_id} successfully marked as **Rejected** with reason: {reason}", delete_after=8)
 
 @bot.command(name='approved')
 @commands.check(lambda ctx: any(role.id in STAFF_ROLE_IDS for role in ctx.author.roles))
@@ -961,12 +3557,12 @@ async def approve_suggestion(ctx, message_id: int):
     if suggestion_index is None or updated_suggestion_data is None:
         return
 
-    author = updated_suggestion_data.get('author')
+    author = resolve_suggestion_author(updated_suggestion_data, ctx.guild)
     if author:
         await notify_suggestion_author(author, 'Approved', updated_suggestion_data['suggestion_text'])
 
     await log_suggestion_action(suggestion_index, ctx.author, 'Approved')
-    await ctx.send(f"**[Bot]** Suggestion with message ID {message_id} successfully marked as **Approved**.", delete_after=8)
+    await send_message(ctx, f"**[Bot]** Suggestion with message ID {message_id} successfully marked as **Approved**.", delete_after=8)
 
 @bot.command(name='suggesthelp')
 async def suggest_help(ctx):
@@ -978,7 +3574,19 @@ async def suggest_help(ctx):
     help_embed.add_field(
         name="📝 Submit a Suggestion",
         value=f"Go to <#{GUIDE_CHANNEL_ID}> and use `{SUGGESTION_COMMAND_PREFIX}suggest <your suggestion>` to submit a suggestion.\n"
-              f"**Example:** `{SUGGESTION_COMMAND_PREFIX}suggest Add a new game night event!`",
+              f"**Example:** `{SUGGESTION_COMMAND_PREFIX}suggest Add a new game night event!`\n"
+              f"If it looks like an existing suggestion you'll be shown the similar ones first.",
+        inline=False
+    )
+    help_embed.add_field(
+        name="🔎 Find a Suggestion",
+        value=f"Use `{SUGGESTION_COMMAND_PREFIX}suggestsearch <words>` to find existing suggestions, best match first.",
+        inline=False
+    )
+    help_embed.add_field(
+        name="🏆 Rankings",
+        value=f"`{SUGGESTION_COMMAND_PREFIX}topsuggestions [count] [status]` lists the highest net scores.\n"
+              f"`{SUGGESTION_COMMAND_PREFIX}trending [count] [status]` lists what's gaining votes fastest right now.",
         inline=False
     )
     help_embed.add_field(
@@ -995,26 +3603,187 @@ async def suggest_help(ctx):
             value=f"Staff roles: {staff_roles_mentions}\n"
                   f"• Use `{SUGGESTION_COMMAND_PREFIX}approved <message_id>` to approve a suggestion.\n"
                   f"• Use `{SUGGESTION_COMMAND_PREFIX}denied <message_id> <reason>` to reject a suggestion with a reason.\n"
+                  f"• Use `{SUGGESTION_COMMAND_PREFIX}slowcalls` to list the slowest recent commands and clicks, or `{SUGGESTION_COMMAND_PREFIX}profile [seconds]` to record a flamegraph profile.\n"
                   f"• When a suggestion is implemented, a private channel is created for discussion with the author.\n"
                   f"• To get the message ID, right-click the suggestion embed in <#{SUGGESTION_CHANNEL_ID}> and copy the ID.",
             inline=False
         )
-    help_embed.set_footer(text="Suggestions are stored in-memory and reset on bot restart.")
-    await ctx.send(embed=help_embed)
+    help_embed.set_footer(text="Suggestions and votes are kept across bot restarts.")
+    await send_message(ctx, embed=help_embed)
 
-# --- Run Flask (Optional Web Server) ---
-def run_flask():
-    if not app.debug and not app.testing and not threading.current_thread().name == 'MainThread':
-        app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+# --- Staff Diagnostics Commands ---
+@bot.command(name='profile')
+@commands.check(lambda ctx: any(role.id in STAFF_ROLE_IDS for role in ctx.author.roles))
+async def profile_bot(ctx, seconds: int = 10):
+    if sampling_profiler.running:
+        await send_message(ctx, "**[Bot]** A profile is already being recorded.", delete_after=8)
+        return
+    seconds = max(1, min(seconds, PROFILER_MAX_SECONDS))
+    await send_message(ctx, f"**[Bot]** Sampling the bot for {seconds}s...", delete_after=seconds + 5)
+    path, samples = await sampling_profiler.run(seconds)
+    print(f"Profile with {samples} samples written to {path}.")
+    await send_message(ctx, f"**[Bot]** Collected {samples} samples into `{path}` (collapsed stacks, ready for flamegraph.pl).", file=discord.File(path))
 
-@app.route('/health')
-def health_check():
-    return jsonify({"status": "healthy", "message": "Discord Bot is running!"})
+@bot.command(name='slowcalls')
+@commands.check(lambda ctx: any(role.id in STAFF_ROLE_IDS for role in ctx.author.roles))
+async def slow_calls_command(ctx):
+    entries = slow_calls.entries()
+    if not entries:
+        await send_message(ctx, "**[Bot]** No calls recorded yet.", delete_after=8)
+        return
+    lines = []
+    for entry in entries[:10]:
+        breakdown = ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in entry['phases'].items())
+        lines.append(f"`{entry['call']}` **{entry['seconds'] * 1000:.0f}ms** ({breakdown})")
+    embed = discord.Embed(title="🐢 Slowest Calls", description="\n".join(lines), color=0xFFA500)
+    embed.set_footer(text=f"Slowest of the last {SLOW_CALL_WINDOW // 60} minutes.")
+    await send_message(ctx, embed=embed)
+
+# --- Web Server ---
+async def start_web_server():
+    app = web.Application()
+    app.add_routes(web_routes)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, '0.0.0.0', WEB_PORT).start()
+    print(f"Web server listening on port {WEB_PORT}.")
+    return runner
+
+@web_routes.get('/')
+async def home(request):
+    return web.Response(text="I'm alive!")
+
+@web_routes.get('/metrics')
+async def metrics(request):
+    return web.Response(body=render_metrics().encode(), headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'})
+
+# --- JSON API ---
+# Read-only views for dashboards. Bodies are serialized once per data version and reused until
+# something changes, and clients polling with If-None-Match get a bodiless 304 meanwhile.
+# Snowflake IDs are strings because JSON numbers lose precision past 2**53.
+API_BOOT_ID = f"{int(time.time()):x}"  # Keeps ETags from a previous run from matching
+
+class ApiResponseCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # {(endpoint, query): (version, etag, body)}
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(self, key, version, build):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        body = json.dumps({'version': version, **build()}, separators=(',', ':')).encode()
+        entry = self._entries[key] = (version, f'"{API_BOOT_ID}-{version}"', body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self):
+        return {'cached': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'not_modified': self.not_modified}
+
+api_cache = ApiResponseCache()
+
+def api_response(request, kind, query, build):
+    _, etag, body = api_cache.get((kind, query), data_versions[kind], build)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match and (if_none_match.strip() == '*' or etag in (tag.strip().removeprefix('W/') for tag in if_none_match.split(','))):
+        api_cache.not_modified += 1
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type='application/json', headers=headers)
+
+def api_error(message):
+    return web.json_response({'error': message}, status=400)
+
+def serialize_suggestion(suggestion_index, data):
+    # Plain fields only; never the cached discord.Member under data['author']
+    votes = data['votes']
+    return {
+        'index': suggestion_index,
+        'author_id': str(data['author_id']) if data.get('author_id') is not None else None,
+        'author_name': data.get('author_name'),
+        'text': data.get('suggestion_text'),
+        'status': data.get('status', 'Pending'),
+        'rejection_reason': data.get('rejection_reason'),
+        'timestamp': data.get('timestamp'),
+        'message_id': str(data['message_id']) if data.get('message_id') else None,
+        'upvotes': votes.up_count,
+        'downvotes': votes.down_count,
+    }
+
+@web_routes.get('/api/suggestions')
+async def api_suggestions(request):
+    status = request.query.get('status') or None
+    try:
+        cursor = int(request.query.get('cursor', 0))
+        limit = max(1, min(int(request.query.get('limit', API_PAGE_SIZE)), API_PAGE_SIZE))
+    except ValueError:
+        return api_error("cursor and limit must be integers")
+
+    def build():
+        candidates = suggestion_indexes.by_status.get(status, ()) if status else suggestions.keys()
+        page = heapq.nsmallest(limit + 1, (idx for idx in candidates if idx > cursor))
+        has_more = len(page) > limit
+        page = page[:limit]
+        return {
+            'suggestions': [serialize_suggestion(idx, suggestions[idx]) for idx in page],
+            'next_cursor': page[-1] if has_more else None,
+        }
+
+    return api_response(request, 'suggestions', (status, cursor, limit), build)
+
+@web_routes.get('/api/statuses')
+async def api_statuses(request):
+    def build():
+        return {'statuses': [
+            {'user_id': str(record.user_id), 'status': STATUS_KINDS[record.kind], 'updated_at': record.updated_at or None}
+            for record in user_statuses.values()
+        ]}
+
+    return api_response(request, 'statuses', None, build)
+
+@web_routes.get('/health')
+async def health_check(request):
+    ready = bot_is_ready()
+    return web.json_response({
+        "status": "healthy" if ready else "unavailable",
+        "message": "Discord Bot is running!" if ready else "Discord Bot is not connected to the gateway.",
+        "gateway_latency": bot.latency if math.isfinite(bot.latency) else None,
+    }, status=200 if ready else 503)
+
+# Subsystem counters for a human or a dashboard; /health stays small for load balancer probes
+@web_routes.get('/debug')
+async def debug_stats(request):
+    return web.json_response({
+        "status_board": {**status_board_refresher.stats(), 'pages': status_board_page_stats},
+        "display_names": display_names.stats(),
+        "status_history": status_history.stats(),
+        "status_expiry": status_expiry.stats(),
+        "api_cache": api_cache.stats(),
+        "slow_calls": slow_calls.entries(),
+        "mention_replies": {**mention_reply_stats, 'cooldowns_tracked': len(mention_reply_cooldowns)},
+        "rest": rest_scheduler.stats(),
+        "deletions": deletion_service.stats(),
+        "storage": {'backend': STORAGE_BACKEND, **state_store.stats()},
+        "suggestion_votes": {'votes_applied': vote_stats['applied'], 'edits_issued': suggestion_renders.stats()['sent'], **suggestion_message_refresher.stats()},
+        "suggestion_renders": suggestion_renders.stats(),
+        "suggestion_search": suggestion_search.stats(),
+        "suggestion_rankings": {'top': top_suggestions.stats(), 'trending': trending_suggestions.stats()},
+    })
 
 # --- Main Bot Execution ---
 async def main():
-    flask_thread = threading.Thread(target=run_flask, daemon=True)
-    flask_thread.start()
+    web_runner = await start_web_server()
+
+    await load_state_from_store()
+    state_store.start()
 
     try:
         discord_token = os.environ.get('DISCORD_BOT_TOKEN')
@@ -1023,6 +3792,9 @@ async def main():
         await bot.start(discord_token)
     except Exception as e:
         print(f"Error starting Discord bot: {e}")
+    finally:
+        await web_runner.cleanup()
+        await state_store.close()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -0,0 +1,107 @@
+# RedisStore against fakeredis (with Lua scripting via lupa).
+#
+#   uv run --group dev pytest
+import asyncio
+import os
+import sys
+
+import fakeredis
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+MESSAGE_ID_COLUMN = main.SUGGESTION_COLUMNS.index('message_id')
+
+def make_store(server=None, prefix='test'):
+    client = fakeredis.FakeAsyncRedis(server=server or fakeredis.FakeServer(), decode_responses=True)
+    return main.RedisStore(client, prefix, flush_interval=60)
+
+def suggestion_row(status='Pending'):
+    # A 64-bit snowflake, so a Lua round trip through cjson would lose precision
+    return {'author_id': 1, 'author_name': 'a', 'suggestion_text': 'more emotes', 'timestamp': '2024-01-01T00:00:00+00:00',
+            'status': status, 'message_id': 1234567890123456789}
+
+def test_toggle_vote_adds_switches_and_removes():
+    async def run():
+        store = make_store()
+        assert await store.toggle_vote(1, 10, 'upvote') == ('added', 1, 0)
+        assert await store.toggle_vote(1, 11, 'upvote') == ('added', 2, 0)
+        # Voting the other way moves the vote instead of counting it twice
+        assert await store.toggle_vote(1, 10, 'downvote') == ('added', 1, 1)
+        assert await store.toggle_vote(1, 10, 'downvote') == ('removed', 1, 0)
+        assert await store.redis.smembers('test:suggestion:1:up') == {'11'}
+        assert await store.redis.smembers('test:suggestion:1:down') == set()
+    asyncio.run(run())
+
+def test_next_index_skips_indexes_known_locally():
+    async def run():
+        store = make_store()
+        # Suggestions restored from history or moved over from SQLite never went through the counter
+        await store.raise_suggestion_counter(41)
+        assert await store.next_suggestion_index() == 42
+        assert await store.next_suggestion_index(100) == 101
+        # A lower floor never moves the counter back
+        await store.raise_suggestion_counter(5)
+        assert await store.next_suggestion_index(7) == 102
+    asyncio.run(run())
+
+def test_processes_share_the_counter():
+    async def run():
+        server = fakeredis.FakeServer()
+        first, second = make_store(server), make_store(server)
+        indexes = await asyncio.gather(*(store.next_suggestion_index(3) for store in (first, second) * 5))
+        assert sorted(indexes) == list(range(4, 14))
+    asyncio.run(run())
+
+def test_transition_only_succeeds_once():
+    async def run():
+        server = fakeredis.FakeServer()
+        first, second = make_store(server), make_store(server)
+        first.save_suggestion(7, suggestion_row())
+        await first.flush()
+        assert await first.transition_suggestion(7, 'Pending', 'Approved')
+        assert not await second.transition_suggestion(7, 'Pending', 'Rejected')
+        # A stale row flushed afterwards can't undo the transition
+        second.save_suggestion(7, suggestion_row('Pending'))
+        await second.flush()
+        row, _, _ = await second.fetch_suggestion(7)
+        assert row[main.RedisStore.STATUS_COLUMN] == 'Approved'
+        assert row[MESSAGE_ID_COLUMN] == 1234567890123456789
+        state = await first.load()
+        assert state['suggestions'][0][1 + main.RedisStore.STATUS_COLUMN] == 'Approved'
+    asyncio.run(run())
+
+def test_flushes_are_announced_to_other_processes():
+    async def run():
+        server = fakeredis.FakeServer()
+        writer, reader = make_store(server), make_store(server)
+        changes = asyncio.Queue()
+        reader.on_change = changes.put
+        reader.start()
+        await asyncio.sleep(0.1)  # Let the listener subscribe
+
+        writer.save_status(main.StatusRecord(5, 'Free', 1_700_000_000))
+        writer.save_suggestion(3, suggestion_row())
+        await writer.flush()
+        change = await asyncio.wait_for(changes.get(), 2)
+        assert change['statuses'] == [5] and change['suggestions'] == [3]
+        assert await reader.fetch_statuses([5]) == [(5, ['Free', main.StatusRecord(5, 'Free', 1_700_000_000).isoformat()])]
+
+        writer.set_meta('status_embed_message_ids', [11, 12])
+        await writer.flush()
+        change = await asyncio.wait_for(changes.get(), 2)
+        assert change['meta'] == ['status_embed_message_ids']
+        assert await reader.fetch_meta(['status_embed_message_ids']) == {'status_embed_message_ids': [11, 12]}
+
+        await writer.transition_suggestion(3, 'Pending', 'Approved')
+        change = await asyncio.wait_for(changes.get(), 2)
+        assert change['suggestions'] == [3]
+        # The reader's own flushes aren't echoed back to it
+        reader.delete_status(5)
+        await reader.flush()
+        await asyncio.sleep(0.1)
+        assert changes.empty()
+        await reader.close()
+        await writer.close()
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+# SQLiteStore against a database in a temporary directory.
+import asyncio
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+def test_statuses_reload_in_board_order(tmp_path):
+    path = str(tmp_path / 'state.db')
+
+    async def run():
+        store = main.SQLiteStore(path)
+        for user_id in (900, 5, 300):
+            store.save_status(main.StatusRecord(user_id, 'Free', 1_700_000_000))
+        await store.flush()
+        # Updating a status keeps the member where they are; a new member goes to the end
+        store.save_status(main.StatusRecord(900, 'Sleeping', 1_700_000_100))
+        store.save_status(main.StatusRecord(42, 'Outside', 1_700_000_100))
+        await store.close()
+
+        store = main.SQLiteStore(path)
+        state = await store.load()
+        await store.close()
+        return state
+
+    state = asyncio.run(run())
+    assert [row[0] for row in state['statuses']] == [900, 5, 300, 42]
+    assert state['statuses'][0][1] == 'Sleeping'
+
+def test_databases_without_positions_are_migrated(tmp_path):
+    path = str(tmp_path / 'state.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE statuses (user_id INTEGER PRIMARY KEY, status TEXT NOT NULL, timestamp TEXT NOT NULL)")
+    conn.execute("INSERT INTO statuses VALUES (7, 'Free', '2024-01-01T00:00:00+00:00')")
+    conn.commit()
+    conn.close()
+
+    async def run():
+        store = main.SQLiteStore(path)
+        store.save_status(main.StatusRecord(3, 'Free', 1_700_000_000))
+        await store.flush()
+        state = await store.load()
+        await store.close()
+        return state
+
+    assert [row[0] for row in asyncio.run(run())['statuses']] == [7, 3]